@@ -0,0 +1,249 @@
+"""
+Graph API stand-in: replays recorded fixtures for offline MetaManager benchmarks
+
+Record fixtures first by running the backend (or any script using MetaManager)
+against the real API with META_GRAPH_RECORD_DIR set. Then serve them:
+
+    python benchmarks/graph_standin.py --fixtures fixtures/graph --port 8765 \
+        --latency-ms 120 --jitter-ms 40 --error-rate 0.02 --buc-step 2
+
+and point the backend at it:
+
+    META_GRAPH_BASE_URL=http://127.0.0.1:8765/v21.0 uvicorn main:app
+
+Requests without a fixture get a Graph-style error, and If-None-Match
+matching a recorded ETag gets a 304. GET /__stats returns the request counters.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from typing import Dict, Optional
+
+from aiohttp import web
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from social.graph_fixtures import fixture_key
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_ERROR = {
+    'error': {
+        'message': 'An unexpected error has occurred. Please retry your request later.',
+        'type': 'OAuthException',
+        'code': 2,
+        'is_transient': True
+    }
+}
+
+RATE_LIMIT_ERROR = {
+    'error': {
+        'message': '(#17) User request limit reached - rate limit exceeded',
+        'type': 'OAuthException',
+        'code': 17,
+        'is_transient': True
+    }
+}
+
+
+class GraphStandIn:
+    """Serves recorded Graph responses with injected latency, errors and usage headers"""
+
+    def __init__(
+        self,
+        fixtures_dir: str,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        rate_limit_rate: float = 0,
+        buc_step: float = 0,
+        buc_window: float = 3600,
+        seed: int = 0
+    ):
+        """
+        Args:
+            fixtures_dir: Directory written by GraphFixtureRecorder
+            latency_ms: Added latency per request
+            jitter_ms: Uniform +/- jitter on top of latency_ms
+            error_rate: Share of requests answered with a transient 500
+            rate_limit_rate: Share of requests answered with a rate limit error
+            buc_step: Business use case usage percent added per request
+                      (0 keeps the recorded usage headers)
+            buc_window: Rolling window in seconds for the usage percentage
+            seed: Random seed, so error injection is reproducible
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.buc_step = buc_step
+        self.buc_window = buc_window
+        self.random = random.Random(seed)
+
+        self.fixtures = self._load(fixtures_dir)
+        self.stats = Counter()
+        self.paths = Counter()
+        self._calls_by_object: Dict[str, deque] = defaultdict(deque)
+
+    @staticmethod
+    def _load(fixtures_dir: str) -> Dict[str, Dict]:
+        fixtures = {}
+        for filename in sorted(os.listdir(fixtures_dir)):
+            if not filename.endswith('.json'):
+                continue
+            with open(os.path.join(fixtures_dir, filename)) as f:
+                fixture = json.load(f)
+            request = fixture['request']
+            fixtures[fixture_key(request['path'], request['params'])] = fixture
+        logger.info(f"Loaded {len(fixtures)} Graph fixtures from {fixtures_dir}")
+        return fixtures
+
+    def _usage_header(self, path: str) -> str:
+        """x-business-use-case-usage for the object the path belongs to"""
+        segments = [segment for segment in path.split('/') if segment]
+        if segments and segments[0].startswith('v') and '.' in segments[0]:
+            segments = segments[1:]
+        object_id = segments[0].replace('act_', '') if segments else 'app'
+
+        now = time.time()
+        calls = self._calls_by_object[object_id]
+        calls.append(now)
+        while calls and calls[0] < now - self.buc_window:
+            calls.popleft()
+
+        usage = min(100, int(len(calls) * self.buc_step))
+        return json.dumps({object_id: [{
+            'type': 'ads_insights' if 'insights' in path else 'ads_management',
+            'call_count': usage,
+            'total_cputime': usage,
+            'total_time': usage,
+            'estimated_time_to_regain_access': 0 if usage < 100 else 5
+        }]})
+
+    def _absolute_paging(self, body, origin: str):
+        """Paging URLs are recorded host-relative; point them back at this server"""
+        paging = body.get('paging') if isinstance(body, dict) else None
+        if not paging:
+            return body
+        body = copy.deepcopy(body)
+        for key in ('next', 'previous'):
+            if isinstance(body['paging'].get(key), str) and body['paging'][key].startswith('/'):
+                body['paging'][key] = origin + body['paging'][key]
+        return body
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.stats['requests'] += 1
+        self.paths[request.path] += 1
+
+        delay_ms = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        headers = {}
+        if self.buc_step:
+            headers['x-business-use-case-usage'] = self._usage_header(request.path)
+
+        draw = self.random.random()
+        if draw < self.error_rate:
+            self.stats['injected_errors'] += 1
+            return web.json_response(TRANSIENT_ERROR, status=500, headers=headers)
+        if draw < self.error_rate + self.rate_limit_rate:
+            self.stats['injected_rate_limits'] += 1
+            return web.json_response(RATE_LIMIT_ERROR, status=400, headers=headers)
+
+        key = fixture_key(request.path, dict(request.query))
+        fixture = self.fixtures.get(key)
+        if fixture is None:
+            self.stats['missing_fixtures'] += 1
+            logger.warning(f"No fixture for {key}")
+            return web.json_response({
+                'error': {
+                    'message': f"No recorded fixture for {key}",
+                    'type': 'GraphMethodException',
+                    'code': 100
+                }
+            }, status=404, headers=headers)
+
+        etag = fixture.get('headers', {}).get('etag')
+        if etag and request.headers.get('If-None-Match') == etag:
+            self.stats['not_modified'] += 1
+            return web.Response(status=304, headers={**headers, 'ETag': etag})
+
+        self.stats['served'] += 1
+        recorded_headers = {
+            name: value for name, value in fixture.get('headers', {}).items()
+            if name != 'content-type'
+        }
+        origin = f"{request.scheme}://{request.host}"
+        return web.json_response(
+            self._absolute_paging(fixture['body'], origin),
+            status=fixture.get('status', 200),
+            headers={**recorded_headers, **headers}
+        )
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, 'paths': dict(self.paths)})
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/__stats', self.handle_stats)
+        app.router.add_get('/{tail:.*}', self.handle)
+        return app
+
+    def start_in_thread(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Serve from a daemon thread (for in-process benchmarks); returns the origin URL"""
+        ready = threading.Event()
+        origin: Dict[str, Optional[str]] = {'url': None}
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            runner = web.AppRunner(self.make_app())
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, host, port)
+            loop.run_until_complete(site.start())
+            bound_port = site._server.sockets[0].getsockname()[1]
+            origin['url'] = f"http://{host}:{bound_port}"
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        ready.wait()
+        return origin['url']
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', required=True)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0)
+    parser.add_argument('--buc-step', type=float, default=0)
+    parser.add_argument('--buc-window', type=float, default=3600)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    standin = GraphStandIn(
+        args.fixtures,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        buc_step=args.buc_step,
+        buc_window=args.buc_window,
+        seed=args.seed
+    )
+    web.run_app(standin.make_app(), host=args.host, port=args.port)
@@ -0,0 +1,76 @@
+"""
+Benchmark: MetaManager methods against recorded Graph fixtures, fully offline
+
+Starts the Graph stand-in in-process, points MetaManager at it and calls one
+manager method repeatedly, reporting wall time and how many Graph requests
+each call needed.
+
+Usage:
+    python benchmarks/meta_graph_replay.py --fixtures fixtures/graph \
+        --method get_campaigns_list --args act_123 [--repeat 5] [--latency-ms 120]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.graph_standin import GraphStandIn
+from social.meta_manager import MetaManager
+
+
+def run(args):
+    standin = GraphStandIn(
+        args.fixtures,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        buc_step=args.buc_step,
+        seed=args.seed
+    )
+    origin = standin.start_in_thread()
+
+    # The token is scrubbed from fixtures, so any value works
+    manager = MetaManager('benchmark@example.com', auth_manager=None, access_token='replay')
+    manager.BASE_URL = f"{origin}/{MetaManager.GRAPH_API_VERSION}"
+    if args.no_delay:
+        manager.RATE_LIMIT_DELAY = 0
+    method = getattr(manager, args.method)
+
+    for attempt in range(1, args.repeat + 1):
+        before = standin.stats['requests']
+        start = time.perf_counter()
+        try:
+            method(*args.args)
+            outcome = 'ok'
+        except Exception as e:
+            outcome = f"error: {e}"
+        elapsed = time.perf_counter() - start
+        print(f"call {attempt}: {elapsed * 1000:8.1f} ms  graph requests={standin.stats['requests'] - before:4d}  {outcome}")
+
+    print(f"stand-in stats: {dict(standin.stats)}")
+    print(f"etag stats    : {manager.etag_stats()}")
+    manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', required=True)
+    parser.add_argument('--method', required=True, help="MetaManager method name")
+    parser.add_argument('--args', nargs='*', default=[], help="Positional string arguments")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0)
+    parser.add_argument('--buc-step', type=float, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-delay', action='store_true', help="Disable the client-side request spacing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    run(args)
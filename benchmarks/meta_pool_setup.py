@@ -0,0 +1,72 @@
+"""
+Benchmark: per-request Meta client setup cost, fresh MetaManager vs pooled
+
+Runs offline. A stub AuthManager holds many Facebook sessions keyed by
+Facebook ID (the layout that forces get_facebook_access_token into its linear
+scan), and each "request" either builds a new MetaManager or asks the pool.
+
+Usage:
+    python benchmarks/meta_pool_setup.py [--sessions 500] [--requests 2000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth.auth_manager import AuthManager
+from social.meta_manager import MetaManager
+from social.meta_pool import MetaManagerPool
+
+
+class StubAuthManager:
+    """Only the parts of AuthManager that MetaManager needs"""
+
+    get_facebook_access_token = AuthManager.get_facebook_access_token
+
+    def __init__(self, session_count: int):
+        self.facebook_sessions = {
+            f"facebook_{i}": {
+                'access_token': f"token-{i}",
+                'user_email': f"user{i}@example.com"
+            }
+            for i in range(session_count)
+        }
+
+
+def run(session_count: int, request_count: int):
+    auth_manager = StubAuthManager(session_count)
+    # The last session is the worst case for the linear scan
+    user_email = f"user{session_count - 1}@example.com"
+
+    start = time.perf_counter()
+    for _ in range(request_count):
+        manager = MetaManager(user_email, auth_manager)
+        manager.close()
+    fresh_elapsed = time.perf_counter() - start
+
+    pool = MetaManagerPool(auth_manager)
+    start = time.perf_counter()
+    for _ in range(request_count):
+        pool.get(user_email)
+    pooled_elapsed = time.perf_counter() - start
+
+    print(f"sessions={session_count} requests={request_count}")
+    print(f"fresh MetaManager : {fresh_elapsed / request_count * 1e6:9.1f} us/request")
+    print(f"pooled MetaManager: {pooled_elapsed / request_count * 1e6:9.1f} us/request")
+    print(f"pool stats        : {pool.stats()}")
+    pool.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    # Token lookup logs at INFO on every call; keep the output readable
+    logging.basicConfig(level=logging.WARNING)
+    run(args.sessions, args.requests)
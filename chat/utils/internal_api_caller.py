@@ -8,6 +8,8 @@ import logging
 from datetime import datetime
 from typing import Any, Dict
 
+from google_analytics.quota_scheduler import CHAT, ga4_priority
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,6 +149,21 @@ async def call_internal_endpoint(
     method: str,
     params: Dict[str, Any],
     current_user: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Call a main.py endpoint on behalf of a chat agent. GA4 calls made by it
+    run at chat priority, behind interactive dashboard requests.
+    """
+    with ga4_priority(CHAT):
+        return await _dispatch_internal_endpoint(endpoint_name, endpoint_path, method, params, current_user)
+
+
+async def _dispatch_internal_endpoint(
+    endpoint_name: str,
+    endpoint_path: str,
+    method: str,
+    params: Dict[str, Any],
+    current_user: Dict[str, Any],
 ) -> Dict[str, Any]:
     """
     Dispatch to the exact function defined in main.py based on the FastAPI path.
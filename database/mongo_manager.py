@@ -1,5 +1,7 @@
 import motor.motor_asyncio
+import pymongo
 import os
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 import logging
@@ -34,6 +36,10 @@ class MongoManager:
             self.db = self.client.internal_dashboard
             logger.info("MongoDB client initialized with connection pooling")
 
+            # Blocking client for the synchronous managers, created on first use
+            self._sync_client = None
+            self._sync_lock = threading.Lock()
+
         except Exception as e:
             logger.error(f"Failed to initialize MongoDB client: {str(e)}")
             raise ConnectionError(f"Failed to connect to MongoDB: {str(e)}")
@@ -49,12 +55,36 @@ class MongoManager:
             logger.error(f"Failed to connect to MongoDB: {str(e)}")
             raise ConnectionError(f"Failed to verify MongoDB connection: {str(e)}")
 
+    def get_sync_db(self):
+        """
+        Blocking (pymongo) handle on the same database, for the synchronous
+        platform managers that run inside request handlers.
+        """
+        with self._sync_lock:
+            if self._sync_client is None:
+                self._sync_client = pymongo.MongoClient(
+                    self.connection_string,
+                    serverSelectionTimeoutMS=3000,
+                    connectTimeoutMS=5000,
+                    socketTimeoutMS=10000,
+                    maxPoolSize=20,
+                    maxIdleTimeMS=30000,
+                    retryWrites=True,
+                    retryReads=True,
+                    waitQueueTimeoutMS=3000,
+                )
+                logger.info("Synchronous MongoDB client initialized")
+            return self._sync_client.internal_dashboard
+
     async def close(self):
         """Close MongoDB connection - called during FastAPI shutdown"""
         try:
             if self.client:
                 self.client.close()
                 logger.info("MongoDB connection closed")
+            if self._sync_client:
+                self._sync_client.close()
+                self._sync_client = None
         except Exception as e:
             logger.error(f"Error closing MongoDB connection: {str(e)}")
 
@@ -1,5 +1,6 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from fastapi import HTTPException
@@ -581,17 +582,67 @@ class GoogleAdsManager:
             logger.error(f"Unexpected error getting keyword ideas: {e}")
             raise HTTPException(status_code=500, detail="An unexpected error occurred while fetching keyword ideas")
         
+    # Concurrent customer queries in get_customers_cost_and_currency
+    COST_QUERY_WORKERS = 10
+
+    def get_customer_cost_and_currency(self, customer_id: str, period: str, start_date: str = None,
+                                       end_date: str = None, googleads_service=None) -> Dict[str, Any]:
+        """Total spend and currency of a customer, aggregated by Google Ads in one customer-level query"""
+        googleads_service = googleads_service or self.client.get_service("GoogleAdsService")
+        date_filter = self._get_date_filter(period, start_date, end_date)
+        query = f"""
+            SELECT
+                customer.currency_code,
+                metrics.cost_micros
+            FROM customer
+            WHERE {date_filter}
+        """
+        
+        cost_micros = 0
+        currency = None
+        for row in googleads_service.search(customer_id=customer_id, query=query):
+            cost_micros += row.metrics.cost_micros
+            currency = row.customer.currency_code
+        
+        if currency is None:
+            # A customer without spend in the period returns no rows
+            currency = self.get_customer_info(customer_id).get('currency', 'USD')
+        
+        return {
+            'customer_id': customer_id,
+            'cost': cost_micros / 1_000_000,
+            'currency': currency
+        }
+
+    def get_customers_cost_and_currency(self, customer_ids: List[str], period: str,
+                                        start_date: str = None, end_date: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Spend and currency of several customers, queried concurrently over one
+        shared GoogleAdsService. A customer whose query fails maps to a dict
+        with an 'error' entry instead of failing the others.
+        """
+        if not customer_ids:
+            return {}
+        googleads_service = self.client.get_service("GoogleAdsService")
+        
+        def fetch(customer_id: str) -> Dict[str, Any]:
+            try:
+                return self.get_customer_cost_and_currency(customer_id, period, start_date, end_date, googleads_service)
+            except GoogleAdsException as ex:
+                logger.warning(f"Google Ads API error getting cost for customer {customer_id}: {ex}")
+                return {'customer_id': customer_id, 'error': ex.error.message if ex.error else str(ex)}
+            except Exception as e:
+                logger.warning(f"Error getting cost for customer {customer_id}: {e}")
+                return {'customer_id': customer_id, 'error': str(e)}
+        
+        with ThreadPoolExecutor(max_workers=min(self.COST_QUERY_WORKERS, len(customer_ids))) as executor:
+            return dict(zip(customer_ids, executor.map(fetch, customer_ids)))
+
     def get_total_cost_for_period(self, customer_id: str, period: str, 
                                  start_date: str = None, end_date: str = None) -> float:
         """Get total ad spend for a specific period"""
         try:
-            # Use existing method to get campaigns with costs
-            campaigns = self.get_campaigns_with_period(customer_id, period, start_date, end_date)
-            
-            # Sum up all campaign costs
-            total_cost = sum(campaign.get('cost', 0) for campaign in campaigns)
-            
-            return total_cost
+            return self.get_customer_cost_and_currency(customer_id, period, start_date, end_date)['cost']
             
         except Exception as e:
             logger.error(f"Error fetching total ad cost for customer {customer_id}: {e}")
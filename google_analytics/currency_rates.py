@@ -0,0 +1,148 @@
+"""
+Currency Rates - process-wide USD exchange rate cache with background refresh
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class CurrencyRateCache:
+    """
+    USD exchange rates shared by every GA4Manager in the process.
+
+    Rates are fetched from exchangerate-api.com (which publishes once a day),
+    kept in memory and written to Mongo with their fetch time, so a restarted
+    process serves the last known rates immediately. A daemon thread refreshes
+    them every REFRESH_INTERVAL; requests never wait on the rates API unless
+    no rates have ever been stored.
+    """
+
+    RATES_URL = "https://api.exchangerate-api.com/v4/latest/USD"
+    COLLECTION = "currency_rates"
+    DOCUMENT_ID = "USD"
+
+    # The provider updates daily; a few refreshes a day keep rates current
+    REFRESH_INTERVAL = 6 * 3600
+    # Wait before retrying after a failed refresh
+    RETRY_INTERVAL = 300
+    REQUEST_TIMEOUT = 10
+
+    def __init__(self):
+        self._rates: Optional[Dict[str, float]] = None
+        self._fetched_at: Optional[datetime] = None
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._refresher: Optional[threading.Thread] = None
+
+    def get_rates(self, fallback: Callable[[], Dict[str, float]]) -> Dict[str, float]:
+        """
+        Current rates (1 USD = X currency).
+
+        Args:
+            fallback: Returns approximate rates; used only while no fetched
+                      rates exist in memory or in Mongo
+        """
+        self.start()
+        rates = self._rates
+        if rates is not None:
+            return rates
+
+        with self._lock:
+            if self._rates is None and not self._loaded:
+                self._load_persisted()
+            if self._rates is None and time.time() - self._failed_at >= self.RETRY_INTERVAL:
+                # Cold start with nothing stored: one blocking fetch
+                self._fetch()
+            if self._rates is not None:
+                return self._rates
+
+        logger.warning("No currency rates available, using fallback rates")
+        return fallback()
+
+    def info(self) -> Dict:
+        """Age of the cached rates, for monitoring"""
+        return {
+            'cached': self._rates is not None,
+            'fetched_at': self._fetched_at.isoformat() if self._fetched_at else None,
+            'currencies': len(self._rates or {})
+        }
+
+    def start(self):
+        """Start the background refresher (idempotent; also started on first use)"""
+        if self._refresher is not None:
+            return
+        with self._lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(target=self._refresh_loop, name="currency-rates-refresh", daemon=True)
+                self._refresher.start()
+
+    def _refresh_loop(self):
+        with self._lock:
+            if not self._loaded:
+                self._load_persisted()
+
+        while True:
+            age = (datetime.utcnow() - self._fetched_at).total_seconds() if self._fetched_at else None
+            if age is None or age >= self.REFRESH_INTERVAL:
+                with self._lock:
+                    refreshed = self._fetch()
+                wait = self.REFRESH_INTERVAL if refreshed else self.RETRY_INTERVAL
+            else:
+                wait = self.REFRESH_INTERVAL - age
+            time.sleep(max(wait, 1))
+
+    def _fetch(self) -> bool:
+        """Fetch rates from the API and persist them (caller holds the lock)"""
+        try:
+            response = requests.get(self.RATES_URL, timeout=self.REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                raise ValueError(f"rates API returned {response.status_code}")
+            rates = response.json().get('rates', {})
+            if not rates:
+                raise ValueError("rates API returned no rates")
+        except Exception as e:
+            logger.warning(f"Failed to fetch currency rates: {e}")
+            self._failed_at = time.time()
+            return False
+
+        self._rates = rates
+        self._fetched_at = datetime.utcnow()
+        logger.info(f"💱 Currency rates refreshed ({len(rates)} currencies)")
+        self._persist()
+        return True
+
+    def _load_persisted(self):
+        """Warm the cache from Mongo (caller holds the lock)"""
+        self._loaded = True
+        try:
+            from database.mongo_manager import mongo_manager
+            doc = mongo_manager.get_sync_db()[self.COLLECTION].find_one({'_id': self.DOCUMENT_ID})
+        except Exception as e:
+            logger.warning(f"Could not load stored currency rates: {e}")
+            return
+        if doc and doc.get('rates') and self._rates is None:
+            self._rates = doc['rates']
+            self._fetched_at = doc.get('fetched_at')
+            logger.info(f"💱 Loaded stored currency rates from {self._fetched_at}")
+
+    def _persist(self):
+        try:
+            from database.mongo_manager import mongo_manager
+            mongo_manager.get_sync_db()[self.COLLECTION].update_one(
+                {'_id': self.DOCUMENT_ID},
+                {'$set': {'rates': self._rates, 'fetched_at': self._fetched_at}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Could not store currency rates: {e}")
+
+
+currency_rate_cache = CurrencyRateCache()
@@ -0,0 +1,154 @@
+"""
+GA4 Admin Services - cached Analytics Admin API service objects
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+
+from fastapi import HTTPException
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+logger = logging.getLogger(__name__)
+
+ADMIN_API = 'analyticsadmin'
+ADMIN_API_VERSION = 'v1alpha'
+
+_documents: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_documents_lock = threading.Lock()
+
+
+def get_discovery_document(service_name: str, version: str) -> Dict[str, Any]:
+    """
+    Parsed discovery document from the copy bundled with googleapiclient,
+    loaded once per process. Returns None when the version is not bundled.
+    """
+    key = (service_name, version)
+    with _documents_lock:
+        if key not in _documents:
+            content = get_static_doc(service_name, version)
+            if content is None:
+                logger.warning(f"No bundled discovery document for {service_name} {version}")
+                _documents[key] = None
+            else:
+                _documents[key] = json.loads(content)
+        return _documents[key]
+
+
+class AdminServiceCache:
+    """
+    Per-user cache of Analytics Admin API service objects.
+
+    build('analyticsadmin', ...) parses the discovery document and sets up a
+    fresh authorized HTTP object on every call. Here the document is parsed
+    once and service objects are reused for as long as the user's grant stays
+    the same. httplib2 connections are not thread-safe, so each worker thread
+    gets its own service object; the Credentials object behind them is shared
+    per user.
+    """
+
+    def __init__(self, auth_manager, max_size: int = 500, idle_timeout: float = 1800):
+        """
+        Args:
+            auth_manager: AuthManager holding the users' Google credentials
+            max_size: Maximum number of (user, thread) service objects kept
+            idle_timeout: Seconds after which an unused service object is dropped
+        """
+        self.auth_manager = auth_manager
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._credentials: Dict[str, Dict[str, Any]] = {}
+        self._services: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'builds': 0,
+            'credential_builds': 0,
+            'idle_evictions': 0,
+            'capacity_evictions': 0
+        }
+
+    def get(self, user_email: str):
+        """Admin API service object for a user, usable from the calling thread"""
+        credentials, grant = self._user_credentials(user_email)
+        key = (user_email, grant, threading.get_ident())
+        now = time.time()
+
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._services.get(key)
+            if entry:
+                self._services.move_to_end(key)
+                entry['last_used'] = now
+                self._stats['hits'] += 1
+                return entry['service']
+
+        document = get_discovery_document(ADMIN_API, ADMIN_API_VERSION)
+        if document is not None:
+            service = build_from_document(document, credentials=credentials)
+        else:
+            service = build(ADMIN_API, ADMIN_API_VERSION, credentials=credentials, cache_discovery=False)
+
+        with self._lock:
+            self._stats['builds'] += 1
+            self._services[key] = {'service': service, 'last_used': now}
+            while len(self._services) > self.max_size:
+                self._services.popitem(last=False)
+                self._stats['capacity_evictions'] += 1
+
+        return service
+
+    def evict(self, user_email: str):
+        """Drop a user's credentials and service objects, e.g. after logout"""
+        with self._lock:
+            self._credentials.pop(user_email, None)
+            for key in [key for key in self._services if key[0] == user_email]:
+                del self._services[key]
+
+    def clear(self):
+        """Drop every cached service object"""
+        with self._lock:
+            self._credentials.clear()
+            self._services.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring and benchmarks"""
+        with self._lock:
+            return {**self._stats, 'size': len(self._services), 'users': len(self._credentials)}
+
+    def _user_credentials(self, user_email: str):
+        """Credentials shared by a user's service objects, rebuilt when the grant changes"""
+        session = self.auth_manager.user_sessions.get(user_email)
+        if not session or not session.get('credentials'):
+            self.evict(user_email)
+            raise HTTPException(status_code=401, detail="Google user not authenticated")
+        creds_data = session['credentials']
+        grant = (creds_data.get('refresh_token'), creds_data.get('client_id'))
+
+        with self._lock:
+            cached = self._credentials.get(user_email)
+            if cached and cached['grant'] == grant:
+                return cached['credentials'], grant
+
+        credentials = self.auth_manager.get_user_credentials(user_email)
+        with self._lock:
+            # Service objects of a previous grant hold stale credentials
+            for key in [key for key in self._services if key[0] == user_email and key[1] != grant]:
+                del self._services[key]
+            self._credentials[user_email] = {'credentials': credentials, 'grant': grant}
+            self._stats['credential_builds'] += 1
+        return credentials, grant
+
+    def _evict_idle(self, now: float):
+        """Drop service objects unused for longer than idle_timeout (caller holds the lock)"""
+        while self._services:
+            oldest_key, oldest_entry = next(iter(self._services.items()))
+            if now - oldest_entry['last_used'] < self.idle_timeout:
+                break
+            del self._services[oldest_key]
+            self._stats['idle_evictions'] += 1
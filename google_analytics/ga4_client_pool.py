@@ -0,0 +1,185 @@
+"""
+GA4 Client Pool - per-user registry of long-lived GA4 Data API clients
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+
+from fastapi import HTTPException
+from google.analytics.data_v1beta import BetaAnalyticsDataClient
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+logger = logging.getLogger(__name__)
+
+
+class GA4ClientPool:
+    """
+    Bounded, per-user pool of BetaAnalyticsDataClient instances.
+
+    Every GA4 route builds a new GA4Manager; without the pool each one opened
+    its own gRPC channel (TLS handshake included) and rebuilt Credentials from
+    the stored session. Here each user keeps one client, and therefore one
+    channel, shared by all requests and threads. The pooled Credentials object
+    is refreshed in place when its token expires, so the channel survives token
+    rotation; the client is only rebuilt when the user re-authenticates with a
+    different grant.
+
+    The generated client binds credentials to the channel, so a channel cannot
+    be shared between users - one channel per user is the sharing the library
+    allows.
+    """
+
+    def __init__(self, auth_manager, max_size: int = 200, idle_timeout: float = 1800):
+        """
+        Args:
+            auth_manager: AuthManager holding the users' Google credentials
+            max_size: Maximum number of users kept in the pool
+            idle_timeout: Seconds after which an unused client is closed
+        """
+        self.auth_manager = auth_manager
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'builds': 0,
+            'credential_refreshes': 0,
+            'grant_rebuilds': 0,
+            'idle_evictions': 0,
+            'capacity_evictions': 0
+        }
+
+    def get(self, user_email: str) -> BetaAnalyticsDataClient:
+        """Return the pooled client for a user, building it if needed"""
+        creds_data = self._stored_credentials(user_email)
+        grant = self._grant_key(creds_data)
+
+        with self._lock:
+            self._evict_idle(time.time())
+            entry = self._entries.get(user_email)
+            if entry and entry['grant'] != grant:
+                logger.info(f"Google grant changed for {user_email}, rebuilding GA4 client")
+                self._remove(user_email)
+                self._stats['grant_rebuilds'] += 1
+                entry = None
+            if entry:
+                self._entries.move_to_end(user_email)
+                entry['last_used'] = time.time()
+                self._stats['hits'] += 1
+            build_lock = self._build_locks.setdefault(user_email, threading.Lock())
+
+        if entry:
+            with build_lock:
+                self._refresh(user_email, entry['credentials'], creds_data)
+            return entry['client']
+
+        with build_lock:
+            with self._lock:
+                existing = self._entries.get(user_email)
+                if existing and existing['grant'] == grant:
+                    # Another request built it while this one waited
+                    self._stats['hits'] += 1
+                    return existing['client']
+
+            credentials = Credentials.from_authorized_user_info(creds_data)
+            self._refresh(user_email, credentials, creds_data)
+            client = BetaAnalyticsDataClient(credentials=credentials)
+            logger.info(f"GA4 client created for {user_email}")
+
+            with self._lock:
+                self._stats['misses'] += 1
+                self._stats['builds'] += 1
+                now = time.time()
+                self._entries[user_email] = {
+                    'client': client,
+                    'credentials': credentials,
+                    'grant': grant,
+                    'last_used': now
+                }
+                while len(self._entries) > self.max_size:
+                    oldest_email = next(iter(self._entries))
+                    self._remove(oldest_email)
+                    self._stats['capacity_evictions'] += 1
+
+        return client
+
+    def evict(self, user_email: str):
+        """Drop a user's client, e.g. after logout or re-authentication"""
+        with self._lock:
+            self._remove(user_email)
+
+    def clear(self):
+        """Close every pooled client"""
+        with self._lock:
+            for user_email in list(self._entries):
+                self._remove(user_email)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counters for monitoring and benchmarks"""
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries), 'max_size': self.max_size}
+
+    def _stored_credentials(self, user_email: str) -> Dict[str, Any]:
+        session = self.auth_manager.user_sessions.get(user_email)
+        if not session or not session.get('credentials'):
+            self.evict(user_email)
+            raise HTTPException(status_code=401, detail="Google user not authenticated")
+        return session['credentials']
+
+    @staticmethod
+    def _grant_key(creds_data: Dict[str, Any]) -> Tuple:
+        """What identifies a grant; a change means the user re-authenticated"""
+        return (
+            creds_data.get('refresh_token'),
+            creds_data.get('client_id'),
+            tuple(creds_data.get('scopes') or ())
+        )
+
+    def _refresh(self, user_email: str, credentials: Credentials, creds_data: Dict[str, Any]):
+        """
+        Refresh the pooled credentials in place when expired, writing the new
+        token back like AuthManager.get_user_credentials does. Stored sessions
+        carry no expiry, so a fresh client refreshes once to learn it; after
+        that only a real expiry triggers a refresh and the channel is kept.
+        """
+        if not credentials.refresh_token:
+            return
+        if credentials.expiry is not None and not credentials.expired:
+            return
+
+        try:
+            credentials.refresh(Request())
+        except Exception as e:
+            logger.error(f"Failed to refresh Google credentials: {e}")
+            self.evict(user_email)
+            raise HTTPException(status_code=401, detail="Failed to refresh authentication")
+        creds_data['token'] = credentials.token
+        with self._lock:
+            self._stats['credential_refreshes'] += 1
+        logger.info(f"Refreshed Google credentials for {user_email}")
+
+    def _evict_idle(self, now: float):
+        """Close clients unused for longer than idle_timeout (caller holds the lock)"""
+        while self._entries:
+            oldest_email, oldest_entry = next(iter(self._entries.items()))
+            if now - oldest_entry['last_used'] < self.idle_timeout:
+                break
+            self._remove(oldest_email)
+            self._stats['idle_evictions'] += 1
+
+    def _remove(self, user_email: str):
+        """Remove and close a pooled client (caller holds the lock)"""
+        entry = self._entries.pop(user_email, None)
+        if entry:
+            try:
+                entry['client'].transport.close()
+            except Exception as e:
+                logger.warning(f"Error closing GA4 client for {user_email}: {e}")
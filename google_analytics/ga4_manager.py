@@ -4,9 +4,10 @@ Handles all GA4 API operations
 """
 import os
 import logging
-import requests
 import openai
 import json
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from typing import List, Dict, Any, Optional
@@ -14,14 +15,22 @@ from fastapi import HTTPException
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
     RunReportRequest,
+    RunReportResponse,
     DateRange,
     Dimension,
     Metric,
-    OrderBy
+    OrderBy,
+    Filter,
+    FilterExpression
 )
-from googleapiclient.discovery import build
 
 from google_ads.ads_manager import GoogleAdsManager
+from google_analytics.currency_rates import currency_rate_cache
+from google_analytics.property_metadata import property_metadata_cache
+from google_analytics.geocoder import geocoder
+from google_analytics.quota_scheduler import ScheduledGA4Client, ga4_quota_scheduler
+from google_analytics.report_columns import ReportColumns, percent_of, pivot_sum, safe_divide, to_records
+from google_analytics.report_cube import report_cube
 
 logger = logging.getLogger(__name__)
 
@@ -39,18 +48,25 @@ class GA4Manager:
     
     @property
     def client(self) -> BetaAnalyticsDataClient:
-        """Get or create GA4 client"""
+        """Get the user's pooled GA4 client, scheduled against the property quota"""
         if not self._client:
             try:
-                credentials = self.auth_manager.get_user_credentials(self.user_email)
-                self._client = BetaAnalyticsDataClient(credentials=credentials)
-                logger.info(f"GA4 client created for {self.user_email}")
+                from main import ga4_client_pool
+                self._client = ScheduledGA4Client(ga4_client_pool.get(self.user_email), ga4_quota_scheduler)
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Failed to create GA4 client: {e}")
                 raise HTTPException(status_code=500, detail=f"GA4 API client initialization error: {str(e)}")
         
         return self._client
     
+    @property
+    def admin_service(self):
+        """Get the user's cached Analytics Admin API service"""
+        from main import ga4_admin_services
+        return ga4_admin_services.get(self.user_email)
+    
     def get_date_range(self, period: str, start_date: str = None, end_date: str = None):
         """Get date range based on period or custom dates"""
         # Handle custom date range
@@ -94,10 +110,10 @@ class GA4Manager:
     def get_user_properties(self) -> List[Dict[str, Any]]:
         """Get all GA4 properties the user has access to"""
         try:
-            credentials = self.auth_manager.get_user_credentials(self.user_email)
-            admin_service = build('analyticsadmin', 'v1alpha', credentials=credentials)
+            admin_service = self.admin_service
             
             all_properties = []
+            listed_metadata = {}
             
             try:
                 # Direct properties list
@@ -113,6 +129,7 @@ class GA4Manager:
                         'displayName': property_display_name,
                         'websiteUrl': prop.get('websiteUrl', '')
                     })
+                    listed_metadata[property_id] = self._property_info_from_resource(property_id, prop)
                     
             except Exception as direct_error:
                 logger.warning(f"Direct properties list failed: {direct_error}")
@@ -141,6 +158,7 @@ class GA4Manager:
                                     'displayName': property_display_name,
                                     'websiteUrl': prop.get('websiteUrl', '')
                                 })
+                                listed_metadata[property_id] = self._property_info_from_resource(property_id, prop)
                                 
                         except Exception as account_error:
                             logger.warning(f"Could not access properties for account: {account_error}")
@@ -149,6 +167,9 @@ class GA4Manager:
                 except Exception as fallback_error:
                     logger.error(f"Account-based approach also failed: {fallback_error}")
             
+            # properties.list returns currency and time zone too - cache them for the revenue endpoints
+            property_metadata_cache.put_many(listed_metadata)
+            
             logger.info(f"Found {len(all_properties)} accessible properties for {self.user_email}")
             return all_properties
             
@@ -156,46 +177,115 @@ class GA4Manager:
             logger.error(f"Error fetching properties: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to fetch properties: {str(e)}")
     
+    # Metrics behind the KPI cards, in the order get_metrics reads them
+    KPI_METRICS = [
+        "totalUsers",
+        "sessions",
+        "engagedSessions",
+        "engagementRate",
+        "userEngagementDuration",
+        "bounceRate",
+        "screenPageViewsPerSession",
+    ]
+
+    # Names of the two date ranges in a comparison request (values of the dateRange dimension)
+    CURRENT_RANGE = "current"
+    PREVIOUS_RANGE = "previous"
+
+    def get_previous_date_range(self, start_date_str: str, end_date_str: str) -> tuple:
+        """Date range of the same length that ends the day before start_date_str"""
+        start = datetime.strptime(start_date_str, '%Y-%m-%d')
+        end = datetime.strptime(end_date_str, '%Y-%m-%d')
+        previous_end = start - timedelta(days=1)
+        previous_start = previous_end - (end - start)
+        return previous_start.strftime("%Y-%m-%d"), previous_end.strftime("%Y-%m-%d")
+
+    def with_previous_period(self, request: RunReportRequest) -> RunReportRequest:
+        """
+        Turn a single-range report request into a comparison request.
+
+        The preceding period of equal length is added as a second date range,
+        so one run_report call returns both periods; rows then carry a
+        dateRange dimension valued CURRENT_RANGE or PREVIOUS_RANGE.
+        """
+        current = request.date_ranges[0]
+        previous_start, previous_end = self.get_previous_date_range(current.start_date, current.end_date)
+        request.date_ranges = [
+            DateRange(start_date=current.start_date, end_date=current.end_date, name=self.CURRENT_RANGE),
+            DateRange(start_date=previous_start, end_date=previous_end, name=self.PREVIOUS_RANGE)
+        ]
+        return request
+
+    def split_rows_by_date_range(self, response) -> Dict[str, list]:
+        """Group the rows of a comparison response by their dateRange value"""
+        headers = [header.name for header in response.dimension_headers]
+        grouped = {self.CURRENT_RANGE: [], self.PREVIOUS_RANGE: []}
+        if 'dateRange' not in headers:
+            grouped[self.CURRENT_RANGE] = list(response.rows)
+            return grouped
+        
+        range_index = headers.index('dateRange')
+        for row in response.rows:
+            grouped.setdefault(row.dimension_values[range_index].value, []).append(row)
+        return grouped
+
+    def get_metric_values_by_date_range(self, response) -> Dict[str, Dict[str, float]]:
+        """
+        Metric values per date range of a comparison report without other
+        dimensions (one row per range; a range with no data reads as zeros).
+        """
+        metric_names = [header.name for header in response.metric_headers]
+        values = {}
+        for range_name, rows in self.split_rows_by_date_range(response).items():
+            metric_values = rows[0].metric_values if rows else []
+            values[range_name] = {
+                name: self.safe_float(metric_values[index].value) if index < len(metric_values) else 0.0
+                for index, name in enumerate(metric_names)
+            }
+        return values
+
+    def calculate_metric_changes(self, current: Dict[str, float], previous: Dict[str, float]) -> Dict[str, float]:
+        """Percentage change of every metric in current against previous"""
+        return {
+            name: self.calculate_percentage_change(value, previous.get(name, 0))
+            for name, value in current.items()
+        }
+
+    def format_percentage_change(self, change: float) -> str:
+        return f"{'+' if change > 0 else ''}{change:.1f}%"
+
     def get_metrics(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None) -> Dict[str, Any]:
         """Get GA4 metrics for a specific property with dashboard insights"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
             
-            request = RunReportRequest(
+            # Current and previous period in a single report
+            request = self.with_previous_period(RunReportRequest(
                 property=f"properties/{property_id}",
                 date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                metrics=[
-                    Metric(name="totalUsers"),
-                    Metric(name="sessions"),
-                    Metric(name="engagedSessions"),
-                    Metric(name="engagementRate"),
-                    Metric(name="userEngagementDuration"),
-                    Metric(name="bounceRate"),
-                    Metric(name="screenPageViewsPerSession"),
-                ],
-            )
+                metrics=[Metric(name=name) for name in self.KPI_METRICS],
+            ))
             
             response = self.client.run_report(request=request)
+            values = self.get_metric_values_by_date_range(response)
+            current_values = values[self.CURRENT_RANGE]
             
-            if response.rows:
-                row = response.rows[0]
-                metrics = row.metric_values
-                
+            if self.split_rows_by_date_range(response)[self.CURRENT_RANGE]:
                 # Basic calculations
-                total_users = self.safe_int(metrics[0].value)
-                sessions = self.safe_int(metrics[1].value)
-                engaged_sessions = self.safe_int(metrics[2].value)
-                engagement_rate = self.safe_float(metrics[3].value) * 100
-                total_duration = self.safe_float(metrics[4].value)
+                total_users = self.safe_int(current_values['totalUsers'])
+                sessions = self.safe_int(current_values['sessions'])
+                engaged_sessions = self.safe_int(current_values['engagedSessions'])
+                engagement_rate = current_values['engagementRate'] * 100
+                total_duration = current_values['userEngagementDuration']
                 avg_session_duration = total_duration / sessions if sessions > 0 else 0
-                bounce_rate = self.safe_float(metrics[5].value) * 100
-                pages_per_session = self.safe_float(metrics[6].value)
+                bounce_rate = current_values['bounceRate'] * 100
+                pages_per_session = current_values['screenPageViewsPerSession']
                 
-                # Get previous period data for comparison
-                previous_metrics = self.get_previous_period_metrics(property_id, period)
+                # Period-over-period change for every metric
+                metric_changes = self.calculate_metric_changes(current_values, values[self.PREVIOUS_RANGE])
                 
                 # Calculate additional insights
-                user_change = self.calculate_percentage_change(total_users, previous_metrics.get('totalUsers', 0))
+                user_change = metric_changes['totalUsers']
                 sessions_per_user = round(sessions / total_users, 1) if total_users > 0 else 0
                 engaged_percentage = round((engaged_sessions / sessions) * 100) if sessions > 0 else 0
                 engagement_status = self.get_engagement_status(engagement_rate)
@@ -217,7 +307,7 @@ class GA4Manager:
                     'bounceRate': round(bounce_rate, 2),
                     'pagesPerSession': round(pages_per_session, 2),
                     # Additional 9 calculated insights
-                    'totalUsersChange': f"{'+' if user_change > 0 else ''}{user_change:.1f}%",
+                    'totalUsersChange': self.format_percentage_change(user_change),
                     'sessionsPerUser': sessions_per_user,
                     'engagedSessionsPercentage': f"{engaged_percentage}%",
                     'engagementRateStatus': engagement_status,
@@ -225,7 +315,11 @@ class GA4Manager:
                     'bounceRateStatus': bounce_status,
                     'contentDepthStatus': content_depth_status,
                     'viewsPerSession': round(views_per_session, 2),
-                    'sessionQualityScore': session_quality_score
+                    'sessionQualityScore': session_quality_score,
+                    'metricChanges': {
+                        name: self.format_percentage_change(change)
+                        for name, change in metric_changes.items()
+                    }
                 }
             
             # Return default values if no data
@@ -249,52 +343,14 @@ class GA4Manager:
                 'bounceRateStatus': "No Data",
                 'contentDepthStatus': "No Data",
                 'viewsPerSession': 0.0,
-                'sessionQualityScore': "0/100"
+                'sessionQualityScore': "0/100",
+                'metricChanges': {}
             }
             
         except Exception as e:
             logger.error(f"Error fetching metrics for property {property_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to fetch metrics: {str(e)}")
 
-    def get_previous_period_metrics(self, property_id: str, period: str) -> Dict[str, Any]:
-        """Get metrics from previous period for comparison"""
-        try:
-            # Calculate previous period dates
-            if period == "7d":
-                previous_period = "14d"  # Get 14 days ago to 7 days ago
-                end_date = datetime.now() - timedelta(days=7)
-                start_date = end_date - timedelta(days=7)
-            elif period == "90d":
-                previous_period = "180d"  # Get 180 days ago to 90 days ago
-                end_date = datetime.now() - timedelta(days=90)
-                start_date = end_date - timedelta(days=90)
-            elif period == "365d":
-                previous_period = "730d"  # Get 730 days ago to 365 days ago
-                end_date = datetime.now() - timedelta(days=365)
-                start_date = end_date - timedelta(days=365)
-            else:  # 30d default
-                previous_period = "60d"  # Get 60 days ago to 30 days ago
-                end_date = datetime.now() - timedelta(days=30)
-                start_date = end_date - timedelta(days=30)
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(
-                    start_date=start_date.strftime("%Y-%m-%d"), 
-                    end_date=end_date.strftime("%Y-%m-%d")
-                )],
-                metrics=[Metric(name="totalUsers")],
-            )
-            
-            response = self.client.run_report(request=request)
-            
-            if response.rows:
-                return {'totalUsers': self.safe_int(response.rows[0].metric_values[0].value)}
-            return {'totalUsers': 0}
-            
-        except Exception:
-            return {'totalUsers': 0}  # Fallback if comparison fails
-
     def calculate_percentage_change(self, current: float, previous: float) -> float:
         """Calculate percentage change between current and previous values"""
         if previous == 0:
@@ -378,24 +434,17 @@ class GA4Manager:
                 limit=10
             )
             
-            response = self.client.run_report(request=request)
-            
-            total_sessions = sum(self.safe_int(row.metric_values[0].value) for row in response.rows)
+            columns = ReportColumns.from_response(self.client.run_report(request=request))
+            if not len(columns):
+                return []
             
-            sources = []
-            for row in response.rows:
-                sessions = self.safe_int(row.metric_values[0].value)
-                users = self.safe_int(row.metric_values[1].value)
-                percentage = (sessions / total_sessions * 100) if total_sessions > 0 else 0
-                
-                sources.append({
-                    'channel': row.dimension_values[0].value,
-                    'sessions': sessions,
-                    'users': users,
-                    'percentage': round(percentage, 2)
-                })
-            
-            return sources
+            sessions = columns.integers('sessions')
+            return to_records({
+                'channel': columns['sessionDefaultChannelGrouping'],
+                'sessions': sessions,
+                'users': columns.integers('totalUsers'),
+                'percentage': np.round(percent_of(sessions, sessions.sum()), 2)
+            })
             
         except Exception as e:
             logger.error(f"Error fetching traffic sources for property {property_id}: {e}")
@@ -700,19 +749,8 @@ class GA4Manager:
     # Enhanced methods for your GA4Manager class
 
     def get_currency_rates(self) -> Dict[str, float]:
-            """Get current USD exchange rates from a free API"""
-            try:
-                # Using exchangerate-api.com (free tier)
-                response = requests.get("https://api.exchangerate-api.com/v4/latest/USD", timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get('rates', {})
-                else:
-                    # Fallback rates if API fails
-                    return self._get_fallback_rates()
-            except Exception as e:
-                logger.warning(f"Failed to fetch currency rates: {e}")
-                return self._get_fallback_rates()
+        """Get current USD exchange rates from the shared, background-refreshed cache"""
+        return currency_rate_cache.get_rates(fallback=self._get_fallback_rates)
 
     def _get_fallback_rates(self) -> Dict[str, float]:
         """Fallback exchange rates when API is unavailable"""
@@ -746,12 +784,16 @@ class GA4Manager:
     def get_property_currency_from_api(self, property_id: str) -> str:
         """Get currency code from GA4 property using Admin API"""
         try:
-            credentials = self.auth_manager.get_user_credentials(self.user_email)
-            admin_service = build('analyticsadmin', 'v1alpha', credentials=credentials)
+            cached_info = self.get_cached_property_info(property_id)
+            if cached_info:
+                return cached_info.get('currency_code', 'USD')
+            
+            admin_service = self.admin_service
             
             # Get property details including currency
             property_name = f"properties/{property_id}"
             property_response = admin_service.properties().get(name=property_name).execute()
+            self.cache_property_info(property_id, self._property_info_from_resource(property_id, property_response))
             
             # The currency is in the property details
             currency_code = property_response.get('currencyCode', 'USD')
@@ -781,24 +823,14 @@ class GA4Manager:
     def get_property_details_with_currency(self, property_id: str) -> Dict[str, Any]:
         """Get comprehensive property details including currency from GA4"""
         try:
-            credentials = self.auth_manager.get_user_credentials(self.user_email)
-            admin_service = build('analyticsadmin', 'v1alpha', credentials=credentials)
+            admin_service = self.admin_service
             
             # Get property details
             property_name = f"properties/{property_id}"
             property_response = admin_service.properties().get(name=property_name).execute()
             
             # Extract currency and other useful info
-            property_info = {
-                'property_id': property_id,
-                'display_name': property_response.get('displayName', f'Property {property_id}'),
-                'currency_code': property_response.get('currencyCode', 'USD'),
-                'time_zone': property_response.get('timeZone', 'UTC'),
-                'industry_category': property_response.get('industryCategory', ''),
-                'website_url': property_response.get('websiteUrl', ''),
-                'create_time': property_response.get('createTime', ''),
-                'update_time': property_response.get('updateTime', '')
-            }
+            property_info = self._property_info_from_resource(property_id, property_response)
             
             # Cache this information for future use
             self.cache_property_info(property_id, property_info)
@@ -813,94 +845,69 @@ class GA4Manager:
                 'display_name': f'Property {property_id}'
             }
 
-    def cache_property_info(self, property_id: str, property_info: Dict[str, Any]):
-        """Cache property information to avoid repeated API calls"""
-        # You can implement this with Redis, database, or in-memory cache
-        # For now, using a simple class-level cache
-        if not hasattr(self, '_property_cache'):
-            self._property_cache = {}
-        
-        self._property_cache[property_id] = {
-            'data': property_info,
-            'cached_at': datetime.now(),
-            'expires_at': datetime.now() + timedelta(hours=24)  # Cache for 24 hours
+    def _property_info_from_resource(self, property_id: str, property_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Metadata kept for a property, from an Admin API Property resource"""
+        return {
+            'property_id': property_id,
+            'display_name': property_response.get('displayName', f'Property {property_id}'),
+            'currency_code': property_response.get('currencyCode', 'USD'),
+            'time_zone': property_response.get('timeZone', 'UTC'),
+            'industry_category': property_response.get('industryCategory', ''),
+            'website_url': property_response.get('websiteUrl', ''),
+            'create_time': property_response.get('createTime', ''),
+            'update_time': property_response.get('updateTime', '')
         }
 
+    def cache_property_info(self, property_id: str, property_info: Dict[str, Any]):
+        """Cache property information to avoid repeated API calls (shared, 24h TTL)"""
+        property_metadata_cache.put(property_id, property_info)
+
     def get_cached_property_info(self, property_id: str) -> Optional[Dict[str, Any]]:
         """Get cached property information if still valid"""
-        if not hasattr(self, '_property_cache'):
-            return None
-        
-        cached = self._property_cache.get(property_id)
-        if cached and datetime.now() < cached['expires_at']:
-            return cached['data']
-        
-        # Remove expired cache
-        if cached:
-            del self._property_cache[property_id]
-        
-        return None
-
-    def get_ads_customer_currency(self, customer_id: str) -> str:
-        """Get currency for Google Ads customer"""
-        try:
-            from google_ads.ads_manager import GoogleAdsManager
-            ads_manager = GoogleAdsManager(self.user_email, self.auth_manager)
-            customer_info = ads_manager.get_customer_info(customer_id)
-            return customer_info.get('currency', 'USD')
-        except Exception as e:
-            logger.warning(f"Could not get currency for customer {customer_id}: {e}")
-            return "USD"
+        return property_metadata_cache.get(property_id)
 
     def get_multi_customer_ad_spend(self, ads_customer_ids: List[str], period: str, start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """Get total ad spend from multiple Google Ads customers"""
+        """Get total ad spend from multiple Google Ads customers, queried concurrently"""
         try:
             from google_ads.ads_manager import GoogleAdsManager
             ads_manager = GoogleAdsManager(self.user_email, self.auth_manager)
             
-            total_cost_usd = 0.0
+            if period == "custom" and start_date and end_date:
+                ads_period = "CUSTOM"
+            else:
+                ads_period = self.convert_ga_period_to_ads_period(period)
+            
+            # One customer-level cost + currency query per customer, all in flight at once
+            results = ads_manager.get_customers_cost_and_currency(ads_customer_ids, ads_period, start_date, end_date)
             currency_rates = self.get_currency_rates()
-            customer_costs = []
             
+            total_cost_usd = 0.0
+            customer_costs = []
             for customer_id in ads_customer_ids:
-                try:
-                    # Get ad spend for this customer
-                    ads_period = self.convert_ga_period_to_ads_period(period)
-                    # Pass dates to Google Ads if custom period
-                    if period == "custom" and start_date and end_date:
-                        # You'll need to add a method in GoogleAdsManager to handle custom dates
-                        customer_cost = ads_manager.get_total_cost_for_custom_period(customer_id, start_date, end_date)
-                    else:
-                        customer_cost = ads_manager.get_total_cost_for_period(customer_id, ads_period)
-                    
-                    # Get customer currency
-                    customer_currency = self.get_ads_customer_currency(customer_id)
-                    
-                    # Convert to USD
-                    customer_cost_usd = self.convert_to_usd(customer_cost, customer_currency, currency_rates)
-                    
-                    total_cost_usd += customer_cost_usd
-                    
-                    customer_costs.append({
-                        'customer_id': customer_id,
-                        'cost_original': customer_cost,
-                        'currency': customer_currency,
-                        'cost_usd': customer_cost_usd
-                    })
-                    
-                    logger.info(f"Customer {customer_id}: {customer_cost} {customer_currency} = {customer_cost_usd:.2f} USD")
-                    
-                except Exception as customer_error:
-                    logger.warning(f"Could not fetch costs for customer {customer_id}: {customer_error}")
+                result = results[customer_id]
+                if 'error' in result:
+                    logger.warning(f"Could not fetch costs for customer {customer_id}: {result['error']}")
                     # Add zero-cost entry for failed customers
                     customer_costs.append({
                         'customer_id': customer_id,
                         'cost_original': 0.0,
                         'currency': 'USD',
                         'cost_usd': 0.0,
-                        'error': str(customer_error)
+                        'error': result['error']
                     })
                     continue
+                
+                customer_cost_usd = self.convert_to_usd(result['cost'], result['currency'], currency_rates)
+                total_cost_usd += customer_cost_usd
+                
+                customer_costs.append({
+                    'customer_id': customer_id,
+                    'cost_original': result['cost'],
+                    'currency': result['currency'],
+                    'cost_usd': customer_cost_usd
+                })
+                
+                logger.info(f"Customer {customer_id}: {result['cost']} {result['currency']} = {customer_cost_usd:.2f} USD")
             
             logger.info(f"Total ad spend across {len(ads_customer_ids)} customers: ${total_cost_usd:.2f} USD")
             
@@ -943,6 +950,11 @@ class GA4Manager:
             
             logger.info(f"Processing property {property_id} with currency {property_currency}")
             
+            # Ad spend comes from Google Ads; fetch it while the GA4 reports run
+            ad_spend_executor = ThreadPoolExecutor(max_workers=1)
+            ad_spend_future = ad_spend_executor.submit(self.get_multi_customer_ad_spend, ads_customer_ids, period, start_date, end_date)
+            ad_spend_executor.shutdown(wait=False)
+            
             # Get GA4 data
             request = RunReportRequest(
                 property=f"properties/{property_id}",
@@ -999,7 +1011,7 @@ class GA4Manager:
             first_time_response = self.client.run_report(first_time_request)
             
             # Get multi-customer ad spend in USD
-            ad_spend_data = self.get_multi_customer_ad_spend(ads_customer_ids, period, start_date, end_date)
+            ad_spend_data = ad_spend_future.result()
             actual_ad_cost_usd = ad_spend_data['total_cost_usd']
             
             if response.rows:
@@ -1392,89 +1404,37 @@ class GA4Manager:
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
             
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[Dimension(name="sessionDefaultChannelGrouping")],
-                metrics=[
-                    Metric(name="totalUsers"),
-                    Metric(name="sessions"),
-                    Metric(name="bounceRate"),
-                    Metric(name="userEngagementDuration"),
-                    Metric(name="conversions"),
-                    Metric(name="totalRevenue"),
-                ],
-                order_bys=[OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalUsers"), desc=True)],
-                limit=10
-            )
-            
-            response = self.client.run_report(request=request)
-            
-            channels = []
-            for row in response.rows:
-                channel_name = row.dimension_values[0].value
-                users = self.safe_int(row.metric_values[0].value)
-                sessions = self.safe_int(row.metric_values[1].value)
-                bounce_rate = self.safe_float(row.metric_values[2].value)
-                duration = self.safe_float(row.metric_values[3].value)
-                conversions = self.safe_int(row.metric_values[4].value)
-                revenue = self.safe_float(row.metric_values[5].value)
-                
-                avg_session_duration = duration / sessions if sessions > 0 else 0
-                conversion_rate = (conversions / sessions * 100) if sessions > 0 else 0
-                
-                channels.append({
-                    'channel': channel_name,
-                    'users': users,
-                    'sessions': sessions,
-                    'bounceRate': bounce_rate * 100,
-                    'avgSessionDuration': avg_session_duration,
-                    'conversionRate': conversion_rate,
-                    'revenue': revenue
-                })
-            
-            return channels
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'channel_performance').top('totalUsers', 10)
+            if not len(columns):
+                return []
+            
+            sessions = columns.integers('sessions')
+            return to_records({
+                'channel': columns['sessionDefaultChannelGrouping'],
+                'users': columns.integers('totalUsers'),
+                'sessions': sessions,
+                # GA4 bounce rate is the share of sessions that were not engaged
+                'bounceRate': safe_divide(columns['sessions'] - columns['engagedSessions'], columns['sessions']) * 100,
+                'avgSessionDuration': safe_divide(columns['userEngagementDuration'], sessions),
+                'conversionRate': percent_of(columns.integers('conversions'), sessions),
+                'revenue': columns['totalRevenue']
+            })
             
         except Exception as e:
             logger.error(f"Error fetching channel performance for property {property_id}: {e}")
             return []
         
-    def get_coordinates(self, city: str, country: str) -> tuple:
-        """Get latitude and longitude for a city/country"""
+    def get_cube_columns(self, property_id: str, start_date_str: str, end_date_str: str, query: str, also: List[str] = ()) -> ReportColumns:
+        """Columns of a report cube query (see report_cube.QUERIES) for this user, fetching the `also` queries alongside on a miss"""
+        return report_cube.get(self.client, self.user_email, property_id, start_date_str, end_date_str, query, also)
+
+    def get_coordinates(self, places: List[tuple]) -> List[tuple]:
+        """Get latitude and longitude for (city, country) pairs from the offline gazetteer"""
         try:
-            # Handle cases where city is actually a country name
-            if city in ["(not set)", "unknown"]:
-                return 0.0, 0.0
-            
-            # If city appears to be a country name (no comma in the original value), use just the city as the query
-            if country in ["(not set)", "unknown"] or city == country:
-                query = city  # Use just the location name
-            else:
-                query = f"{city}, {country}"  # Use city, country format
-            
-            # Use free Nominatim API
-            url = "https://nominatim.openstreetmap.org/search"
-            params = {
-                'q': query,
-                'format': 'json',
-                'limit': 1
-            }
-            headers = {
-                'User-Agent': 'Marketing-Dashboard/1.0'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    return float(data[0]['lat']), float(data[0]['lon'])
-            
-            return 0.0, 0.0
-            
+            return geocoder.get_coordinates_many(places)
         except Exception as e:
-            logger.warning(f"Geocoding failed for {city}, {country}: {e}")
-            return 0.0, 0.0
+            logger.warning(f"Geocoding failed for {len(places)} places: {e}")
+            return [(0.0, 0.0)] * len(places)
     
     def get_audience_insights(self, property_id: str, dimension: str = "city", period: str = "30d", start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
         """Get audience insights for a specific dimension"""
@@ -1502,48 +1462,33 @@ class GA4Manager:
                 limit=15
             )
             
-            response = self.client.run_report(request=request)
-            total_users = sum(self.safe_int(row.metric_values[0].value) for row in response.rows)
+            columns = ReportColumns.from_response(self.client.run_report(request=request))
+            if not len(columns):
+                return []
             
-            insights = []
-            for row in response.rows:
-                users = self.safe_int(row.metric_values[0].value)
-                percentage = (users / total_users * 100) if total_users > 0 else 0
-                engagement_rate = self.safe_float(row.metric_values[1].value) * 100
-                
-                if dimension in ["city", "country"]:
-                    city = row.dimension_values[0].value
-                    country = row.dimension_values[1].value
-                    
-                    # Create clean display value
-                    if city == "(not set)" or city == country:
-                        display_value = country
-                    else:
-                        display_value = f"{city}, {country}"
-                    
-                    latitude, longitude = self.get_coordinates(city, country)
-                    
-                    insights.append({
-                        'dimension': dimension,
-                        'value': display_value,
-                        'latitude': latitude,
-                        'longitude': longitude,
-                        'users': users,
-                        'percentage': round(percentage, 2),
-                        'engagementRate': round(engagement_rate, 2)
-                    })
-                else:
-                    insights.append({
-                        'dimension': dimension,
-                        'value': row.dimension_values[0].value,
-                        'latitude': 0.0,
-                        'longitude': 0.0,
-                        'users': users,
-                        'percentage': round(percentage, 2),
-                        'engagementRate': round(engagement_rate, 2)
-                    })
-            
-            return insights
+            if dimension in ["city", "country"]:
+                city = columns['city']
+                country = columns['country']
+                
+                # Create clean display value
+                values = np.where((city == "(not set)") | (city == country), country, city + ", " + country)
+                coordinates = self.get_coordinates(list(zip(city.tolist(), country.tolist())))
+                latitudes = [latitude for latitude, _ in coordinates]
+                longitudes = [longitude for _, longitude in coordinates]
+            else:
+                values = columns[dimension]
+                latitudes = longitudes = np.zeros(len(columns))
+            
+            users = columns.integers('totalUsers')
+            return to_records({
+                'dimension': [dimension] * len(columns),
+                'value': values,
+                'latitude': latitudes,
+                'longitude': longitudes,
+                'users': users,
+                'percentage': np.round(percent_of(users, users.sum()), 2),
+                'engagementRate': np.round(columns['engagementRate'] * 100, 2)
+            })
             
         except Exception as e:
             logger.error(f"Error fetching audience insights for property {property_id}: {e}")
@@ -1562,20 +1507,15 @@ class GA4Manager:
                 order_bys=[OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date"))]
             )
             
-            response = self.client.run_report(request=request)
-            
-            time_series = []
-            for row in response.rows:
-                date_val = row.dimension_values[0].value
-                metric_val = self.safe_float(row.metric_values[0].value)
-                
-                time_series.append({
-                    'date': date_val,
-                    'metric': metric,
-                    'value': metric_val
-                })
+            columns = ReportColumns.from_response(self.client.run_report(request=request))
+            if not len(columns):
+                return []
             
-            return time_series
+            return to_records({
+                'date': columns['date'],
+                'metric': [metric] * len(columns),
+                'value': columns[metric]
+            })
             
         except Exception as e:
             logger.error(f"Error fetching time series for property {property_id}: {e}")
@@ -1634,128 +1574,73 @@ class GA4Manager:
         
 
     # Add these methods to your GA4Manager class
+    def _revenue_breakdown_result(self, columns: ReportColumns, fields: Dict[str, Any], items_key: str, count_key: str, usd_per_unit: float = None) -> Dict[str, Any]:
+        """
+        Items and totals of a revenue breakdown. Revenue share, and the USD
+        columns when a conversion factor is given, are computed per column.
+        """
+        total_revenue_sum = float(columns['totalRevenue'].sum()) if len(columns) else 0
+        result = {items_key: [], 'totalRevenue': total_revenue_sum, count_key: len(columns)}
+        if usd_per_unit is not None:
+            result['totalRevenueUSD'] = total_revenue_sum * usd_per_unit
+        if not len(columns):
+            return result
+        
+        fields['revenuePercentage'] = percent_of(columns['totalRevenue'], total_revenue_sum)
+        if usd_per_unit is not None:
+            for field in ('totalRevenue', 'purchaseRevenue'):
+                fields[f"{field}USD"] = columns[field] * usd_per_unit
+        result[items_key] = to_records(fields)
+        return result
+
+    def _parse_revenue_by_channel(self, columns: ReportColumns, usd_per_unit: float = None) -> Dict[str, Any]:
+        if not len(columns):
+            return self._revenue_breakdown_result(columns, {}, 'channels', 'totalChannels', usd_per_unit)
+        
+        return self._revenue_breakdown_result(columns, {
+            'channel': columns['sessionDefaultChannelGrouping'],
+            'totalRevenue': columns['totalRevenue'],
+            'purchaseRevenue': columns['purchaseRevenue'],
+            'sessions': columns.integers('sessions'),
+            'users': columns.integers('totalUsers'),
+            'conversions': columns.integers('conversions'),
+            'purchasers': columns.integers('totalPurchasers'),
+            'revenuePerSession': safe_divide(columns['totalRevenue'], columns.integers('sessions')),
+            'conversionRate': percent_of(columns['conversions'], columns.integers('sessions'))
+        }, 'channels', 'totalChannels', usd_per_unit)
+
     def get_revenue_breakdown_by_channel(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None) -> Dict[str, Any]:
         """Get detailed revenue breakdown by channel"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[Dimension(name="sessionDefaultChannelGrouping")],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="totalUsers"),
-                    Metric(name="conversions"),
-                    Metric(name="totalPurchasers")
-                ],
-                order_bys=[OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)]
-            )
-            
-            response = self.client.run_report(request)
-            
-            channels = []
-            total_revenue_sum = 0
-            
-            for row in response.rows:
-                channel = row.dimension_values[0].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                users = self.safe_int(row.metric_values[3].value)
-                conversions = self.safe_float(row.metric_values[4].value)
-                purchasers = self.safe_int(row.metric_values[5].value)
-                
-                total_revenue_sum += total_revenue
-                
-                revenue_per_session = total_revenue / sessions if sessions > 0 else 0
-                conversion_rate = (conversions / sessions * 100) if sessions > 0 else 0
-                
-                channels.append({
-                    'channel': channel,
-                    'totalRevenue': total_revenue,
-                    'purchaseRevenue': purchase_revenue,
-                    'sessions': sessions,
-                    'users': users,
-                    'conversions': int(conversions),
-                    'purchasers': purchasers,
-                    'revenuePerSession': revenue_per_session,
-                    'conversionRate': conversion_rate
-                })
-            
-            # Calculate percentages
-            for channel in channels:
-                channel['revenuePercentage'] = (channel['totalRevenue'] / total_revenue_sum * 100) if total_revenue_sum > 0 else 0
-            
-            return {
-                'channels': channels,
-                'totalRevenue': total_revenue_sum,
-                'totalChannels': len(channels)
-            }
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'revenue_by_channel')
+            return self._parse_revenue_by_channel(columns)
             
         except Exception as e:
             logger.error(f"Error getting revenue breakdown by channel: {e}")
             return {'channels': [], 'totalRevenue': 0, 'totalChannels': 0}
 
 
+    def _parse_revenue_by_source_medium(self, columns: ReportColumns, usd_per_unit: float = None) -> Dict[str, Any]:
+        if not len(columns):
+            return self._revenue_breakdown_result(columns, {}, 'sources', 'totalSources', usd_per_unit)
+        
+        return self._revenue_breakdown_result(columns, {
+            'source': columns['sessionSource'],
+            'medium': columns['sessionMedium'],
+            'sourceMedium': columns['sessionSource'] + " / " + columns['sessionMedium'],
+            'totalRevenue': columns['totalRevenue'],
+            'purchaseRevenue': columns['purchaseRevenue'],
+            'sessions': columns.integers('sessions'),
+            'conversions': columns.integers('conversions')
+        }, 'sources', 'totalSources', usd_per_unit)
+
     def get_revenue_breakdown_by_source_medium(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None,limit: int = 20) -> Dict[str, Any]:
         """Get detailed revenue breakdown by channel"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[
-                    Dimension(name="sessionSource"),
-                    Dimension(name="sessionMedium")
-                ],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="conversions")
-                ],
-                order_bys=[OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)],
-                limit=limit
-            )
-            
-            response = self.client.run_report(request)
-            
-            sources = []
-            total_revenue_sum = 0
-            
-            for row in response.rows:
-                source = row.dimension_values[0].value
-                medium = row.dimension_values[1].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                conversions = self.safe_float(row.metric_values[3].value)
-                
-                total_revenue_sum += total_revenue
-                
-                sources.append({
-                    'source': source,
-                    'medium': medium,
-                    'sourceMedium': f"{source} / {medium}",
-                    'totalRevenue': total_revenue,
-                    'purchaseRevenue': purchase_revenue,
-                    'sessions': sessions,
-                    'conversions': int(conversions)
-                })
-            
-            # Calculate percentages
-            for source in sources:
-                source['revenuePercentage'] = (source['totalRevenue'] / total_revenue_sum * 100) if total_revenue_sum > 0 else 0
-            
-            return {
-                'sources': sources,
-                'totalRevenue': total_revenue_sum,
-                'totalSources': len(sources)
-            }
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'revenue_by_source_medium')
+            return self._parse_revenue_by_source_medium(columns.top('totalRevenue', limit))
             
         except Exception as e:
             logger.error(f"Error getting revenue breakdown by source/medium: {e}")
@@ -1763,181 +1648,78 @@ class GA4Manager:
 
 
 
+    def _parse_revenue_by_device(self, columns: ReportColumns, usd_per_unit: float = None) -> Dict[str, Any]:
+        if not len(columns):
+            return self._revenue_breakdown_result(columns, {}, 'devices', 'totalDevices', usd_per_unit)
+        
+        return self._revenue_breakdown_result(columns, {
+            'device': columns['deviceCategory'],
+            'totalRevenue': columns['totalRevenue'],
+            'purchaseRevenue': columns['purchaseRevenue'],
+            'sessions': columns.integers('sessions'),
+            'conversions': columns.integers('conversions'),
+            'users': columns.integers('totalUsers')
+        }, 'devices', 'totalDevices', usd_per_unit)
+
     def get_revenue_breakdown_by_device(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None) -> Dict[str, Any]:
         """Get detailed revenue breakdown by channel"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[Dimension(name="deviceCategory")],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="conversions"),
-                    Metric(name="totalUsers")
-                ],
-                order_bys=[OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)]
-            )
-            
-            response = self.client.run_report(request)
-            
-            devices = []
-            total_revenue_sum = 0
-            
-            for row in response.rows:
-                device = row.dimension_values[0].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                conversions = self.safe_float(row.metric_values[3].value)
-                users = self.safe_int(row.metric_values[4].value)
-                
-                total_revenue_sum += total_revenue
-                
-                devices.append({
-                    'device': device,
-                    'totalRevenue': total_revenue,
-                    'purchaseRevenue': purchase_revenue,
-                    'sessions': sessions,
-                    'conversions': int(conversions),
-                    'users': users
-                })
-            
-            # Calculate percentages
-            for device in devices:
-                device['revenuePercentage'] = (device['totalRevenue'] / total_revenue_sum * 100) if total_revenue_sum > 0 else 0
-            
-            return {
-                'devices': devices,
-                'totalRevenue': total_revenue_sum,
-                'totalDevices': len(devices)
-            }
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'revenue_by_device')
+            return self._parse_revenue_by_device(columns)
             
         except Exception as e:
             logger.error(f"Error getting revenue breakdown by device: {e}")
             return {'devices': [], 'totalRevenue': 0, 'totalDevices': 0}
 
 
+    def _parse_revenue_by_location(self, columns: ReportColumns, usd_per_unit: float = None) -> Dict[str, Any]:
+        if not len(columns):
+            return self._revenue_breakdown_result(columns, {}, 'locations', 'totalLocations', usd_per_unit)
+        
+        country = columns['country']
+        city = columns['city']
+        return self._revenue_breakdown_result(columns, {
+            'country': country,
+            'city': city,
+            'location': np.where(city != "(not set)", city + ", " + country, country),
+            'totalRevenue': columns['totalRevenue'],
+            'purchaseRevenue': columns['purchaseRevenue'],
+            'sessions': columns.integers('sessions'),
+            'users': columns.integers('totalUsers')
+        }, 'locations', 'totalLocations', usd_per_unit)
+
     def get_revenue_breakdown_by_location(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None,limit: int = 15) -> Dict[str, Any]:
         """Get detailed revenue breakdown by channel"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[
-                    Dimension(name="country"),
-                    Dimension(name="city")
-                ],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="totalUsers")
-                ],
-                order_bys=[OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)],
-                limit=limit
-            )
-            
-            response = self.client.run_report(request)
-            
-            locations = []
-            total_revenue_sum = 0
-            
-            for row in response.rows:
-                country = row.dimension_values[0].value
-                city = row.dimension_values[1].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                users = self.safe_int(row.metric_values[3].value)
-                
-                total_revenue_sum += total_revenue
-                
-                locations.append({
-                    'country': country,
-                    'city': city,
-                    'location': f"{city}, {country}" if city != "(not set)" else country,
-                    'totalRevenue': total_revenue,
-                    'purchaseRevenue': purchase_revenue,
-                    'sessions': sessions,
-                    'users': users
-                })
-            
-            # Calculate percentages
-            for location in locations:
-                location['revenuePercentage'] = (location['totalRevenue'] / total_revenue_sum * 100) if total_revenue_sum > 0 else 0
-            
-            return {
-                'locations': locations,
-                'totalRevenue': total_revenue_sum,
-                'totalLocations': len(locations)
-            }
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'revenue_by_location')
+            return self._parse_revenue_by_location(columns.top('totalRevenue', limit))
             
         except Exception as e:
             logger.error(f"Error getting revenue breakdown by location: {e}")
             return {'locations': [], 'totalRevenue': 0, 'totalLocations': 0}
 
 
+    def _parse_revenue_by_page(self, columns: ReportColumns, usd_per_unit: float = None) -> Dict[str, Any]:
+        if not len(columns):
+            return self._revenue_breakdown_result(columns, {}, 'pages', 'totalPages', usd_per_unit)
+        
+        return self._revenue_breakdown_result(columns, {
+            'landingPage': columns['landingPage'],
+            'pageTitle': columns['pageTitle'],
+            'totalRevenue': columns['totalRevenue'],
+            'purchaseRevenue': columns['purchaseRevenue'],
+            'sessions': columns.integers('sessions'),
+            'conversions': columns.integers('conversions')
+        }, 'pages', 'totalPages', usd_per_unit)
+
     def get_revenue_breakdown_by_page(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None,limit: int = 20) -> Dict[str, Any]:
         """Get detailed revenue breakdown by channel"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
-            
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[
-                    Dimension(name="landingPage"),
-                    Dimension(name="pageTitle")
-                ],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="conversions")
-                ],
-                order_bys=[OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)],
-                limit=limit
-            )
-            
-            response = self.client.run_report(request)
-            
-            pages = []
-            total_revenue_sum = 0
-            
-            for row in response.rows:
-                landing_page = row.dimension_values[0].value
-                page_title = row.dimension_values[1].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                conversions = self.safe_float(row.metric_values[3].value)
-                
-                total_revenue_sum += total_revenue
-                
-                pages.append({
-                    'landingPage': landing_page,
-                    'pageTitle': page_title,
-                    'totalRevenue': total_revenue,
-                    'purchaseRevenue': purchase_revenue,
-                    'sessions': sessions,
-                    'conversions': int(conversions)
-                })
-            
-            # Calculate percentages
-            for page in pages:
-                page['revenuePercentage'] = (page['totalRevenue'] / total_revenue_sum * 100) if total_revenue_sum > 0 else 0
-            
-            return {
-                'pages': pages,
-                'totalRevenue': total_revenue_sum,
-                'totalPages': len(pages)
-            }
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'revenue_by_page')
+            return self._parse_revenue_by_page(columns.top('totalRevenue', limit))
             
         except Exception as e:
             logger.error(f"Error getting revenue breakdown by page: {e}")
@@ -1945,41 +1727,35 @@ class GA4Manager:
 
 
     def get_comprehensive_revenue_breakdown(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """Get detailed revenue breakdown by channel"""
+        """Get revenue breakdowns by channel, source/medium, device, location and page from the report cube"""
 
         try:
             property_currency = self.get_property_currency_enhanced(property_id)
             currency_rates = self.get_currency_rates()
             
-            # Get all breakdowns
-            channel_breakdown = self.get_revenue_breakdown_by_channel(property_id, period)
-            source_breakdown = self.get_revenue_breakdown_by_source_medium(property_id, period)
-            device_breakdown = self.get_revenue_breakdown_by_device(property_id, period)
-            location_breakdown = self.get_revenue_breakdown_by_location(property_id, period)
-            page_breakdown = self.get_revenue_breakdown_by_page(property_id, period)
-            
-            # Convert all revenue to USD
-            def convert_breakdown_to_usd(breakdown_data, revenue_fields):
-                if 'totalRevenue' in breakdown_data:
-                    breakdown_data['totalRevenueUSD'] = self.convert_to_usd(
-                        breakdown_data['totalRevenue'], property_currency, currency_rates
-                    )
-                
-                for item in breakdown_data.get('channels', []) + breakdown_data.get('sources', []) + \
-                        breakdown_data.get('devices', []) + breakdown_data.get('locations', []) + \
-                        breakdown_data.get('pages', []):
-                    for field in revenue_fields:
-                        if field in item:
-                            item[f"{field}USD"] = self.convert_to_usd(
-                                item[field], property_currency, currency_rates
-                            )
-            
-            revenue_fields = ['totalRevenue', 'purchaseRevenue']
-            convert_breakdown_to_usd(channel_breakdown, revenue_fields)
-            convert_breakdown_to_usd(source_breakdown, revenue_fields)
-            convert_breakdown_to_usd(device_breakdown, revenue_fields)
-            convert_breakdown_to_usd(location_breakdown, revenue_fields)
-            convert_breakdown_to_usd(page_breakdown, revenue_fields)
+            start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
+            # Revenue is converted to USD column-wise with a single rate lookup
+            usd_per_unit = self.convert_to_usd(1.0, property_currency, currency_rates)
+            
+            # (result key, cube query, parser, row limit)
+            reports = [
+                ('breakdown_by_channel', 'revenue_by_channel', self._parse_revenue_by_channel, None),
+                ('breakdown_by_source', 'revenue_by_source_medium', self._parse_revenue_by_source_medium, 20),
+                ('breakdown_by_device', 'revenue_by_device', self._parse_revenue_by_device, None),
+                ('breakdown_by_location', 'revenue_by_location', self._parse_revenue_by_location, 15),
+                ('breakdown_by_page', 'revenue_by_page', self._parse_revenue_by_page, 20)
+            ]
+            
+            # The first lookup fetches all five reports in one batch
+            queries = [query for _, query, _, _ in reports]
+            breakdowns = {}
+            for key, query, parse, limit in reports:
+                try:
+                    columns = self.get_cube_columns(property_id, start_date_str, end_date_str, query, queries).top('totalRevenue', limit)
+                except Exception as report_error:
+                    logger.error(f"Error getting {key} for {property_id}: {report_error}")
+                    columns = ReportColumns.from_response(RunReportResponse())
+                breakdowns[key] = parse(columns, usd_per_unit)
             
             return {
                 'propertyId': property_id,
@@ -1988,17 +1764,13 @@ class GA4Manager:
                     'original_currency': property_currency,
                     'exchange_rates': currency_rates
                 },
-                'breakdown_by_channel': channel_breakdown,
-                'breakdown_by_source': source_breakdown,
-                'breakdown_by_device': device_breakdown,
-                'breakdown_by_location': location_breakdown,
-                'breakdown_by_page': page_breakdown,
+                **breakdowns,
                 'summary': {
-                    'total_channels': channel_breakdown['totalChannels'],
-                    'total_sources': source_breakdown['totalSources'],
-                    'total_devices': device_breakdown['totalDevices'],
-                    'total_locations': location_breakdown['totalLocations'],
-                    'total_pages': page_breakdown['totalPages']
+                    'total_channels': breakdowns['breakdown_by_channel']['totalChannels'],
+                    'total_sources': breakdowns['breakdown_by_source']['totalSources'],
+                    'total_devices': breakdowns['breakdown_by_device']['totalDevices'],
+                    'total_locations': breakdowns['breakdown_by_location']['totalLocations'],
+                    'total_pages': breakdowns['breakdown_by_page']['totalPages']
                 }
             }
             
@@ -2011,152 +1783,128 @@ class GA4Manager:
             }
         
 
+    def _revenue_time_series(self, columns: ReportColumns, group_dimension: str, item_key: str, usd_per_unit: float) -> Dict[str, Any]:
+        """
+        Daily revenue split of a date x group report. Every day lists every
+        group found (zero-filled), with its share of that day's revenue;
+        sums, shares and USD conversion run on dense date x group matrices.
+        """
+        dates, date_codes = columns.factorize('date', sort=True)
+        groups, group_codes = columns.factorize(group_dimension)
+        shape = (len(dates), len(groups))
+        
+        revenue = pivot_sum(date_codes, group_codes, shape, columns['totalRevenue'])
+        purchase_revenue = pivot_sum(date_codes, group_codes, shape, columns['purchaseRevenue'])
+        sessions = pivot_sum(date_codes, group_codes, shape, columns.integers('sessions')).astype(np.int64)
+        users = pivot_sum(date_codes, group_codes, shape, columns.integers('totalUsers')).astype(np.int64)
+        conversions = pivot_sum(date_codes, group_codes, shape, columns['conversions'])
+        days_active = (pivot_sum(date_codes, group_codes, shape) > 0).sum(axis=0)
+        revenue_usd = revenue * usd_per_unit
+        
+        day_revenue = revenue.sum(axis=1)
+        cells = {
+            'totalRevenue': revenue.tolist(),
+            'totalRevenueUSD': revenue_usd.tolist(),
+            'purchaseRevenue': purchase_revenue.tolist(),
+            'purchaseRevenueUSD': (purchase_revenue * usd_per_unit).tolist(),
+            'sessions': sessions.tolist(),
+            'users': users.tolist(),
+            'conversions': conversions.astype(np.int64).tolist(),
+            'revenuePercentage': percent_of(revenue, day_revenue[:, None]).tolist()
+        }
+        day_totals = to_records({
+            'date': dates,
+            'total_revenue': day_revenue,
+            'total_revenue_usd': revenue_usd.sum(axis=1),
+            'total_sessions': sessions.sum(axis=1),
+            'total_users': users.sum(axis=1),
+            'total_conversions': conversions.sum(axis=1)
+        })
+        
+        group_names = groups.tolist()
+        time_series = []
+        for day_index, day in enumerate(day_totals):
+            day[f"{item_key}s"] = {
+                group: {
+                    item_key: group,
+                    **{field: values[day_index][group_index] for field, values in cells.items()}
+                }
+                for group_index, group in enumerate(group_names)
+            }
+            time_series.append(day)
+        
+        group_revenue = revenue.sum(axis=0)
+        group_revenue_usd = revenue_usd.sum(axis=0)
+        group_sessions = sessions.sum(axis=0)
+        order = np.argsort(-group_revenue_usd, kind='stable')
+        summary = to_records({
+            item_key: groups[order],
+            'totalRevenue': group_revenue[order],
+            'totalRevenueUSD': group_revenue_usd[order],
+            'totalSessions': group_sessions[order],
+            'totalUsers': users.sum(axis=0)[order],
+            'totalConversions': conversions.sum(axis=0)[order],
+            'days_active': days_active[order],
+            'avgDailyRevenue': safe_divide(group_revenue, days_active)[order],
+            'avgDailyRevenueUSD': safe_divide(group_revenue_usd, days_active)[order],
+            'avgDailySessions': safe_divide(group_sessions, days_active)[order]
+        })
+        
+        return {
+            'time_series': time_series,
+            'summary': summary,
+            'groups_found': group_names,
+            'totals': {
+                'total_revenue': float(revenue.sum()),
+                'total_revenue_usd': float(revenue_usd.sum()),
+                'total_sessions': int(sessions.sum()),
+                'total_users': int(users.sum()),
+                'total_conversions': float(conversions.sum())
+            }
+        }
+
     # Add these methods to your GA4Manager class
 
+    def _channel_revenue_time_series_request(self, property_id: str, start_date_str: str, end_date_str: str, channels: List[str] = None) -> RunReportRequest:
+        """Date x channel revenue report, limited server-side to the given channels if any"""
+        request = RunReportRequest(
+            property=f"properties/{property_id}",
+            date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
+            dimensions=[
+                Dimension(name="date"),
+                Dimension(name="sessionDefaultChannelGrouping")
+            ],
+            metrics=[
+                Metric(name="totalRevenue"),
+                Metric(name="purchaseRevenue"),
+                Metric(name="sessions"),
+                Metric(name="totalUsers"),
+                Metric(name="conversions")
+            ],
+            order_bys=[
+                OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date")),
+                OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)
+            ]
+        )
+        if channels:
+            request.dimension_filter = FilterExpression(filter=Filter(
+                field_name="sessionDefaultChannelGrouping",
+                in_list_filter=Filter.InListFilter(values=channels, case_sensitive=True)
+            ))
+        return request
+
     def get_channel_revenue_time_series(self, property_id: str, period: str = "30d", start_date: str = None, end_date: str = None) -> Dict[str, Any]:
         """Get revenue breakdown by channel over time"""
         try:
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
-            
-        
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[
-                    Dimension(name="date"),
-                    Dimension(name="sessionDefaultChannelGrouping")
-                ],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="totalUsers"),
-                    Metric(name="conversions")
-                ],
-                order_bys=[
-                    OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date")),
-                    OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)
-                ]
-            )
-            
-            response = self.client.run_report(request)
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, 'revenue_time_series_by_channel')
             
             # Get property currency for conversion
             property_currency = self.get_property_currency_enhanced(property_id)
             currency_rates = self.get_currency_rates()
+            usd_per_unit = self.convert_to_usd(1.0, property_currency, currency_rates)
             
-            # Organize data by date and channel
-            time_series_data = {}
-            channel_totals = {}
-            date_totals = {}
-            all_channels = set()
-            
-            for row in response.rows:
-                date = row.dimension_values[0].value
-                channel = row.dimension_values[1].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                users = self.safe_int(row.metric_values[3].value)
-                conversions = self.safe_float(row.metric_values[4].value)
-                
-                # Convert revenue to USD
-                total_revenue_usd = self.convert_to_usd(total_revenue, property_currency, currency_rates)
-                purchase_revenue_usd = self.convert_to_usd(purchase_revenue, property_currency, currency_rates)
-                
-                # Track all channels
-                all_channels.add(channel)
-                
-                # Initialize date if not exists
-                if date not in time_series_data:
-                    time_series_data[date] = {
-                        'date': date,
-                        'channels': {},
-                        'total_revenue': 0,
-                        'total_revenue_usd': 0,
-                        'total_sessions': 0,
-                        'total_users': 0,
-                        'total_conversions': 0
-                    }
-                
-                # Add channel data for this date
-                time_series_data[date]['channels'][channel] = {
-                    'channel': channel,
-                    'totalRevenue': total_revenue,
-                    'totalRevenueUSD': total_revenue_usd,
-                    'purchaseRevenue': purchase_revenue,
-                    'purchaseRevenueUSD': purchase_revenue_usd,
-                    'sessions': sessions,
-                    'users': users,
-                    'conversions': int(conversions)
-                }
-                
-                # Update date totals
-                time_series_data[date]['total_revenue'] += total_revenue
-                time_series_data[date]['total_revenue_usd'] += total_revenue_usd
-                time_series_data[date]['total_sessions'] += sessions
-                time_series_data[date]['total_users'] += users
-                time_series_data[date]['total_conversions'] += conversions
-                
-                # Update channel totals
-                if channel not in channel_totals:
-                    channel_totals[channel] = {
-                        'channel': channel,
-                        'totalRevenue': 0,
-                        'totalRevenueUSD': 0,
-                        'totalSessions': 0,
-                        'totalUsers': 0,
-                        'totalConversions': 0,
-                        'days_active': 0
-                    }
-                
-                channel_totals[channel]['totalRevenue'] += total_revenue
-                channel_totals[channel]['totalRevenueUSD'] += total_revenue_usd
-                channel_totals[channel]['totalSessions'] += sessions
-                channel_totals[channel]['totalUsers'] += users
-                channel_totals[channel]['totalConversions'] += conversions
-                channel_totals[channel]['days_active'] += 1
-            
-            # Calculate percentages and fill missing channel data for each date
-            for date_data in time_series_data.values():
-                # Fill missing channels with zero values
-                for channel in all_channels:
-                    if channel not in date_data['channels']:
-                        date_data['channels'][channel] = {
-                            'channel': channel,
-                            'totalRevenue': 0,
-                            'totalRevenueUSD': 0,
-                            'purchaseRevenue': 0,
-                            'purchaseRevenueUSD': 0,
-                            'sessions': 0,
-                            'users': 0,
-                            'conversions': 0
-                        }
-                
-                # Calculate percentages for each channel on this date
-                for channel_data in date_data['channels'].values():
-                    channel_data['revenuePercentage'] = (
-                        (channel_data['totalRevenue'] / date_data['total_revenue'] * 100)
-                        if date_data['total_revenue'] > 0 else 0
-                    )
-            
-            # Convert to list format sorted by date
-            time_series_list = sorted(time_series_data.values(), key=lambda x: x['date'])
-            
-            # Calculate channel averages
-            for channel_data in channel_totals.values():
-                days_active = channel_data['days_active']
-                if days_active > 0:
-                    channel_data['avgDailyRevenue'] = channel_data['totalRevenue'] / days_active
-                    channel_data['avgDailyRevenueUSD'] = channel_data['totalRevenueUSD'] / days_active
-                    channel_data['avgDailySessions'] = channel_data['totalSessions'] / days_active
-                else:
-                    channel_data['avgDailyRevenue'] = 0
-                    channel_data['avgDailyRevenueUSD'] = 0
-                    channel_data['avgDailySessions'] = 0
-            
-            # Sort channels by total revenue
-            sorted_channels = sorted(channel_totals.values(), key=lambda x: x['totalRevenueUSD'], reverse=True)
+            series = self._revenue_time_series(columns, "sessionDefaultChannelGrouping", 'channel', usd_per_unit)
             
             return {
                 'propertyId': property_id,
@@ -2165,21 +1913,15 @@ class GA4Manager:
                     'original_currency': property_currency,
                     'exchange_rates': currency_rates
                 },
-                'time_series': time_series_list,
-                'channel_summary': sorted_channels,
-                'channels_found': list(all_channels),
+                'time_series': series['time_series'],
+                'channel_summary': series['summary'],
+                'channels_found': series['groups_found'],
                 'date_range': {
                     'start_date': start_date_str,
                     'end_date': end_date_str,
-                    'total_days': len(time_series_list)
+                    'total_days': len(series['time_series'])
                 },
-                'totals': {
-                    'total_revenue': sum(day['total_revenue'] for day in time_series_list),
-                    'total_revenue_usd': sum(day['total_revenue_usd'] for day in time_series_list),
-                    'total_sessions': sum(day['total_sessions'] for day in time_series_list),
-                    'total_users': sum(day['total_users'] for day in time_series_list),
-                    'total_conversions': sum(day['total_conversions'] for day in time_series_list)
-                }
+                'totals': series['totals']
             }
             
         except Exception as e:
@@ -2205,59 +1947,43 @@ class GA4Manager:
             }
 
     def get_specific_channels_time_series(self, property_id: str, channels: List[str], period: str = "30d") -> Dict[str, Any]:
-        """Get time series data for specific channels only"""
+        """Get time series data for specific channels only, sliced from the cached series or filtered by GA4"""
         try:
-            # Get full time series data
-            full_data = self.get_channel_revenue_time_series(property_id, period)
-            
-            if 'error' in full_data:
-                return full_data
-            
-            # Filter for specific channels
-            filtered_time_series = []
-            for day_data in full_data['time_series']:
-                filtered_day = {
-                    'date': day_data['date'],
-                    'channels': {},
-                    'total_revenue': 0,
-                    'total_revenue_usd': 0,
-                    'total_sessions': 0,
-                    'total_users': 0,
-                    'total_conversions': 0
-                }
-                
-                for channel in channels:
-                    if channel in day_data['channels']:
-                        channel_data = day_data['channels'][channel]
-                        filtered_day['channels'][channel] = channel_data
-                        filtered_day['total_revenue'] += channel_data['totalRevenue']
-                        filtered_day['total_revenue_usd'] += channel_data['totalRevenueUSD']
-                        filtered_day['total_sessions'] += channel_data['sessions']
-                        filtered_day['total_users'] += channel_data['users']
-                        filtered_day['total_conversions'] += channel_data['conversions']
-                
-                # Recalculate percentages based on filtered data
-                for channel_data in filtered_day['channels'].values():
-                    channel_data['revenuePercentage'] = (
-                        (channel_data['totalRevenue'] / filtered_day['total_revenue'] * 100)
-                        if filtered_day['total_revenue'] > 0 else 0
-                    )
-                
-                filtered_time_series.append(filtered_day)
+            start_date_str, end_date_str = self.get_date_range(period)
             
-            # Filter channel summary
-            filtered_summary = [
-                channel for channel in full_data['channel_summary']
-                if channel['channel'] in channels
-            ]
+            cached = report_cube.peek(self.user_email, property_id, start_date_str, end_date_str, 'revenue_time_series_by_channel')
+            if cached is not None:
+                columns = cached.take(np.isin(cached['sessionDefaultChannelGrouping'], channels))
+            else:
+                request = self._channel_revenue_time_series_request(property_id, start_date_str, end_date_str, channels)
+                columns = ReportColumns.from_response(self.client.run_report(request))
+            
+            property_currency = self.get_property_currency_enhanced(property_id)
+            currency_rates = self.get_currency_rates()
+            usd_per_unit = self.convert_to_usd(1.0, property_currency, currency_rates)
+            
+            # Shares and totals cover the requested channels only
+            series = self._revenue_time_series(columns, "sessionDefaultChannelGrouping", 'channel', usd_per_unit)
+            found = set(series['groups_found'])
             
             return {
-                **full_data,
-                'time_series': filtered_time_series,
-                'channel_summary': filtered_summary,
-                'channels_found': [ch for ch in channels if ch in full_data['channels_found']],
+                'propertyId': property_id,
+                'period': period,
+                'currency_info': {
+                    'original_currency': property_currency,
+                    'exchange_rates': currency_rates
+                },
+                'time_series': series['time_series'],
+                'channel_summary': series['summary'],
+                'channels_found': [ch for ch in channels if ch in found],
+                'date_range': {
+                    'start_date': start_date_str,
+                    'end_date': end_date_str,
+                    'total_days': len(series['time_series'])
+                },
+                'totals': series['totals'],
                 'channels_requested': channels,
-                'channels_not_found': [ch for ch in channels if ch not in full_data['channels_found']]
+                'channels_not_found': [ch for ch in channels if ch not in found]
             }
             
         except Exception as e:
@@ -2286,144 +2012,14 @@ class GA4Manager:
             
             start_date_str, end_date_str = self.get_date_range(period, start_date, end_date)
             
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date_str, end_date=end_date_str)],
-                dimensions=[
-                    Dimension(name="date"),
-                    Dimension(name=group_dimension)
-                ],
-                metrics=[
-                    Metric(name="totalRevenue"),
-                    Metric(name="purchaseRevenue"),
-                    Metric(name="sessions"),
-                    Metric(name="totalUsers"),
-                    Metric(name="conversions")
-                ],
-                order_bys=[
-                    OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date")),
-                    OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalRevenue"), desc=True)
-                ]
-            )
-            
-            response = self.client.run_report(request)
+            columns = self.get_cube_columns(property_id, start_date_str, end_date_str, f"revenue_time_series_by_{breakdown_by}")
             
             # Get property currency for conversion
             property_currency = self.get_property_currency_enhanced(property_id)
             currency_rates = self.get_currency_rates()
+            usd_per_unit = self.convert_to_usd(1.0, property_currency, currency_rates)
             
-            # Organize data by date and group (e.g., source/device/location)
-            time_series_data = {}
-            group_totals = {}
-            date_totals = {}
-            all_groups = set()
-            
-            for row in response.rows:
-                date = row.dimension_values[0].value
-                group = row.dimension_values[1].value
-                total_revenue = self.safe_float(row.metric_values[0].value)
-                purchase_revenue = self.safe_float(row.metric_values[1].value)
-                sessions = self.safe_int(row.metric_values[2].value)
-                users = self.safe_int(row.metric_values[3].value)
-                conversions = self.safe_float(row.metric_values[4].value)
-                
-                # Convert revenue to USD
-                total_revenue_usd = self.convert_to_usd(total_revenue, property_currency, currency_rates)
-                purchase_revenue_usd = self.convert_to_usd(purchase_revenue, property_currency, currency_rates)
-                
-                # Track all groups
-                all_groups.add(group)
-                
-                # Initialize date if not exists
-                if date not in time_series_data:
-                    time_series_data[date] = {
-                        'date': date,
-                        'groups': {},
-                        'total_revenue': 0,
-                        'total_revenue_usd': 0,
-                        'total_sessions': 0,
-                        'total_users': 0,
-                        'total_conversions': 0
-                    }
-                
-                # Add group data for this date
-                time_series_data[date]['groups'][group] = {
-                    'group': group,
-                    'totalRevenue': total_revenue,
-                    'totalRevenueUSD': total_revenue_usd,
-                    'purchaseRevenue': purchase_revenue,
-                    'purchaseRevenueUSD': purchase_revenue_usd,
-                    'sessions': sessions,
-                    'users': users,
-                    'conversions': int(conversions)
-                }
-                
-                # Update date totals
-                time_series_data[date]['total_revenue'] += total_revenue
-                time_series_data[date]['total_revenue_usd'] += total_revenue_usd
-                time_series_data[date]['total_sessions'] += sessions
-                time_series_data[date]['total_users'] += users
-                time_series_data[date]['total_conversions'] += conversions
-                
-                # Update group totals
-                if group not in group_totals:
-                    group_totals[group] = {
-                        'group': group,
-                        'totalRevenue': 0,
-                        'totalRevenueUSD': 0,
-                        'totalSessions': 0,
-                        'totalUsers': 0,
-                        'totalConversions': 0,
-                        'days_active': 0
-                    }
-                
-                group_totals[group]['totalRevenue'] += total_revenue
-                group_totals[group]['totalRevenueUSD'] += total_revenue_usd
-                group_totals[group]['totalSessions'] += sessions
-                group_totals[group]['totalUsers'] += users
-                group_totals[group]['totalConversions'] += conversions
-                group_totals[group]['days_active'] += 1
-            
-            # Calculate percentages and fill missing group data for each date
-            for date_data in time_series_data.values():
-                # Fill missing groups with zero values
-                for group in all_groups:
-                    if group not in date_data['groups']:
-                        date_data['groups'][group] = {
-                            'group': group,
-                            'totalRevenue': 0,
-                            'totalRevenueUSD': 0,
-                            'purchaseRevenue': 0,
-                            'purchaseRevenueUSD': 0,
-                            'sessions': 0,
-                            'users': 0,
-                            'conversions': 0
-                        }
-                
-                # Calculate percentages for each group on this date
-                for group_data in date_data['groups'].values():
-                    group_data['revenuePercentage'] = (
-                        (group_data['totalRevenue'] / date_data['total_revenue'] * 100)
-                        if date_data['total_revenue'] > 0 else 0
-                    )
-            
-            # Convert to list format sorted by date
-            time_series_list = sorted(time_series_data.values(), key=lambda x: x['date'])
-            
-            # Calculate group averages
-            for group_data in group_totals.values():
-                days_active = group_data['days_active']
-                if days_active > 0:
-                    group_data['avgDailyRevenue'] = group_data['totalRevenue'] / days_active
-                    group_data['avgDailyRevenueUSD'] = group_data['totalRevenueUSD'] / days_active
-                    group_data['avgDailySessions'] = group_data['totalSessions'] / days_active
-                else:
-                    group_data['avgDailyRevenue'] = 0
-                    group_data['avgDailyRevenueUSD'] = 0
-                    group_data['avgDailySessions'] = 0
-            
-            # Sort groups by total revenue
-            sorted_groups = sorted(group_totals.values(), key=lambda x: x['totalRevenueUSD'], reverse=True)
+            series = self._revenue_time_series(columns, group_dimension, 'group', usd_per_unit)
             
             return {
                 'propertyId': property_id,
@@ -2433,21 +2029,15 @@ class GA4Manager:
                     'original_currency': property_currency,
                     'exchange_rates': currency_rates
                 },
-                'time_series': time_series_list,
-                'group_summary': sorted_groups,
-                'groups_found': list(all_groups),
+                'time_series': series['time_series'],
+                'group_summary': series['summary'],
+                'groups_found': series['groups_found'],
                 'date_range': {
-                    'start_date': start_date_str,  # ✅ Fixed: Use _str version
-                    'end_date': end_date_str,      # ✅ Fixed: Use _str version
-                    'total_days': len(time_series_list)
+                    'start_date': start_date_str,
+                    'end_date': end_date_str,
+                    'total_days': len(series['time_series'])
                 },
-                'totals': {
-                    'total_revenue': sum(day['total_revenue'] for day in time_series_list),
-                    'total_revenue_usd': sum(day['total_revenue_usd'] for day in time_series_list),
-                    'total_sessions': sum(day['total_sessions'] for day in time_series_list),
-                    'total_users': sum(day['total_users'] for day in time_series_list),
-                    'total_conversions': sum(day['total_conversions'] for day in time_series_list)
-                }
+                'totals': series['totals']
             }
             
         except Exception as e:
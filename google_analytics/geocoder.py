@@ -0,0 +1,406 @@
+"""
+Geocoder - offline city/country coordinates for audience insights
+
+Coordinates come from a GeoNames extract bundled at
+google_analytics/data/gazetteer.tsv.gz (cities with 15000+ inhabitants, with
+ASCII alternate names for cities above 100k, plus country names), loaded
+once into a compact array-backed index keyed by normalized names. Names the
+gazetteer does not know are resolved in the background through Nominatim,
+at most one request per second as its usage policy requires, and persisted
+to Mongo so each miss costs one network call per deployment rather than one
+per view.
+
+Regenerate the extract with (needs the geonamescache package):
+    python -m google_analytics.geocoder build
+"""
+
+import gzip
+import logging
+import os
+import queue
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_VALUES = {"", "(not set)", "unknown"}
+
+# GA4 country names that differ from the GeoNames ones after normalization
+COUNTRY_ALIASES = {
+    'turkiye': 'TR',
+    'myanmar burma': 'MM',
+    'cote divoire': 'CI',
+    'congo kinshasa': 'CD',
+    'congo brazzaville': 'CG',
+    'palestine': 'PS',
+    'cape verde': 'CV',
+    'vatican city': 'VA',
+    'timor leste': 'TL',
+    'macao': 'MO',
+    'macau': 'MO',
+    'hong kong sar china': 'HK',
+    'macao sar china': 'MO',
+    'us virgin islands': 'VI',
+    'st kitts and nevis': 'KN',
+    'st vincent and grenadines': 'VC',
+    'st pierre and miquelon': 'PM',
+    'st martin': 'MF',
+    'st barthelemy': 'BL',
+    'st helena': 'SH',
+    'united states of america': 'US',
+    'usa': 'US',
+    'uk': 'GB',
+    'caribbean netherlands': 'BQ',
+    'falkland islands islas malvinas': 'FK',
+}
+
+
+@lru_cache(maxsize=8192)
+def normalize_name(value: str) -> str:
+    """Accent-, case- and punctuation-insensitive form of a place name"""
+    value = unicodedata.normalize('NFKD', value or '')
+    value = ''.join(char for char in value if not unicodedata.combining(char))
+    value = value.casefold().replace('&', ' and ')
+    value = re.sub(r"['’`.]", '', value)
+    value = re.sub(r'\bsaint\b', 'st', value)
+    value = re.sub(r'[^0-9a-z]+', ' ', value)
+    return value.strip()
+
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'gazetteer.tsv.gz')
+
+
+def build_gazetteer_file(path: str = GAZETTEER_PATH, min_city_population: int = 15000, alternate_names_population: int = 100000):
+    """
+    Write the bundled gazetteer from the GeoNames data in geonamescache.
+
+    Records are tab-separated, names already normalized:
+        C <country code> <name|alias|...>
+        P <country code> <latitude> <longitude> <population> <name|alternate|...>
+    """
+    import geonamescache
+
+    gazetteer = geonamescache.GeonamesCache(min_city_population=min_city_population)
+    lines = []
+    country_names: Dict[str, set] = {}
+    for code, country in gazetteer.get_countries().items():
+        country_names.setdefault(code, set()).update({normalize_name(country['name']), code.lower()})
+    for alias, code in COUNTRY_ALIASES.items():
+        country_names.setdefault(code, set()).add(alias)
+    for code in sorted(country_names):
+        lines.append(f"C\t{code}\t{'|'.join(sorted(name for name in country_names[code] if name))}")
+
+    cities = sorted(gazetteer.get_cities().values(), key=lambda city: -int(city.get('population') or 0))
+    for city in cities:
+        population = int(city.get('population') or 0)
+        names = [normalize_name(city['name'])]
+        if population >= alternate_names_population:
+            names.extend(
+                normalize_name(name) for name in city.get('alternatenames') or []
+                if name.isascii()
+            )
+        names = list(dict.fromkeys(name for name in names if name))
+        if not names:
+            continue
+        lines.append(
+            f"P\t{city['countrycode']}\t{float(city['latitude']):.5f}\t{float(city['longitude']):.5f}"
+            f"\t{population}\t{'|'.join(names)}"
+        )
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8', compresslevel=9) as f:
+        f.write('\n'.join(lines) + '\n')
+    logger.info(f"Wrote {len(lines)} gazetteer records to {path}")
+
+
+class GazetteerIndex:
+    """
+    Array-backed city index.
+
+    Latitudes and longitudes live in typed arrays; two dicts map (normalized
+    name, country code) and normalized name alone to the row of the most
+    populous matching place (rows are stored by descending population, so
+    the first row seen for a name wins). Countries are located at the
+    population-weighted centre of their cities.
+    """
+
+    def __init__(self):
+        self.latitudes = array('d')
+        self.longitudes = array('d')
+        self.by_name_country: Dict[Tuple[str, str], int] = {}
+        self.by_name: Dict[str, int] = {}
+        self.country_codes: Dict[str, str] = {}
+        self.country_coordinates: Dict[str, Tuple[float, float]] = {}
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> "GazetteerIndex":
+        started = time.perf_counter()
+        index = cls()
+        weighted: Dict[str, list] = {}
+
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                fields = line.rstrip('\n').split('\t')
+                if fields[0] == 'C':
+                    for name in fields[2].split('|'):
+                        index.country_codes[name] = fields[1]
+                    continue
+
+                _, country_code, latitude, longitude, population, names = fields
+                latitude, longitude, weight = float(latitude), float(longitude), max(int(population), 1)
+                row = len(index.latitudes)
+                index.latitudes.append(latitude)
+                index.longitudes.append(longitude)
+                for name in names.split('|'):
+                    index.by_name_country.setdefault((name, country_code), row)
+                    index.by_name.setdefault(name, row)
+
+                totals = weighted.setdefault(country_code, [0.0, 0.0, 0])
+                totals[0] += latitude * weight
+                totals[1] += longitude * weight
+                totals[2] += weight
+
+        for code, (latitude_sum, longitude_sum, weight) in weighted.items():
+            index.country_coordinates[code] = (round(latitude_sum / weight, 5), round(longitude_sum / weight, 5))
+
+        logger.info(
+            f"🗺️ Gazetteer index loaded: {len(index.latitudes)} places, "
+            f"{len(index.by_name)} names in {time.perf_counter() - started:.2f}s"
+        )
+        return index
+
+    def country_code(self, country: str) -> Optional[str]:
+        return self.country_codes.get(normalize_name(country))
+
+    def lookup(self, city: str, country: str) -> Optional[Tuple[float, float]]:
+        """Coordinates of a city (or of the country when no city is given), None if unknown"""
+        code = self.country_code(country) if country not in UNKNOWN_VALUES else None
+        city_known = city not in UNKNOWN_VALUES and city != country
+
+        if city_known:
+            name = normalize_name(city)
+            row = self.by_name_country.get((name, code)) if code else self.by_name.get(name)
+            if row is not None:
+                return self.latitudes[row], self.longitudes[row]
+            return None
+
+        if code:
+            return self.country_coordinates.get(code)
+        # A lone location name may itself be a country
+        code = self.country_code(city) if city not in UNKNOWN_VALUES else None
+        return self.country_coordinates.get(code) if code else None
+
+
+class Geocoder:
+    """Gazetteer lookups with a persistent, background-filled cache for misses"""
+
+    COLLECTION = "geocode_cache"
+    NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+    USER_AGENT = "Marketing-Dashboard/1.0"
+    # Nominatim usage policy: no more than one request per second
+    NOMINATIM_INTERVAL = 1.0
+    # Names Nominatim could not resolve are retried after this long
+    NOT_FOUND_RETRY = timedelta(days=30)
+    STORE_RETRY_INTERVAL = 60
+    # Resolved misses kept in memory, least recently used dropped beyond this
+    MISS_CACHE_MAX_ENTRIES = 20000
+
+    def __init__(self):
+        self._index: Optional[GazetteerIndex] = None
+        self._index_lock = threading.Lock()
+        self._misses: "OrderedDict[str, Optional[Tuple[float, float]]]" = OrderedDict()
+        self._pending = set()
+        self._queue: "queue.Queue[Tuple[str, str, str]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._collection = None
+        self._store_failed_at = 0.0
+
+    @property
+    def index(self) -> GazetteerIndex:
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    self._index = GazetteerIndex.load()
+        return self._index
+
+    def warm(self):
+        """Load the gazetteer ahead of the first request (e.g. at startup)"""
+        return self.index
+
+    def get_coordinates(self, city: str, country: str) -> Tuple[float, float]:
+        """(latitude, longitude) of a GA4 city/country pair, see get_coordinates_many"""
+        return self.get_coordinates_many([(city, country)])[0]
+
+    def get_coordinates_many(self, places: Sequence[Tuple[str, str]]) -> List[Tuple[float, float]]:
+        """
+        (latitude, longitude) of GA4 city/country pairs without blocking on
+        the network for lookups. Unknown names return the country's
+        coordinates (or 0, 0) until the background lookup has filled the
+        persistent cache; the misses of one call are read from Mongo with a
+        single query.
+        """
+        results: List[Optional[Tuple[float, float]]] = []
+        unresolved: Dict[str, List[int]] = {}
+        names: Dict[str, Tuple[str, str]] = {}
+        for position, (city, country) in enumerate(places):
+            coordinates = self.index.lookup(city, country)
+            # Nothing to look up when GA4 knows neither name
+            if coordinates is None and (city or "") in UNKNOWN_VALUES and (country or "") in UNKNOWN_VALUES:
+                coordinates = (0.0, 0.0)
+            results.append(coordinates)
+            if coordinates is None:
+                key = f"{normalize_name(city)}|{self.index.country_code(country) or normalize_name(country)}"
+                unresolved.setdefault(key, []).append(position)
+                names[key] = (city, country)
+
+        if unresolved:
+            cached = self._cached_misses(list(unresolved))
+            for key, positions in unresolved.items():
+                city, country = names[key]
+                if key in cached:
+                    coordinates = cached[key]
+                else:
+                    self._enqueue(key, city, country)
+                    coordinates = None
+                for position in positions:
+                    results[position] = coordinates or self.index.lookup("(not set)", country) or (0.0, 0.0)
+        return results
+
+    def _cached_misses(self, keys: List[str]) -> Dict[str, Optional[Tuple[float, float]]]:
+        """
+        Known misses among keys, from memory or one Mongo query; coordinates
+        None means not resolvable. Keys already queued are left out without
+        reading Mongo.
+        """
+        known: Dict[str, Optional[Tuple[float, float]]] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._misses:
+                    self._misses.move_to_end(key)
+                    known[key] = self._misses[key]
+            lookup = [key for key in keys if key not in known and key not in self._pending]
+        if not lookup:
+            return known
+
+        collection = self._get_collection()
+        if collection is None:
+            return known
+        try:
+            docs = list(collection.find({'_id': {'$in': lookup}}))
+        except Exception as e:
+            logger.warning(f"Geocode cache lookup failed for {len(lookup)} places: {e}")
+            return known
+
+        now = datetime.utcnow()
+        for doc in docs:
+            if doc.get('latitude') is None and now - doc['resolved_at'] > self.NOT_FOUND_RETRY:
+                continue
+            coordinates = (doc['latitude'], doc['longitude']) if doc.get('latitude') is not None else None
+            self._remember_in_memory(doc['_id'], coordinates)
+            known[doc['_id']] = coordinates
+        return known
+
+    def _enqueue(self, key: str, city: str, country: str):
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._resolve_loop, name="geocoder-misses", daemon=True)
+                self._worker.start()
+        self._queue.put((key, city, country))
+
+    def _resolve_loop(self):
+        while True:
+            key, city, country = self._queue.get()
+            started = time.time()
+            try:
+                coordinates = self._nominatim(city, country)
+                self._remember(key, coordinates)
+            except Exception as e:
+                # Leave it uncached so the next view queues it again
+                logger.warning(f"Geocoding failed for {city}, {country}: {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+            time.sleep(max(self.NOMINATIM_INTERVAL - (time.time() - started), 0))
+
+    def _nominatim(self, city: str, country: str) -> Optional[Tuple[float, float]]:
+        if country in UNKNOWN_VALUES or city == country:
+            query = city
+        else:
+            query = f"{city}, {country}"
+        response = requests.get(
+            self.NOMINATIM_URL,
+            params={'q': query, 'format': 'json', 'limit': 1},
+            headers={'User-Agent': self.USER_AGENT},
+            timeout=5
+        )
+        response.raise_for_status()
+        data = response.json()
+        return (float(data[0]['lat']), float(data[0]['lon'])) if data else None
+
+    def _remember(self, key: str, coordinates: Optional[Tuple[float, float]]):
+        self._remember_in_memory(key, coordinates)
+        collection = self._get_collection()
+        if collection is None:
+            return
+        try:
+            collection.update_one({'_id': key}, {'$set': {
+                'latitude': coordinates[0] if coordinates else None,
+                'longitude': coordinates[1] if coordinates else None,
+                'source': 'nominatim',
+                'resolved_at': datetime.utcnow()
+            }}, upsert=True)
+        except Exception as e:
+            logger.warning(f"Could not store geocode for {key}: {e}")
+
+    def _remember_in_memory(self, key: str, coordinates: Optional[Tuple[float, float]]):
+        with self._lock:
+            self._misses[key] = coordinates
+            self._misses.move_to_end(key)
+            while len(self._misses) > self.MISS_CACHE_MAX_ENTRIES:
+                self._misses.popitem(last=False)
+
+    def _get_collection(self):
+        """Mongo collection, or None while MongoDB is unreachable (memory only)"""
+        if self._collection is not None:
+            return self._collection
+        with self._lock:
+            if self._collection is not None:
+                return self._collection
+            if time.time() - self._store_failed_at < self.STORE_RETRY_INTERVAL:
+                return None
+            try:
+                from database.mongo_manager import mongo_manager
+                db = mongo_manager.get_sync_db()
+                db.command('ping')
+                self._collection = db[self.COLLECTION]
+            except Exception as e:
+                logger.warning(f"Geocode cache store unavailable, caching in memory only: {e}")
+                self._store_failed_at = time.time()
+                return None
+            return self._collection
+
+
+geocoder = Geocoder()
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    if sys.argv[1:] == ['build']:
+        build_gazetteer_file()
+    else:
+        print("Usage: python -m google_analytics.geocoder build")
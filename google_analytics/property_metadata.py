@@ -0,0 +1,134 @@
+"""
+GA4 Property Metadata - shared cache of property currency, time zone and name
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from pymongo import ASCENDING, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+
+class PropertyMetadataCache:
+    """
+    Property metadata shared across requests and users.
+
+    GA4Manager instances live for one request, so the old per-instance cache
+    never hit and every revenue call paid an Admin API round trip for the
+    property currency. Entries now sit in an in-process LRU backed by a Mongo
+    collection, both expiring after TTL. get_user_properties fills the cache
+    for every listed property at once, since properties.list already returns
+    currency and time zone.
+    """
+
+    COLLECTION = "ga4_property_metadata"
+    TTL = timedelta(hours=24)
+    MAX_MEMORY_ENTRIES = 2000
+    STORE_RETRY_INTERVAL = 60
+
+    def __init__(self):
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._collection = None
+        self._store_failed_at = 0.0
+        self._stats = {'memory_hits': 0, 'store_hits': 0, 'misses': 0, 'writes': 0}
+
+    def get(self, property_id: str) -> Optional[Dict[str, Any]]:
+        """Cached metadata of a property, or None when unknown or expired"""
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._memory.get(property_id)
+            if entry and now - entry['cached_at'] < self.TTL:
+                self._memory.move_to_end(property_id)
+                self._stats['memory_hits'] += 1
+                return entry['data']
+            if entry:
+                del self._memory[property_id]
+
+        collection = self._get_collection()
+        if collection is not None:
+            try:
+                doc = collection.find_one({'_id': property_id, 'cached_at': {'$gte': now - self.TTL}})
+            except Exception as e:
+                logger.warning(f"Property metadata lookup failed for {property_id}: {e}")
+                doc = None
+            if doc:
+                self._remember(property_id, doc['data'], doc['cached_at'])
+                with self._lock:
+                    self._stats['store_hits'] += 1
+                return doc['data']
+
+        with self._lock:
+            self._stats['misses'] += 1
+        return None
+
+    def put(self, property_id: str, data: Dict[str, Any]):
+        self.put_many({property_id: data})
+
+    def put_many(self, properties: Dict[str, Dict[str, Any]]):
+        """Cache metadata for several properties with a single Mongo write"""
+        if not properties:
+            return
+        now = datetime.utcnow()
+        for property_id, data in properties.items():
+            self._remember(property_id, data, now)
+
+        collection = self._get_collection()
+        if collection is not None:
+            try:
+                collection.bulk_write([
+                    UpdateOne({'_id': property_id}, {'$set': {'data': data, 'cached_at': now}}, upsert=True)
+                    for property_id, data in properties.items()
+                ], ordered=False)
+            except Exception as e:
+                logger.warning(f"Could not store property metadata: {e}")
+
+        with self._lock:
+            self._stats['writes'] += len(properties)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'memory_size': len(self._memory)}
+
+    def _remember(self, property_id: str, data: Dict[str, Any], cached_at: datetime):
+        with self._lock:
+            self._memory[property_id] = {'data': data, 'cached_at': cached_at}
+            self._memory.move_to_end(property_id)
+            while len(self._memory) > self.MAX_MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _get_collection(self):
+        """Mongo collection, or None while MongoDB is unreachable (memory only)"""
+        if self._collection is not None:
+            return self._collection
+        with self._lock:
+            if self._collection is not None:
+                return self._collection
+            if time.time() - self._store_failed_at < self.STORE_RETRY_INTERVAL:
+                return None
+            try:
+                from database.mongo_manager import mongo_manager
+                db = mongo_manager.get_sync_db()
+                db.command('ping')
+                collection = db[self.COLLECTION]
+                try:
+                    collection.create_index(
+                        [('cached_at', ASCENDING)],
+                        expireAfterSeconds=int(self.TTL.total_seconds())
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not create property metadata TTL index: {e}")
+                self._collection = collection
+            except Exception as e:
+                logger.warning(f"Property metadata store unavailable, caching in memory only: {e}")
+                self._store_failed_at = time.time()
+                return None
+            return self._collection
+
+
+property_metadata_cache = PropertyMetadataCache()
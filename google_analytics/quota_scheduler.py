@@ -0,0 +1,277 @@
+"""
+GA4 Quota Scheduler - per-property admission, prioritisation and backoff for GA4 Data API calls
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from google.api_core.exceptions import ResourceExhausted
+
+logger = logging.getLogger(__name__)
+
+# Call priorities, most urgent first
+INTERACTIVE = 0
+CHAT = 1
+PREFETCH = 2
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', CHAT: 'chat', PREFETCH: 'prefetch'}
+
+_request_priority: ContextVar[int] = ContextVar('ga4_request_priority', default=INTERACTIVE)
+_quota_outcome: ContextVar[Optional[Dict[str, bool]]] = ContextVar('ga4_quota_outcome', default=None)
+
+
+@contextmanager
+def ga4_priority(priority: int):
+    """Run GA4 calls made inside the block (in this context) at the given priority"""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+@contextmanager
+def quota_outcome_scope():
+    """
+    Record whether any GA4 call inside the block was refused for quota, so
+    the caller can serve stored data instead of a partial result.
+    """
+    outcome = {'refused': False}
+    token = _quota_outcome.set(outcome)
+    try:
+        yield outcome
+    finally:
+        _quota_outcome.reset(token)
+
+
+class QuotaLimitedError(Exception):
+    """A GA4 call was not sent to protect the property's remaining quota"""
+
+
+class GA4QuotaScheduler:
+    """
+    Admission control for GA4 Data API calls, per property.
+
+    Every report asks GA4 for the property's quota status, so the scheduler
+    knows the tokens left in the hourly, per-project-hourly and daily
+    buckets. A call is only sent while the bucket keeps the reserve of its
+    priority: chat and prefetch calls stop well before dashboards would,
+    leaving the rest for interactive use. Concurrent calls per property are
+    capped, with waiting calls admitted most urgent first. A
+    RESOURCE_EXHAUSTED answer pauses the property with exponential backoff.
+    Refused calls raise QuotaLimitedError, and the request is marked so
+    cached data can be served instead.
+
+    Routes run GA4Manager work through asyncio.to_thread, which copies the
+    priority and quota outcome context, so calls from concurrent requests
+    reach the scheduler together and waiting for a slot never blocks the
+    event loop.
+    """
+
+    # GA4 allows 10 concurrent requests per standard property; leave headroom
+    # and keep slots free for more urgent calls (indexed by priority)
+    MAX_CONCURRENT = (5, 3, 2)
+    # Longest a call waits for a slot before it is refused
+    QUEUE_TIMEOUT = 30
+
+    # Tokens that must remain in a bucket for a call of each priority to be
+    # sent, sized against standard property limits (40k per hour, 14k per
+    # project per hour, 200k per day)
+    RESERVE_TOKENS = {
+        'tokens_per_hour': (50, 8000, 16000),
+        'tokens_per_project_per_hour': (50, 3000, 6000),
+        'tokens_per_day': (100, 30000, 60000),
+    }
+    # Buckets refill over time; older quota readings are not trusted
+    QUOTA_INFO_MAX_AGE = 900
+
+    BACKOFF_INITIAL = 60
+    BACKOFF_MAX = 900
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._properties: Dict[str, Dict[str, Any]] = {}
+        self._sequence = itertools.count()
+        self._stats = {'calls': 0, 'refused': 0, 'exhausted': 0, 'queued': 0}
+
+    def call(self, property_id: str, send: Callable[[], Any], priority: int = None):
+        """
+        Send a GA4 call for a property once admitted, and learn from the
+        quota status of its response.
+        """
+        if priority is None:
+            priority = _request_priority.get()
+        self._acquire(property_id, priority)
+        try:
+            response = send()
+        except ResourceExhausted as e:
+            self._record_exhausted(property_id)
+            self._mark_refused(priority)
+            raise QuotaLimitedError(f"GA4 quota exhausted for property {property_id}: {e}") from e
+        finally:
+            self._release(property_id)
+
+        self._record_response(property_id, response)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and per-property quota state for monitoring"""
+        now = time.time()
+        with self._condition:
+            return {
+                **self._stats,
+                'properties': {
+                    property_id: {
+                        'active': state['active'],
+                        'waiting': len(state['waiting']),
+                        'remaining': dict(state['remaining']),
+                        'quota_age': round(now - state['quota_at']) if state['quota_at'] else None,
+                        'blocked_for': max(0, round(state['blocked_until'] - now))
+                    }
+                    for property_id, state in self._properties.items()
+                }
+            }
+
+    def _state(self, property_id: str) -> Dict[str, Any]:
+        """Scheduling state of a property (caller holds the condition)"""
+        state = self._properties.get(property_id)
+        if state is None:
+            state = {
+                'active': 0,
+                'waiting': [],
+                'remaining': {},
+                'quota_at': 0.0,
+                'blocked_until': 0.0,
+                'backoff': 0
+            }
+            self._properties[property_id] = state
+        return state
+
+    def _acquire(self, property_id: str, priority: int):
+        with self._condition:
+            state = self._state(property_id)
+            self._check_budget(property_id, state, priority)
+
+            entry = (priority, next(self._sequence))
+            heapq.heappush(state['waiting'], entry)
+            deadline = time.time() + self.QUEUE_TIMEOUT
+            queued = False
+            try:
+                while state['waiting'][0] != entry or state['active'] >= self.MAX_CONCURRENT[priority]:
+                    if not queued:
+                        queued = True
+                        self._stats['queued'] += 1
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        self._refuse(priority)
+                        raise QuotaLimitedError(f"No GA4 request slot for property {property_id} within {self.QUEUE_TIMEOUT}s")
+                    self._condition.wait(remaining)
+            finally:
+                state['waiting'].remove(entry)
+                heapq.heapify(state['waiting'])
+                self._condition.notify_all()
+
+            state['active'] += 1
+            self._stats['calls'] += 1
+
+    def _release(self, property_id: str):
+        with self._condition:
+            self._properties[property_id]['active'] -= 1
+            self._condition.notify_all()
+
+    def _check_budget(self, property_id: str, state: Dict[str, Any], priority: int):
+        """Refuse the call if the property is paused or its quota is below the priority's reserve (caller holds the condition)"""
+        now = time.time()
+        if state['blocked_until'] > now:
+            self._refuse(priority)
+            raise QuotaLimitedError(
+                f"GA4 calls for property {property_id} paused for {round(state['blocked_until'] - now)}s after quota exhaustion"
+            )
+        if now - state['quota_at'] > self.QUOTA_INFO_MAX_AGE:
+            return
+        for bucket, reserves in self.RESERVE_TOKENS.items():
+            remaining = state['remaining'].get(bucket)
+            if remaining is not None and remaining < reserves[priority]:
+                self._refuse(priority)
+                raise QuotaLimitedError(
+                    f"GA4 {bucket} quota low for property {property_id} ({remaining} left), "
+                    f"holding back {PRIORITY_NAMES[priority]} calls"
+                )
+
+    def _refuse(self, priority: int):
+        self._stats['refused'] += 1
+        self._mark_refused(priority)
+
+    @staticmethod
+    def _mark_refused(priority: int):
+        # Prefetches are optional; skipping one does not degrade the response
+        outcome = _quota_outcome.get()
+        if outcome is not None and priority != PREFETCH:
+            outcome['refused'] = True
+
+    def _record_response(self, property_id: str, response):
+        """Keep the lowest remaining tokens reported by the response (or the reports of a batch)"""
+        quotas = [report.property_quota for report in response.reports] if hasattr(response, 'reports') else [response.property_quota]
+        remaining = {}
+        for quota in quotas:
+            for bucket in self.RESERVE_TOKENS:
+                status = getattr(quota, bucket, None)
+                if status is None or not (status.consumed or status.remaining):
+                    continue
+                remaining[bucket] = min(status.remaining, remaining.get(bucket, status.remaining))
+
+        with self._condition:
+            state = self._state(property_id)
+            state['backoff'] = 0
+            if remaining:
+                state['remaining'] = remaining
+                state['quota_at'] = time.time()
+
+    def _record_exhausted(self, property_id: str):
+        with self._condition:
+            state = self._state(property_id)
+            state['backoff'] = min(self.BACKOFF_MAX, state['backoff'] * 2 or self.BACKOFF_INITIAL)
+            state['blocked_until'] = time.time() + state['backoff']
+            self._stats['exhausted'] += 1
+        logger.warning(f"⏳ GA4 quota exhausted for property {property_id}, pausing calls for {state['backoff']}s")
+
+
+class ScheduledGA4Client:
+    """
+    BetaAnalyticsDataClient whose report calls request the property quota
+    status and go through the quota scheduler. Other attributes pass through.
+    """
+
+    def __init__(self, client, scheduler: GA4QuotaScheduler):
+        self._client = client
+        self._scheduler = scheduler
+
+    def run_report(self, request=None, **kwargs):
+        request.return_property_quota = True
+        return self._scheduler.call(
+            self._property_id(request.property),
+            lambda: self._client.run_report(request=request, **kwargs)
+        )
+
+    def batch_run_reports(self, request=None, **kwargs):
+        for report_request in request.requests:
+            report_request.return_property_quota = True
+        return self._scheduler.call(
+            self._property_id(request.property),
+            lambda: self._client.batch_run_reports(request=request, **kwargs)
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    @staticmethod
+    def _property_id(resource_name: str) -> str:
+        return resource_name.split('/')[-1]
+
+
+ga4_quota_scheduler = GA4QuotaScheduler()
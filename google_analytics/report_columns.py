@@ -0,0 +1,167 @@
+"""
+Report Columns - columnar decoding of GA4 report responses
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+def parse_metric_values(values: Sequence[str]) -> np.ndarray:
+    """
+    Parse GA4 metric strings into float64 in one vectorized pass.
+    Empty cells read as 0, like safe_float; a column containing anything
+    unparsable falls back to parsing cell by cell.
+    """
+    if not len(values):
+        return np.zeros(0, dtype=np.float64)
+    strings = np.array(values, dtype=str)
+    strings[strings == ''] = '0'
+    try:
+        return strings.astype(np.float64)
+    except ValueError:
+        return np.fromiter((_parse_cell(value) for value in values), dtype=np.float64, count=len(values))
+
+
+def _parse_cell(value: str) -> float:
+    try:
+        return float(value) if value else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def percent_of(values: np.ndarray, total) -> np.ndarray:
+    """values / total * 100, 0 wherever the total is not positive; total may be a scalar or an array"""
+    values = np.asarray(values, dtype=np.float64)
+    total = np.broadcast_to(np.asarray(total, dtype=np.float64), values.shape)
+    return safe_divide(values * 100, total)
+
+
+def safe_divide(numerator, denominator) -> np.ndarray:
+    """Element-wise numerator / denominator, 0 wherever the denominator is not positive"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.broadcast_to(np.asarray(denominator, dtype=np.float64), numerator.shape)
+    result = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def pivot_sum(row_codes: np.ndarray, column_codes: np.ndarray, shape: Tuple[int, int], weights: np.ndarray = None) -> np.ndarray:
+    """
+    Dense matrix of weights summed per (row code, column code) cell, zero
+    where no row falls; counts the rows per cell when weights is None.
+    """
+    flat = np.bincount(row_codes * shape[1] + column_codes, weights=weights, minlength=shape[0] * shape[1])
+    return flat.astype(np.float64).reshape(shape)
+
+
+def to_records(fields: Dict[str, Sequence]) -> List[Dict]:
+    """Turn equally long columns into a list of dicts with plain Python values"""
+    names = list(fields)
+    columns = [column.tolist() if isinstance(column, np.ndarray) else list(column) for column in fields.values()]
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+class ReportColumns:
+    """
+    A GA4 report held as named columns.
+
+    Dimension values become object arrays of str and every metric becomes a
+    float64 array, so report methods compute totals, shares and currency
+    conversion as array operations instead of walking proto-plus rows (each
+    row.metric_values[i].value access builds wrapper objects). Rows keep the
+    order of the response.
+    """
+
+    def __init__(self, dimensions: Dict[str, np.ndarray], metrics: Dict[str, np.ndarray]):
+        self.dimensions = dimensions
+        self.metrics = metrics
+
+    @classmethod
+    def from_response(cls, response) -> "ReportColumns":
+        """Decode a RunReportResponse"""
+        raw = type(response).pb(response) if hasattr(type(response), 'pb') else response
+        dimension_names = [header.name for header in raw.dimension_headers]
+        metric_names = [header.name for header in raw.metric_headers]
+        rows = raw.rows
+
+        dimensions = {
+            name: np.array([row.dimension_values[index].value for row in rows], dtype=object)
+            for index, name in enumerate(dimension_names)
+        }
+        metrics = {
+            name: parse_metric_values([row.metric_values[index].value for row in rows])
+            for index, name in enumerate(metric_names)
+        }
+        return cls(dimensions, metrics)
+
+    def __len__(self) -> int:
+        for column in (*self.dimensions.values(), *self.metrics.values()):
+            return len(column)
+        return 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name in self.dimensions:
+            return self.dimensions[name]
+        return self.metrics[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.dimensions or name in self.metrics
+
+    def integers(self, name: str) -> np.ndarray:
+        """Metric truncated to int64, like safe_int"""
+        return self.metrics[name].astype(np.int64)
+
+    def take(self, rows) -> "ReportColumns":
+        """Subset of the rows, selected by a boolean mask or index array"""
+        return ReportColumns(
+            {name: column[rows] for name, column in self.dimensions.items()},
+            {name: column[rows] for name, column in self.metrics.items()}
+        )
+
+    def top(self, metric: str, limit: int = None) -> "ReportColumns":
+        """Rows by descending metric value (stable on ties), the first `limit` of them if given"""
+        order = np.argsort(-self.metrics[metric], kind='stable')
+        return self.take(order[:limit] if limit is not None else order)
+
+    def factorize(self, name: str, sort: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distinct values of a dimension and each row's index into them.
+        Values are in order of first appearance unless sort is set.
+        """
+        column = self.dimensions[name]
+        if not len(column):
+            return np.array([], dtype=object), np.zeros(0, dtype=np.int64)
+        uniques, first_rows, codes = np.unique(column, return_index=True, return_inverse=True)
+        if sort:
+            return uniques, codes.ravel()
+        order = np.argsort(first_rows, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        return uniques[order], rank[codes.ravel()]
+
+    def group_codes(self, by: Sequence[str]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Distinct combinations of the `by` dimensions (first appearance order) and each row's group index"""
+        if not by:
+            return {}, np.zeros(len(self), dtype=np.int64)
+        combined = np.zeros(len(self), dtype=np.int64)
+        for name in by:
+            uniques, codes = self.factorize(name)
+            combined = combined * len(uniques) + codes
+        _, first_rows, group_index = np.unique(combined, return_index=True, return_inverse=True)
+        order = np.argsort(first_rows, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        keys = {name: self.dimensions[name][first_rows[order]] for name in by}
+        return keys, rank[group_index.ravel()]
+
+    def group_sum(self, by: Sequence[str], metrics: Sequence[str] = None) -> "ReportColumns":
+        """Sum metrics (all of them by default) per distinct combination of the `by` dimensions"""
+        keys, codes = self.group_codes(by)
+        group_count = len(next(iter(keys.values()))) if keys else int(len(self) > 0)
+        names = list(metrics) if metrics is not None else list(self.metrics)
+        sums = {
+            name: np.bincount(codes, weights=self.metrics[name], minlength=group_count)
+            for name in names
+        }
+        return ReportColumns(keys, sums)
@@ -0,0 +1,309 @@
+"""
+Report Cube - planned, cached GA4 reports answering the dashboard routes by local roll-up
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from google.analytics.data_v1beta.types import (
+    RunReportRequest,
+    BatchRunReportsRequest,
+    DateRange,
+    Dimension,
+    Metric,
+    OrderBy
+)
+
+from google_analytics.quota_scheduler import PREFETCH, QuotaLimitedError, ga4_priority
+from google_analytics.report_columns import ReportColumns
+
+logger = logging.getLogger(__name__)
+
+REVENUE_METRICS = ('totalRevenue', 'purchaseRevenue', 'sessions', 'conversions')
+TIME_SERIES_METRICS = ('totalRevenue', 'purchaseRevenue', 'sessions', 'totalUsers', 'conversions')
+
+# (dimensions, metrics) of a query or of a planned report
+Spec = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+# Every query the cube answers, by name
+QUERIES: Dict[str, Spec] = {
+    'revenue_by_channel': (('sessionDefaultChannelGrouping',), REVENUE_METRICS + ('totalUsers', 'totalPurchasers')),
+    'revenue_by_source_medium': (('sessionSource', 'sessionMedium'), REVENUE_METRICS),
+    'revenue_by_device': (('deviceCategory',), REVENUE_METRICS + ('totalUsers',)),
+    'revenue_by_location': (('country', 'city'), ('totalRevenue', 'purchaseRevenue', 'sessions', 'totalUsers')),
+    'revenue_by_page': (('landingPage', 'pageTitle'), REVENUE_METRICS),
+    # bounceRate is derived from engagedSessions so the query stays additive
+    'channel_performance': (
+        ('sessionDefaultChannelGrouping',),
+        ('totalUsers', 'sessions', 'engagedSessions', 'userEngagementDuration', 'conversions', 'totalRevenue')
+    ),
+    'revenue_time_series_by_channel': (('date', 'sessionDefaultChannelGrouping'), TIME_SERIES_METRICS),
+    'revenue_time_series_by_source': (('date', 'sessionSource'), TIME_SERIES_METRICS),
+    'revenue_time_series_by_device': (('date', 'deviceCategory'), TIME_SERIES_METRICS),
+    'revenue_time_series_by_location': (('date', 'country'), TIME_SERIES_METRICS),
+}
+
+# Metrics whose value over a set of rows is the sum of the rows. Users,
+# purchasers and rates are not, so they are only ever read at the exact
+# dimensions they were reported at.
+ADDITIVE_METRICS = {
+    'totalRevenue', 'purchaseRevenue', 'sessions', 'engagedSessions', 'conversions',
+    'userEngagementDuration', 'screenPageViews', 'eventCount'
+}
+
+# GA4 Data API limits
+MAX_METRICS = 10
+MAX_BATCH_SIZE = 5
+MAX_ROWS = 250000
+
+
+def plan_reports(queries: Dict[str, Spec]) -> Tuple[List[Spec], Dict[str, Spec]]:
+    """
+    Merge queries into the fewest GA4 reports.
+
+    Queries over the same dimensions share one report with the union of
+    their metrics. A report whose metrics are all additive is then folded
+    into a report over a superset of its dimensions and answered by summing.
+
+    Returns the report specs and, for each query, the spec that answers it.
+    """
+    specs: List[Dict[str, Any]] = []
+    assignment: Dict[str, int] = {}
+
+    for name, (dimensions, metrics) in queries.items():
+        for index, spec in enumerate(specs):
+            merged = list(dict.fromkeys(spec['metrics'] + list(metrics)))
+            if set(spec['dimensions']) == set(dimensions) and len(merged) <= MAX_METRICS:
+                spec['metrics'] = merged
+                assignment[name] = index
+                break
+        else:
+            specs.append({'dimensions': list(dimensions), 'metrics': list(metrics)})
+            assignment[name] = len(specs) - 1
+
+    # Fold additive reports into wider ones, narrowest first
+    for index in sorted(range(len(specs)), key=lambda i: len(specs[i]['dimensions'])):
+        spec = specs[index]
+        if spec is None or not set(spec['metrics']) <= ADDITIVE_METRICS:
+            continue
+        for target_index, target in enumerate(specs):
+            if target is None or target_index == index:
+                continue
+            merged = list(dict.fromkeys(target['metrics'] + spec['metrics']))
+            if set(spec['dimensions']) < set(target['dimensions']) and len(merged) <= MAX_METRICS:
+                target['metrics'] = merged
+                specs[index] = None
+                for name, assigned in assignment.items():
+                    if assigned == index:
+                        assignment[name] = target_index
+                break
+
+    frozen = {
+        index: (tuple(spec['dimensions']), tuple(spec['metrics']))
+        for index, spec in enumerate(specs) if spec is not None
+    }
+    return list(frozen.values()), {name: frozen[index] for name, index in assignment.items()}
+
+
+class ReportCube:
+    """
+    Cache of planned GA4 reports per (user, property, date range).
+
+    The dashboard's revenue breakdowns, revenue time series and channel
+    performance used to run one report each over the same property and
+    range. The cube plans QUERIES into merged reports once. A miss fetches
+    the report answering the query, plus those of any sibling queries the
+    route names, in one batchRunReports call; every query sharing a fetched
+    report is then answered from memory by projecting or summing the cached
+    columns. Entries are kept per user so nobody reads a property through
+    another user's grant.
+
+    Expired entries stay until evicted by the LRU, and are served when quota
+    is too low to refresh them.
+    """
+
+    TTL = 600
+    MAX_ENTRIES = 200
+    # Also fetch the rest of the plan on a miss, as low-priority prefetches.
+    # GA4 bills every report of a batch separately, so this costs a single
+    # route view the quota of all planned reports (several of them date x
+    # dimension reports); only worth it when most routes are viewed together.
+    PREFETCH_PLAN = False
+
+    def __init__(self, queries: Dict[str, Spec] = QUERIES):
+        self.queries = queries
+        self.specs, self.query_specs = plan_reports(queries)
+
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Tuple, threading.Lock] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'reports_fetched': 0, 'batch_calls': 0}
+
+        logger.info(f"📦 Report cube planned {len(queries)} queries into {len(self.specs)} reports")
+
+    def get(self, client, user_email: str, property_id: str, start_date: str, end_date: str, query: str,
+            also: Sequence[str] = ()) -> ReportColumns:
+        """
+        Columns of a named query. On a miss the reports of the `also`
+        queries are fetched in the same batch.
+        """
+        spec = self.query_specs[query]
+        key = (user_email, property_id, start_date, end_date)
+
+        reports = self._fresh_reports(key)
+        hit = spec in reports
+        if not hit:
+            with self._build_lock(key):
+                # Another request may have fetched the plan while this one waited
+                reports = self._fresh_reports(key)
+                hit = spec in reports
+                if not hit:
+                    wanted = [self.query_specs[name] for name in also] + (self.specs if self.PREFETCH_PLAN else [])
+                    missing = [s for s in dict.fromkeys(wanted) if s not in reports and s != spec]
+                    try:
+                        reports = self._store(key, self._fetch(client, property_id, start_date, end_date, missing, spec))
+                    except QuotaLimitedError as e:
+                        reports = self._stale_reports(key)
+                        if spec not in reports:
+                            raise
+                        logger.warning(f"⏳ Serving expired report cube entry for {property_id}: {e}")
+
+        with self._lock:
+            self._stats['hits' if hit else 'misses'] += 1
+        return self._answer(reports[spec], query)
+
+    def peek(self, user_email: str, property_id: str, start_date: str, end_date: str, query: str) -> Optional[ReportColumns]:
+        """Columns of a named query if already cached, without fetching"""
+        reports = self._fresh_reports((user_email, property_id, start_date, end_date))
+        spec = self.query_specs[query]
+        return self._answer(reports[spec], query) if spec in reports else None
+
+    def evict(self, user_email: str):
+        """Drop a user's cached reports, e.g. after logout"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_email]:
+                del self._entries[key]
+                self._build_locks.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._build_locks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for monitoring and benchmarks"""
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries), 'planned_reports': len(self.specs)}
+
+    def _answer(self, columns: ReportColumns, query: str) -> ReportColumns:
+        """Roll a cached report up to the query's dimensions and metrics"""
+        dimensions, metrics = self.queries[query]
+        if not len(columns):
+            return ReportColumns(
+                {name: np.array([], dtype=object) for name in dimensions},
+                {name: np.zeros(0) for name in metrics}
+            )
+        if set(dimensions) == set(columns.dimensions):
+            return ReportColumns(
+                {name: columns.dimensions[name] for name in dimensions},
+                {name: columns.metrics[name] for name in metrics}
+            )
+        return columns.group_sum(dimensions, metrics)
+
+    def _fetch(self, client, property_id: str, start_date: str, end_date: str, specs: List[Spec], required: Spec) -> Dict[Spec, ReportColumns]:
+        """
+        Fetch reports through batchRunReports, the batch holding the required
+        report first and any further batches as prefetches. A failed batch
+        only costs its own reports; the required one is then retried alone
+        and its error raised if that fails too.
+        """
+        specs = [required] + [spec for spec in specs if spec != required]
+        fetched = {}
+        for offset in range(0, len(specs), MAX_BATCH_SIZE):
+            chunk = specs[offset:offset + MAX_BATCH_SIZE]
+            batch_request = BatchRunReportsRequest(
+                property=f"properties/{property_id}",
+                requests=[self._request(property_id, start_date, end_date, spec) for spec in chunk]
+            )
+            try:
+                if required in chunk:
+                    batch_response = client.batch_run_reports(batch_request)
+                else:
+                    with ga4_priority(PREFETCH):
+                        batch_response = client.batch_run_reports(batch_request)
+            except Exception as e:
+                logger.warning(f"Report cube batch failed for {property_id}: {e}")
+                continue
+            with self._lock:
+                self._stats['batch_calls'] += 1
+                self._stats['reports_fetched'] += len(chunk)
+            for spec, response in zip(chunk, batch_response.reports):
+                fetched[spec] = self._decode(property_id, spec, response)
+
+        if required not in fetched:
+            response = client.run_report(self._request(property_id, start_date, end_date, required))
+            with self._lock:
+                self._stats['reports_fetched'] += 1
+            fetched[required] = self._decode(property_id, required, response)
+        return fetched
+
+    def _request(self, property_id: str, start_date: str, end_date: str, spec: Spec) -> RunReportRequest:
+        dimensions, metrics = spec
+        # Largest revenue first, so a truncated report still holds the top rows
+        order_metric = 'totalRevenue' if 'totalRevenue' in metrics else metrics[0]
+        order_bys = [OrderBy(metric=OrderBy.MetricOrderBy(metric_name=order_metric), desc=True)]
+        if 'date' in dimensions:
+            order_bys.insert(0, OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date")))
+        return RunReportRequest(
+            property=f"properties/{property_id}",
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+            dimensions=[Dimension(name=name) for name in dimensions],
+            metrics=[Metric(name=name) for name in metrics],
+            order_bys=order_bys,
+            limit=MAX_ROWS
+        )
+
+    def _decode(self, property_id: str, spec: Spec, response) -> ReportColumns:
+        columns = ReportColumns.from_response(response)
+        if response.row_count > len(columns):
+            logger.warning(f"Report cube {spec[0]} for {property_id} truncated at {len(columns)} of {response.row_count} rows")
+        return columns
+
+    def _fresh_reports(self, key: Tuple) -> Dict[Spec, ReportColumns]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or time.time() - entry['fetched_at'] >= self.TTL:
+                return {}
+            self._entries.move_to_end(key)
+            return entry['reports']
+
+    def _stale_reports(self, key: Tuple) -> Dict[Spec, ReportColumns]:
+        """Cached reports regardless of age"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry['reports'] if entry else {}
+
+    def _store(self, key: Tuple, fetched: Dict[Spec, ReportColumns]) -> Dict[Spec, ReportColumns]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry['fetched_at'] < self.TTL:
+                entry['reports'] = {**entry['reports'], **fetched}
+            else:
+                entry = {'reports': fetched, 'fetched_at': time.time()}
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.MAX_ENTRIES:
+                oldest_key, _ = self._entries.popitem(last=False)
+                self._build_locks.pop(oldest_key, None)
+            return entry['reports']
+
+    def _build_lock(self, key: Tuple) -> threading.Lock:
+        with self._lock:
+            return self._build_locks.setdefault(key, threading.Lock())
+
+
+report_cube = ReportCube()
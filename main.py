@@ -212,6 +212,9 @@ async def startup_event():
     try:
         logger.info("Starting application and connecting to MongoDB...")
         await mongo_manager.connect()
+        currency_rate_cache.start()
+        # Gazetteer for audience map coordinates, loaded off the event loop
+        asyncio.get_running_loop().run_in_executor(None, geocoder.warm)
         logger.info("Application startup complete")
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB during startup: {e}")
@@ -222,6 +225,9 @@ async def shutdown_event():
     """Close MongoDB connection on shutdown"""
     try:
         logger.info("Shutting down application...")
+        meta_manager_pool.clear()
+        ga4_client_pool.clear()
+        ga4_admin_services.clear()
         await mongo_manager.close()
         logger.info("Application shutdown complete")
     except Exception as e:
@@ -231,9 +237,28 @@ async def shutdown_event():
 auth_manager = AuthManager()
 security = HTTPBearer()
 
+# Long-lived Meta clients, one per user (token, HTTP session, rate limiter, caches)
+from social.meta_pool import MetaManagerPool
+meta_manager_pool = MetaManagerPool(auth_manager)
+
+# Long-lived GA4 Data API clients, one gRPC channel per user
+from google_analytics.ga4_client_pool import GA4ClientPool
+ga4_client_pool = GA4ClientPool(auth_manager)
+
+# Analytics Admin API services built from the bundled discovery document
+from google_analytics.ga4_admin_services import AdminServiceCache
+from google_analytics.currency_rates import currency_rate_cache
+from google_analytics.geocoder import geocoder
+from google_analytics.report_cube import report_cube
+from google_analytics.quota_scheduler import quota_outcome_scope
+ga4_admin_services = AdminServiceCache(auth_manager)
+
 
 from functools import wraps
 
+# Oldest stored response served when GA4 calls were held back for quota
+QUOTA_FALLBACK_MAX_AGE_MINUTES = 7 * 24 * 60
+
 def save_response(endpoint_name: str, cache_minutes: int = 0):
     """
     Decorator to save endpoint responses and optionally cache them
@@ -274,8 +299,40 @@ def save_response(endpoint_name: str, cache_minutes: int = 0):
             elif not connection_healthy:
                 logger.warning(f"MongoDB connection unhealthy, skipping cache lookup for {endpoint_name}")
             
-            # Execute the original function
-            response_data = await func(*args, **kwargs)
+            # Execute the original function, noting GA4 calls refused for quota
+            with quota_outcome_scope() as quota:
+                try:
+                    response_data = await func(*args, **kwargs)
+                except Exception:
+                    if not quota['refused']:
+                        raise
+                    response_data = None
+
+            # Serve the last stored response rather than a failed or partial one
+            if quota['refused']:
+                stored_response = None
+                if connection_healthy:
+                    try:
+                        stored_response = await mongo_manager.get_cached_response(
+                            endpoint=endpoint_name,
+                            user_email=user_email,
+                            request_params=request_params,
+                            customer_id=customer_id,
+                            property_id=property_id,
+                            max_age_minutes=QUOTA_FALLBACK_MAX_AGE_MINUTES
+                        )
+                    except Exception as e:
+                        logger.warning(f"Stored response lookup failed for {endpoint_name}: {e}")
+                if stored_response:
+                    logger.warning(f"⏳ GA4 quota low, returning stored response for {endpoint_name}")
+                    return stored_response
+                if response_data is None:
+                    raise HTTPException(
+                        status_code=503,
+                        detail="Google Analytics quota is low for this property, please try again shortly"
+                    )
+                logger.warning(f"⏳ GA4 quota low, returning partial response for {endpoint_name} without saving it")
+                return response_data
 
             # Save/update in MongoDB only if connection is healthy
             if connection_healthy:
@@ -317,6 +374,10 @@ async def auth_callback(code: str, state: Optional[str] = None):
     try:
         result = await auth_manager.handle_callback(code, state)
         
+        # New Google grant - drop any pooled GA4 client holding the old one
+        ga4_client_pool.evict(result['user']['email'])
+        ga4_admin_services.evict(result['user']['email'])
+        
         # Get frontend URL based on environment
         frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")  # Default to dev URL
         
@@ -341,6 +402,9 @@ async def get_user_info(current_user: dict = Depends(get_current_user)):
 @app.post("/auth/logout")
 async def logout(current_user: dict = Depends(get_current_user)):
     """Logout user"""
+    ga4_client_pool.evict(current_user["email"])
+    ga4_admin_services.evict(current_user["email"])
+    report_cube.evict(current_user["email"])
     return await auth_manager.logout_user(current_user["email"])
 
 
@@ -600,7 +664,7 @@ async def get_ga_properties(current_user: dict = Depends(get_current_user)):
     """Get accessible GA4 properties"""
     try:
         ga4_manager = GA4Manager(current_user["email"])
-        properties = ga4_manager.get_user_properties()
+        properties = await asyncio.to_thread(ga4_manager.get_user_properties)
         return [GAProperty(**prop) for prop in properties]
     except Exception as e:
         logger.error(f"Error fetching GA properties: {e}")
@@ -621,7 +685,7 @@ async def get_ga_metrics(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        metrics = ga4_manager.get_metrics(property_id, period, start_date, end_date)
+        metrics = await asyncio.to_thread(ga4_manager.get_metrics, property_id, period, start_date, end_date)
         return GAMetrics(**metrics)
     except Exception as e:
         logger.error(f"Error fetching GA metrics: {e}")
@@ -642,7 +706,7 @@ async def get_ga_traffic_sources(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        sources = ga4_manager.get_traffic_sources(property_id, period, start_date, end_date)  # Pass dates
+        sources = await asyncio.to_thread(ga4_manager.get_traffic_sources, property_id, period, start_date, end_date)  # Pass dates
         return [GATrafficSource(**source) for source in sources]
     except Exception as e:
         logger.error(f"Error fetching traffic sources: {e}")
@@ -658,7 +722,7 @@ async def get_ga_top_pages(
     """Get GA4 top pages"""
     try:
         ga4_manager = GA4Manager(current_user["email"])
-        pages = ga4_manager.get_top_pages(property_id, period)
+        pages = await asyncio.to_thread(ga4_manager.get_top_pages, property_id, period)
         return [GAPageData(**page) for page in pages]
     except Exception as e:
         logger.error(f"Error fetching top pages: {e}")
@@ -679,7 +743,7 @@ async def get_ga_conversions(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        conversions = ga4_manager.get_conversions(property_id, period, start_date, end_date)
+        conversions = await asyncio.to_thread(ga4_manager.get_conversions, property_id, period, start_date, end_date)
         return [GAConversionData(**conv) for conv in conversions]
     except Exception as e:
         logger.error(f"Error fetching conversions: {e}")
@@ -706,7 +770,8 @@ async def generate_engagement_funnel_with_llm(
         
         ga4_manager = GA4Manager(current_user['email'])
         
-        funnel_data = ga4_manager.generate_engagement_funnel_with_llm(
+        funnel_data = await asyncio.to_thread(
+            ga4_manager.generate_engagement_funnel_with_llm,
             property_id=property_id,
             selected_event_names=request.selected_events,
             conversions_raw_data=request.conversions_data,
@@ -739,7 +804,7 @@ async def get_ga_channel_performance(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        channels = ga4_manager.get_channel_performance(property_id, period, start_date, end_date)
+        channels = await asyncio.to_thread(ga4_manager.get_channel_performance, property_id, period, start_date, end_date)
         return [GAChannelPerformance(**channel) for channel in channels]
     except Exception as e:
         logger.error(f"Error fetching channel performance: {e}")
@@ -761,7 +826,7 @@ async def get_ga_audience_insights(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        insights = ga4_manager.get_audience_insights(property_id,dimension, period, start_date, end_date)
+        insights = await asyncio.to_thread(ga4_manager.get_audience_insights, property_id,dimension, period, start_date, end_date)
         return [GAAudienceInsight(**insight) for insight in insights]
     except Exception as e:
         logger.error(f"Error fetching audience insights: {e}")
@@ -783,7 +848,7 @@ async def get_ga_time_series(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        time_series = ga4_manager.get_time_series(property_id, metric, period, start_date, end_date)
+        time_series = await asyncio.to_thread(ga4_manager.get_time_series, property_id, metric, period, start_date, end_date)
         return [GATimeSeriesData(**ts) for ts in time_series]
     except Exception as e:
         logger.error(f"Error fetching time series: {e}")
@@ -799,7 +864,7 @@ async def get_ga_trends(
     """Get GA4 trend data"""
     try:
         ga4_manager = GA4Manager(current_user["email"])
-        trends = ga4_manager.get_trends(property_id, period)
+        trends = await asyncio.to_thread(ga4_manager.get_trends, property_id, period)
         return [GATrendData(**trend) for trend in trends]
     except Exception as e:
         logger.error(f"Error fetching trends: {e}")
@@ -815,7 +880,7 @@ async def get_ga_roas_roi_time_series(
     """Get GA4 ROAS and ROI time series data"""
     try:
         ga4_manager = GA4Manager(current_user["email"])
-        time_series = ga4_manager.get_roas_roi_time_series(property_id, period)
+        time_series = await asyncio.to_thread(ga4_manager.get_roas_roi_time_series, property_id, period)
         return [GAROASROITimeSeriesData(**ts) for ts in time_series]
     except Exception as e:
         logger.error(f"Error fetching ROAS/ROI time series: {e}")
@@ -846,7 +911,7 @@ async def get_combined_overview(
         
         if ga_property_id:
             ga4_manager = GA4Manager(current_user["email"])
-            ga_metrics = ga4_manager.get_metrics(ga_property_id, period)
+            ga_metrics = await asyncio.to_thread(ga4_manager.get_metrics, ga_property_id, period)
             overview["analytics"] = {
                 "total_users": ga_metrics.get("totalUsers", 0),
                 "sessions": ga_metrics.get("sessions", 0),
@@ -884,7 +949,8 @@ async def get_enhanced_combined_roas_roi_metrics(
             raise HTTPException(status_code=400, detail="Maximum 10 Google Ads customer IDs allowed")
 
         ga4_manager = GA4Manager(current_user["email"])
-        metrics = ga4_manager.get_enhanced_combined_roas_roi_metrics(
+        metrics = await asyncio.to_thread(
+            ga4_manager.get_enhanced_combined_roas_roi_metrics,
             ga_property_id, 
             customer_ids_list,  # ✅ Pass the list, not the string
             period, 
@@ -911,7 +977,7 @@ async def get_combined_roas_roi_metrics_legacy(
     """Legacy endpoint - Get combined ROAS and ROI metrics from GA4 and Google Ads (single customer)"""
     try:
         ga4_manager = GA4Manager(current_user["email"])
-        metrics = ga4_manager.get_combined_roas_roi_metrics(ga_property_id, ads_customer_id, period)
+        metrics = await asyncio.to_thread(ga4_manager.get_combined_roas_roi_metrics, ga_property_id, ads_customer_id, period)
         return GACombinedROASROIMetrics(**metrics)
     except Exception as e:
         logger.error(f"Error fetching combined ROAS/ROI metrics: {e}")
@@ -932,7 +998,7 @@ async def get_revenue_breakdown_by_channel(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        breakdown = ga4_manager.get_revenue_breakdown_by_channel(property_id, period, start_date, end_date)
+        breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_channel, property_id, period, start_date, end_date)
         return ChannelRevenueBreakdown(**breakdown)
     except Exception as e:
         logger.error(f"Error fetching channel revenue breakdown: {e}")
@@ -954,7 +1020,7 @@ async def get_revenue_breakdown_by_source(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        breakdown = ga4_manager.get_revenue_breakdown_by_source_medium(property_id,limit, period, start_date, end_date)
+        breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_source_medium, property_id,limit, period, start_date, end_date)
         return SourceRevenueBreakdown(**breakdown)
     except Exception as e:
         logger.error(f"Error fetching source revenue breakdown: {e}")
@@ -975,7 +1041,7 @@ async def get_revenue_breakdown_by_device(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        breakdown = ga4_manager.get_revenue_breakdown_by_device(property_id, period, start_date, end_date)
+        breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_device, property_id, period, start_date, end_date)
         return DeviceRevenueBreakdown(**breakdown)
     except Exception as e:
         logger.error(f"Error fetching device revenue breakdown: {e}")
@@ -997,7 +1063,7 @@ async def get_revenue_breakdown_by_location(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        breakdown = ga4_manager.get_revenue_breakdown_by_location(property_id, limit,period, start_date, end_date)
+        breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_location, property_id, limit,period, start_date, end_date)
         return LocationRevenueBreakdown(**breakdown)
     except Exception as e:
         logger.error(f"Error fetching location revenue breakdown: {e}")
@@ -1019,7 +1085,7 @@ async def get_revenue_breakdown_by_page(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
        
         ga4_manager = GA4Manager(current_user["email"])
-        breakdown = ga4_manager.get_revenue_breakdown_by_page(property_id,limit, period, start_date, end_date)
+        breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_page, property_id,limit, period, start_date, end_date)
         return PageRevenueBreakdown(**breakdown)
     except Exception as e:
         logger.error(f"Error fetching page revenue breakdown: {e}")
@@ -1040,7 +1106,7 @@ async def get_comprehensive_revenue_breakdown(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        breakdown = ga4_manager.get_comprehensive_revenue_breakdown(property_id, period, start_date, end_date)
+        breakdown = await asyncio.to_thread(ga4_manager.get_comprehensive_revenue_breakdown, property_id, period, start_date, end_date)
         return ComprehensiveRevenueBreakdown(**breakdown)
     except Exception as e:
         logger.error(f"Error fetching comprehensive revenue breakdown: {e}")
@@ -1060,17 +1126,17 @@ async def get_revenue_breakdown_raw(
         ga4_manager = GA4Manager(current_user["email"])
         
         if breakdown_type == "channel":
-            breakdown = ga4_manager.get_revenue_breakdown_by_channel(property_id, period)
+            breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_channel, property_id, period)
         elif breakdown_type == "source":
-            breakdown = ga4_manager.get_revenue_breakdown_by_source_medium(property_id, period, limit)
+            breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_source_medium, property_id, period, limit)
         elif breakdown_type == "device":
-            breakdown = ga4_manager.get_revenue_breakdown_by_device(property_id, period)
+            breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_device, property_id, period)
         elif breakdown_type == "location":
-            breakdown = ga4_manager.get_revenue_breakdown_by_location(property_id, period, limit)
+            breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_location, property_id, period, limit)
         elif breakdown_type == "page":
-            breakdown = ga4_manager.get_revenue_breakdown_by_page(property_id, period, limit)
+            breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_page, property_id, period, limit)
         else:  # comprehensive
-            breakdown = ga4_manager.get_comprehensive_revenue_breakdown(property_id, period)
+            breakdown = await asyncio.to_thread(ga4_manager.get_comprehensive_revenue_breakdown, property_id, period)
         
         return breakdown
         
@@ -1093,7 +1159,7 @@ async def get_channel_revenue_time_series(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
         
         ga4_manager = GA4Manager(current_user["email"])
-        time_series = ga4_manager.get_channel_revenue_time_series(property_id, period, start_date, end_date)
+        time_series = await asyncio.to_thread(ga4_manager.get_channel_revenue_time_series, property_id, period, start_date, end_date)
         
         if 'error' in time_series:
             raise HTTPException(status_code=500, detail=time_series['error'])
@@ -1122,7 +1188,7 @@ async def get_specific_channels_time_series(
             raise HTTPException(status_code=400, detail="Maximum 20 channels allowed")
         
         ga4_manager = GA4Manager(current_user["email"])
-        time_series = ga4_manager.get_specific_channels_time_series(property_id, channels, period)
+        time_series = await asyncio.to_thread(ga4_manager.get_specific_channels_time_series, property_id, channels, period)
         
         if 'error' in time_series:
             raise HTTPException(status_code=500, detail=time_series['error'])
@@ -1146,7 +1212,7 @@ async def get_available_channels(
         ga4_manager = GA4Manager(current_user["email"])
         
         # Get channel breakdown to find available channels
-        breakdown = ga4_manager.get_revenue_breakdown_by_channel(property_id, period)
+        breakdown = await asyncio.to_thread(ga4_manager.get_revenue_breakdown_by_channel, property_id, period)
         
         channels = [
             {
@@ -1185,9 +1251,9 @@ async def get_channel_revenue_time_series_raw(
             channel_list = [ch.strip() for ch in channels.split(",") if ch.strip()]
             if len(channel_list) > 20:
                 raise HTTPException(status_code=400, detail="Maximum 20 channels allowed")
-            time_series = ga4_manager.get_specific_channels_time_series(property_id, channel_list, period)
+            time_series = await asyncio.to_thread(ga4_manager.get_specific_channels_time_series, property_id, channel_list, period)
         else:
-            time_series = ga4_manager.get_channel_revenue_time_series(property_id, period)
+            time_series = await asyncio.to_thread(ga4_manager.get_channel_revenue_time_series, property_id, period)
         
         return time_series
         
@@ -1214,7 +1280,7 @@ async def get_revenue_time_series(
             raise HTTPException(status_code=400, detail="start_date and end_date are required for custom period")
       
         ga4_manager = GA4Manager(current_user["email"])
-        time_series = ga4_manager.get_revenue_time_series(property_id, breakdown_by, period, start_date, end_date)
+        time_series = await asyncio.to_thread(ga4_manager.get_revenue_time_series, property_id, breakdown_by, period, start_date, end_date)
         
         if 'error' in time_series:
             raise HTTPException(status_code=500, detail=time_series['error'])
@@ -1337,7 +1403,10 @@ async def facebook_auth_callback(code: str, state: Optional[str] = None):
     try:
         result = await auth_manager.handle_facebook_callback(code, state)
         frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
-        
+
+        # New token issued - drop any pooled Meta client holding the old one
+        meta_manager_pool.evict(result['user']['email'])
+
         # Decode state to get source tab
         source_tab = 'meta_ads'  # default
         if state:
@@ -1403,10 +1472,9 @@ async def get_meta_overview(
 ):
     """Get unified overview of all Meta assets (Ads, Pages, Instagram)"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import MetaOverview
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         overview = meta_manager.get_meta_overview(period, start_date, end_date)
         return MetaOverview(**overview)
     except Exception as e:
@@ -1419,10 +1487,9 @@ async def get_meta_overview(
 async def get_meta_ad_accounts(current_user: dict = Depends(get_current_user)):
     """Get Meta ad accounts (no date filter needed for account list)"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import MetaAdAccount
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         accounts = meta_manager.get_ad_accounts()
         return [MetaAdAccount(**acc) for acc in accounts]
     except Exception as e:
@@ -1444,8 +1511,7 @@ async def get_account_insights_summary(
     This is fast and doesn't require fetching all campaigns.
     """
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
 
         logger.info(f"🔍 ENDPOINT CALLED: /api/meta/ad-accounts/{account_id}/insights/summary")
         logger.info(f"🔍 ENDPOINT PARAMS: period={period}, start_date={start_date}, end_date={end_date}")
@@ -1479,8 +1545,7 @@ async def get_account_insights_debug(
     to match Graph API Explorer exactly
     """
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
 
         logger.info(f"🔍 DEBUG ENDPOINT CALLED for account: {account_id}")
 
@@ -1514,8 +1579,7 @@ async def get_campaigns_paginated(
         GET /api/meta/ad-accounts/act_123/campaigns/paginated?limit=5&offset=5  # Next 5
     """
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         
         result = meta_manager.get_campaigns_paginated(
             account_id, period, start_date, end_date, limit, offset
@@ -1543,7 +1607,6 @@ async def get_campaigns_all(
     Uses streaming to prevent gateway timeouts for large datasets.
     """
     try:
-        from social.meta_manager import MetaManager
         
         logger.info(f"Fetching all campaigns for account: {account_id}")
         logger.info(f"Period: {period}, Start: {start_date}, End: {end_date}")
@@ -1561,7 +1624,7 @@ async def get_campaigns_all(
                 detail=f"Invalid period: {period}. Must be one of: 7d, 30d, 90d, 365d, custom"
             )
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         
         # ✅ Run in executor to prevent blocking
         import concurrent.futures
@@ -1594,72 +1657,16 @@ async def get_campaigns_for_chat(
     """
     try:
         import time
-        import requests
-        from social.meta_manager import MetaManager
 
         logger.info(f"[CHAT] Fetching full campaign data for account: {account_id}")
         start_time = time.time()
 
         # Initialize MetaManager (handles auth and rate limiting)
-        meta_manager = MetaManager(current_user["email"], auth_manager)
-
-        # Meta Marketing API allows specifying fields — use a comprehensive set
-        # See: https://developers.facebook.com/docs/marketing-api/reference/ad-campaign-group
-        fields = [
-            "id",
-            "name",
-            "status",
-            "objective",
-            "buying_type",
-            "bid_strategy",
-            "daily_budget",
-            "lifetime_budget",
-            "start_time",
-            "stop_time",
-            "created_time",
-            "updated_time",
-            "effective_status",
-            "special_ad_categories",
-            "budget_rebalance_flag",
-            "spend_cap",
-            "source_campaign",
-            "recommendations",
-            "execution_options",
-            "campaign_schedule",
-            "topline_id",
-            "is_skadnetwork_attribution",
-            "is_using_l2",
-            "l2_click",
-            "issues_info",
-            "primary_attribution_spec",
-            "smart_promotion_type",
-            "special_ad_category_country",
-        ]
-
-        params = {
-            "fields": ",".join(fields),
-            "limit": 500,  # maximum allowed per request
-        }
-
-        all_campaigns = []
-        next_url = None
-
-        while True:
-            if next_url:
-                response = requests.get(next_url)
-                if response.status_code != 200:
-                    logger.warning(f"[CHAT] Pagination request failed: {response.status_code}")
-                    break
-                data = response.json()
-            else:
-                data = meta_manager._rate_limited_request(f"{account_id}/campaigns", params)
-
-            campaigns_batch = data.get("data", [])
-            all_campaigns.extend(campaigns_batch)
+        meta_manager = meta_manager_pool.get(current_user["email"])
 
-            next_url = data.get("paging", {}).get("next")
-            if not next_url:
-                break
+        # Served from the per-account entity store (incrementally refreshed),
+        # falling back to a paged Graph listing when the store is unavailable
+        all_campaigns = await asyncio.to_thread(meta_manager.get_campaigns_full, account_id)
 
         elapsed_time = time.time() - start_time
         logger.info(f"[CHAT] Retrieved {len(all_campaigns)} full campaign records in {elapsed_time:.2f}s")
@@ -1698,8 +1705,7 @@ async def get_campaigns_list(
         GET /api/meta/ad-accounts/act_303894480866908/campaigns/list?status=ACTIVE,PAUSED
     """
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         
         # Parse status filter
         include_status = None
@@ -1723,8 +1729,7 @@ async def get_campaigns_timeseries(
 ):
     """Get time-series data for campaigns"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_campaigns_timeseries(campaign_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1741,8 +1746,7 @@ async def get_campaigns_demographics(
 ):
     """Get age/gender demographics for campaigns"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_campaigns_demographics(campaign_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1759,8 +1763,7 @@ async def get_campaigns_placements(
 ):
     """Get platform placement data for campaigns"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_campaigns_placements(campaign_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1784,7 +1787,6 @@ async def get_adsets_by_campaigns(
     ["120212345678901234", "120212345678901235"]
     """
     try:
-        from social.meta_manager import MetaManager
         
         logger.info(f"Fetching ad sets for {len(campaign_ids)} campaigns")
         logger.info(f"Campaign IDs: {campaign_ids}")
@@ -1792,7 +1794,7 @@ async def get_adsets_by_campaigns(
         if not campaign_ids:
             raise HTTPException(status_code=400, detail="No campaign IDs provided")
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         adsets = meta_manager.get_adsets_by_campaigns(campaign_ids, period, start_date, end_date)
         
         logger.info(f"Successfully retrieved {len(adsets)} ad sets")
@@ -1821,8 +1823,7 @@ async def get_adsets_timeseries(
 ):
     """Get time-series data for ad sets"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_adsets_timeseries(adset_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1840,8 +1841,7 @@ async def get_adsets_demographics(
 ):
     """Get age/gender demographics for ad sets"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_adsets_demographics(adset_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1859,8 +1859,7 @@ async def get_adsets_placements(
 ):
     """Get platform placement data for ad sets"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_adsets_placements(adset_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1875,8 +1874,7 @@ async def get_ads_by_adsets(
 ):
     """Get ads for multiple ad sets"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_ads_by_adsets(adset_ids)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1894,8 +1892,7 @@ async def get_ads_timeseries(
 ):
     """Get time-series data for ads"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_ads_timeseries(ad_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1913,8 +1910,7 @@ async def get_ads_demographics(
 ):
     """Get age/gender demographics for ads"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_ads_demographics(ad_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1932,8 +1928,7 @@ async def get_ads_placements(
 ):
     """Get platform placement data for ads"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         return meta_manager.get_ads_placements(ad_ids, period, start_date, end_date)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1947,10 +1942,9 @@ async def get_ads_placements(
 async def get_meta_pages(current_user: dict = Depends(get_current_user)):
     """Get Facebook pages (no date filter needed for page list)"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import FacebookPageBasic
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         pages = meta_manager.get_pages()
         return [FacebookPageBasic(**page) for page in pages]
     except Exception as e:
@@ -1968,10 +1962,9 @@ async def get_meta_page_insights(
 ):
     """Get insights for Facebook page with custom date range support"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import FacebookPageInsights
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         insights = meta_manager.get_page_insights(page_id, period, start_date, end_date)
         return FacebookPageInsights(**insights)
     except Exception as e:
@@ -1991,9 +1984,8 @@ async def get_meta_page_insights_timeseries(
 ):
     """Get time-series insights for Facebook page (for line charts)"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         insights = meta_manager.get_page_insights_timeseries(page_id, period, start_date, end_date)
         return insights
     except Exception as e:
@@ -2012,10 +2004,9 @@ async def get_meta_page_posts(
 ):
     """Get posts from Facebook page with custom date range support"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import FacebookPostDetail
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         posts = meta_manager.get_page_posts(page_id, limit, period, start_date, end_date)
         return [FacebookPostDetail(**post) for post in posts]
     except Exception as e:
@@ -2034,9 +2025,8 @@ async def get_meta_page_posts_timeseries(
 ):
     """Get posts with time-series insights (for tracking post performance over time)"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         posts = meta_manager.get_page_posts_timeseries(page_id, limit, period, start_date, end_date)
         return posts
     except Exception as e:
@@ -2069,9 +2059,8 @@ async def get_meta_video_views_breakdown(
 ):
     """Get video views breakdown - 3-second views, 1-minute views"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         breakdown = meta_manager.get_page_video_views_breakdown(page_id, period, start_date, end_date)
         return breakdown
     except Exception as e:
@@ -2090,9 +2079,8 @@ async def get_meta_content_type_breakdown(
 ):
     """Get views breakdown by content type"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         breakdown = meta_manager.get_page_content_type_breakdown(page_id, period, start_date, end_date)
         return breakdown
     except Exception as e:
@@ -2108,9 +2096,8 @@ async def get_meta_page_demographics(
 ):
     """Get page audience demographics"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         demographics = meta_manager.get_page_follower_demographics(page_id)
         return demographics
     except Exception as e:
@@ -2129,9 +2116,8 @@ async def get_meta_follows_unfollows(
 ):
     """Get net follows and unfollows data"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         data = meta_manager.get_page_follows_unfollows(page_id, period, start_date, end_date)
         return data
     except Exception as e:
@@ -2150,9 +2136,8 @@ async def get_meta_engagement_breakdown(
 ):
     """Get engagement breakdown"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         breakdown = meta_manager.get_page_engagement_breakdown(page_id, period, start_date, end_date)
         return breakdown
     except Exception as e:
@@ -2171,9 +2156,8 @@ async def get_meta_organic_vs_paid(
 ):
     """Get organic vs paid breakdown"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         data = meta_manager.get_page_organic_vs_paid(page_id, period, start_date, end_date)
         return data
     except Exception as e:
@@ -2188,10 +2172,9 @@ async def get_meta_organic_vs_paid(
 async def get_meta_instagram_accounts(current_user: dict = Depends(get_current_user)):
     """Get Instagram Business accounts (no date filter needed for account list)"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import InstagramAccountBasic
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         accounts = meta_manager.get_instagram_accounts()
         return [InstagramAccountBasic(**acc) for acc in accounts]
     except Exception as e:
@@ -2209,10 +2192,9 @@ async def get_meta_instagram_insights(
 ):
     """Get insights for Instagram account with custom date range support"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import InstagramAccountInsights
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         insights = meta_manager.get_instagram_insights(account_id, period, start_date, end_date)
         return InstagramAccountInsights(**insights)
     except Exception as e:
@@ -2230,9 +2212,8 @@ async def get_meta_instagram_insights_timeseries(
 ):
     """Get time-series insights for Instagram account (for line charts)"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         insights = meta_manager.get_instagram_insights_timeseries(account_id, period, start_date, end_date)
         return insights
     except Exception as e:
@@ -2251,10 +2232,9 @@ async def get_meta_instagram_media(
 ):
     """Get media from Instagram account with custom date range support"""
     try:
-        from social.meta_manager import MetaManager
         from models.meta_response_models import InstagramMediaDetail
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         media = meta_manager.get_instagram_media(account_id, limit, period, start_date, end_date)
         return [InstagramMediaDetail(**media_item) for media_item in media]
     except Exception as e:
@@ -2275,9 +2255,8 @@ async def get_meta_instagram_media_timeseries(
 ):
     """Get Instagram media with time-series insights (for tracking post performance over time)"""
     try:
-        from social.meta_manager import MetaManager
         
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         media = meta_manager.get_instagram_media_timeseries(account_id, limit, period, start_date, end_date)
         return media
     except Exception as e:
@@ -2288,8 +2267,7 @@ async def get_meta_instagram_media_timeseries(
 async def debug_meta_permissions(current_user: dict = Depends(get_current_user)):
     """Debug endpoint to check what permissions we have"""
     try:
-        from social.meta_manager import MetaManager
-        meta_manager = MetaManager(current_user["email"], auth_manager)
+        meta_manager = meta_manager_pool.get(current_user["email"])
         
         # Check user token permissions
         user_perms = meta_manager._make_request("me/permissions")
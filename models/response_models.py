@@ -243,6 +243,8 @@ class GAMetrics(BaseModel):
     # Extra metrics for 8th card
     viewsPerSession: float
     sessionQualityScore: str
+    # Previous-period change of every GA4 metric, e.g. {"sessions": "+4.2%"}
+    metricChanges: Dict[str, str] = {}
 
 class GATrafficSource(BaseModel):
     channel: str
@@ -0,0 +1,131 @@
+"""
+Graph Fixtures - record Graph API responses to disk for offline replay
+
+Set META_GRAPH_RECORD_DIR to make every MetaManager HTTP session write the
+responses it receives into that directory, one JSON file per distinct request.
+Access tokens are scrubbed from request keys, paging URLs and bodies. The
+files are replayed by benchmarks/graph_standin.py.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that carry credentials and never take part in fixture keys
+SECRET_PARAMS = {'access_token', 'appsecret_proof', 'client_secret'}
+
+# Response headers worth keeping for replay (usage headers drive throttling)
+RECORDED_HEADERS = {
+    'content-type',
+    'etag',
+    'x-app-usage',
+    'x-ad-account-usage',
+    'x-business-use-case-usage',
+    'x-page-usage'
+}
+
+SCRUBBED = 'SCRUBBED'
+
+
+def split_graph_url(url: str) -> Tuple[str, Dict[str, str]]:
+    """Path and non-secret query parameters of a Graph URL"""
+    parts = urlsplit(url)
+    params = {
+        key: value
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in SECRET_PARAMS
+    }
+    return parts.path, params
+
+
+def fixture_key(path: str, params: Dict[str, Any]) -> str:
+    """Stable identifier of a request: path plus sorted non-secret parameters"""
+    clean = sorted((key, str(value)) for key, value in params.items() if key not in SECRET_PARAMS)
+    return f"{path}?{urlencode(clean)}" if clean else path
+
+
+def fixture_filename(key: str) -> str:
+    return f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]}.json"
+
+
+def _relative_graph_url(url: str) -> str:
+    """Paging URL without host and credentials, so any replay server can serve it"""
+    path, params = split_graph_url(url)
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+def scrub_body(value: Any) -> Any:
+    """Remove tokens from a response body and make paging URLs host-relative"""
+    if isinstance(value, dict):
+        scrubbed = {}
+        for key, item in value.items():
+            if key in SECRET_PARAMS:
+                scrubbed[key] = SCRUBBED
+            elif key in ('next', 'previous') and isinstance(item, str) and item.startswith('http'):
+                scrubbed[key] = _relative_graph_url(item)
+            else:
+                scrubbed[key] = scrub_body(item)
+        return scrubbed
+    if isinstance(value, list):
+        return [scrub_body(item) for item in value]
+    return value
+
+
+class GraphFixtureRecorder:
+    """Writes scrubbed Graph responses into a fixture directory"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["GraphFixtureRecorder"]:
+        directory = os.getenv('META_GRAPH_RECORD_DIR')
+        return cls(directory) if directory else None
+
+    def attach(self, session):
+        """Record every response received through a requests.Session"""
+        session.hooks['response'].append(self._on_response)
+
+    def _on_response(self, response, *args, **kwargs):
+        try:
+            self.record(response)
+        except Exception as e:
+            # Recording must never break the request being made
+            logger.warning(f"Could not record Graph fixture for {response.url}: {e}")
+        return response
+
+    def record(self, response):
+        if response.status_code == 304:
+            return  # Revalidation of a body recorded earlier
+        path, params = split_graph_url(response.url)
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+
+        key = fixture_key(path, params)
+        fixture = {
+            'request': {'path': path, 'params': params},
+            'status': response.status_code,
+            'headers': {
+                name.lower(): value
+                for name, value in response.headers.items()
+                if name.lower() in RECORDED_HEADERS
+            },
+            'elapsed_ms': round(response.elapsed.total_seconds() * 1000, 1),
+            'body': scrub_body(body)
+        }
+
+        file_path = os.path.join(self.directory, fixture_filename(key))
+        with self._lock:
+            with open(file_path, 'w') as f:
+                json.dump(fixture, f, indent=2)
+        logger.debug(f"📼 Recorded Graph fixture {key} → {file_path}")
@@ -0,0 +1,229 @@
+"""
+Meta Entity Store - Mongo-backed copy of ad account structure (campaigns, ad sets, ads)
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+
+class MetaEntityStore:
+    """
+    Per-account store of campaign, ad set and ad metadata with parent links.
+
+    An account is filled with a full listing on first use. After that only
+    entities whose updated_time moved past the stored watermark are fetched
+    (filtering=[{field: 'updated_time', operator: 'GREATER_THAN', ...}]), with
+    a periodic full resync to drop entities that disappeared from the edges.
+    List endpoints are then answered from indexed lookups instead of Graph.
+    """
+
+    ENTITY_COLLECTION = "meta_entities"
+    SYNC_COLLECTION = "meta_entity_sync"
+
+    # Full resync interval, catches deleted entities the incremental pass never sees
+    FULL_RESYNC_INTERVAL = timedelta(hours=24)
+    # Re-read a little before the watermark so same-second updates are not missed
+    WATERMARK_OVERLAP_SECONDS = 60
+
+    CAMPAIGN_FIELDS = [
+        "id",
+        "name",
+        "status",
+        "objective",
+        "buying_type",
+        "bid_strategy",
+        "daily_budget",
+        "lifetime_budget",
+        "start_time",
+        "stop_time",
+        "created_time",
+        "updated_time",
+        "effective_status",
+        "special_ad_categories",
+        "budget_rebalance_flag",
+        "spend_cap",
+        "source_campaign",
+        "recommendations",
+        "execution_options",
+        "campaign_schedule",
+        "topline_id",
+        "is_skadnetwork_attribution",
+        "is_using_l2",
+        "l2_click",
+        "issues_info",
+        "primary_attribution_spec",
+        "smart_promotion_type",
+        "special_ad_category_country",
+    ]
+
+    # level -> account edge, requested fields and the field linking to the parent
+    LEVELS = {
+        'campaign': {
+            'edge': 'campaigns',
+            'fields': ','.join(CAMPAIGN_FIELDS),
+            'parent_field': None,
+            'limit': 500
+        },
+        'adset': {
+            'edge': 'adsets',
+            'fields': 'id,name,status,campaign_id,optimization_goal,billing_event,daily_budget,lifetime_budget,budget_remaining,targeting,created_time,updated_time',
+            'parent_field': 'campaign_id',
+            'limit': 200
+        },
+        'ad': {
+            'edge': 'ads',
+            'fields': 'id,name,status,adset_id,campaign_id,account_id,creative{id},preview_shareable_link,effective_object_story_id,created_time,updated_time',
+            'parent_field': 'adset_id',
+            'limit': 200
+        }
+    }
+
+    def __init__(self, db):
+        self.entities = db[self.ENTITY_COLLECTION]
+        self.sync_state = db[self.SYNC_COLLECTION]
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        try:
+            self.entities.create_index([('account_id', ASCENDING), ('level', ASCENDING), ('created_time', DESCENDING)])
+            self.entities.create_index([('level', ASCENDING), ('parent_id', ASCENDING)])
+            self.entities.create_index([('account_id', ASCENDING), ('synced_at', ASCENDING)])
+        except Exception as e:
+            logger.warning(f"Could not create Meta entity store indexes: {e}")
+
+    @staticmethod
+    def _parse_graph_time(value: str) -> int:
+        """Unix timestamp of a Graph time string (2024-01-01T10:00:00+0000)"""
+        if not value:
+            return 0
+        try:
+            return int(datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z').timestamp())
+        except ValueError:
+            return 0
+
+    def sync_account(self, account_id: str, fetch_edge: Callable[[str, Dict], List[Dict]]) -> Dict:
+        """
+        Bring an account up to date.
+
+        Args:
+            account_id: Normalized ad account ID (act_...)
+            fetch_edge: Callable(endpoint, params) returning every entity of an edge,
+                        normally MetaManager.fetch_edge so the user's token is used
+
+        Returns:
+            Dict with the sync mode and the number of entities written per level
+        """
+        started_at = datetime.utcnow()
+        state = self.sync_state.find_one({'_id': account_id})
+        full = (
+            not state
+            or not state.get('last_full_sync')
+            or started_at - state['last_full_sync'] > self.FULL_RESYNC_INTERVAL
+        )
+        watermark = state.get('watermark', 0) if state else 0
+        new_watermark = watermark
+
+        written = {}
+        for level, spec in self.LEVELS.items():
+            params = {'fields': spec['fields'], 'limit': spec['limit']}
+            if not full:
+                params['filtering'] = json.dumps([{
+                    'field': 'updated_time',
+                    'operator': 'GREATER_THAN',
+                    'value': max(watermark - self.WATERMARK_OVERLAP_SECONDS, 0)
+                }])
+
+            entities = fetch_edge(f"{account_id}/{spec['edge']}", params)
+
+            operations = []
+            for entity in entities:
+                new_watermark = max(new_watermark, self._parse_graph_time(entity.get('updated_time')))
+                operations.append(UpdateOne({'_id': entity['id']}, {'$set': {
+                    'account_id': account_id,
+                    'level': level,
+                    'parent_id': entity.get(spec['parent_field']) if spec['parent_field'] else account_id,
+                    'created_time': entity.get('created_time'),
+                    'updated_time': entity.get('updated_time'),
+                    'data': entity,
+                    'synced_at': started_at
+                }}, upsert=True))
+
+            if operations:
+                self.entities.bulk_write(operations, ordered=False)
+            written[level] = len(operations)
+
+        if full:
+            # Anything not seen in a full listing no longer exists on the account
+            self.entities.delete_many({'account_id': account_id, 'synced_at': {'$lt': started_at}})
+
+        update = {'watermark': new_watermark, 'last_synced_at': started_at}
+        if full:
+            update['last_full_sync'] = started_at
+        self.sync_state.update_one({'_id': account_id}, {'$set': update}, upsert=True)
+
+        logger.info(f"🗂️ Entity store {'full' if full else 'incremental'} sync for {account_id}: {written}")
+        return {'mode': 'full' if full else 'incremental', 'written': written}
+
+    def list_entities(self, account_id: str, level: str) -> List[Dict]:
+        """All entities of one level on an account, newest first"""
+        cursor = self.entities.find(
+            {'account_id': account_id, 'level': level},
+            {'data': 1}
+        ).sort('created_time', DESCENDING)
+        return [doc['data'] for doc in cursor]
+
+    def list_children(self, level: str, parent_ids: List[str]) -> List[Dict]:
+        """Entities of a level under the given parents, grouped in parent_ids order"""
+        order = {parent_id: index for index, parent_id in enumerate(parent_ids)}
+        docs = list(self.entities.find(
+            {'level': level, 'parent_id': {'$in': list(parent_ids)}},
+            {'data': 1, 'parent_id': 1}
+        ).sort('created_time', DESCENDING))
+        docs.sort(key=lambda doc: order.get(doc['parent_id'], len(order)))
+        return [doc['data'] for doc in docs]
+
+    def account_ids_for(self, entity_ids: List[str]) -> Dict[str, str]:
+        """Map known entity IDs to the account they belong to"""
+        cursor = self.entities.find({'_id': {'$in': list(entity_ids)}}, {'account_id': 1})
+        return {doc['_id']: doc['account_id'] for doc in cursor}
+
+
+_store: Optional[MetaEntityStore] = None
+_store_lock = threading.Lock()
+_store_failed_at = 0.0
+STORE_RETRY_INTERVAL = 60
+
+
+def get_meta_entity_store() -> Optional[MetaEntityStore]:
+    """
+    Process-wide entity store, or None when MongoDB is not reachable
+    (callers then fall back to listing from Graph directly).
+    """
+    global _store, _store_failed_at
+
+    if _store is not None:
+        return _store
+
+    with _store_lock:
+        if _store is not None:
+            return _store
+        if time.time() - _store_failed_at < STORE_RETRY_INTERVAL:
+            return None
+        try:
+            from database.mongo_manager import mongo_manager
+            db = mongo_manager.get_sync_db()
+            db.command('ping')
+            _store = MetaEntityStore(db)
+        except Exception as e:
+            logger.warning(f"Meta entity store unavailable, listing from Graph: {e}")
+            _store_failed_at = time.time()
+            return None
+        return _store
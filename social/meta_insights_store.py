@@ -0,0 +1,164 @@
+"""
+Meta Insights Store - Mongo-backed daily insights facts with per-entity watermarks
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, date
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+
+class MetaInsightsStore:
+    """
+    Daily insights rows keyed by (entity, date).
+
+    Each entity has a watermark document describing the contiguous range of
+    days already stored (covered_since..covered_until) and the part of it
+    that was fetched after the days had left the attribution window
+    (..final_until). Final days are never fetched again; only missing days
+    and the recent, still-changing tail go back to Graph.
+    """
+
+    FACT_COLLECTION = "meta_daily_insights"
+    WATERMARK_COLLECTION = "meta_insights_watermarks"
+
+    # Conversions can still be attributed to a day this long after it
+    ATTRIBUTION_WINDOW_DAYS = 28
+
+    def __init__(self, db):
+        self.facts = db[self.FACT_COLLECTION]
+        self.watermarks = db[self.WATERMARK_COLLECTION]
+        try:
+            self.facts.create_index([('entity_id', ASCENDING), ('date', ASCENDING)])
+        except Exception as e:
+            logger.warning(f"Could not create Meta insights store indexes: {e}")
+
+    @staticmethod
+    def _day(value: str) -> date:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
+    def get_daily_rows(
+        self,
+        entity_id: str,
+        since: str,
+        until: str,
+        fields: str,
+        fetch_range: Callable[[str, str], List[Dict]],
+        refresh_recent: bool = True
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Daily rows for an entity between since and until (inclusive).
+
+        Args:
+            entity_id: Campaign, ad set, ad or ad account ID
+            since, until: Requested range (YYYY-MM-DD)
+            fields: Insights fields the rows hold; a change invalidates the entity
+            fetch_range: Callable(since, until) returning Graph daily rows
+            refresh_recent: Refetch stored days that are not final yet
+
+        Returns:
+            (rows sorted by date, whether Graph was called)
+        """
+        since_day, until_day = self._day(since), self._day(until)
+        boundary = date.today() - timedelta(days=self.ATTRIBUTION_WINDOW_DAYS)
+
+        state = self.watermarks.find_one({'_id': entity_id})
+        if state and state.get('fields') == fields:
+            covered_since = self._day(state['covered_since'])
+            covered_until = self._day(state['covered_until'])
+            final_until = self._day(state['final_until'])
+        else:
+            if state:
+                self.facts.delete_many({'entity_id': entity_id})
+            covered_since = since_day
+            covered_until = final_until = since_day - timedelta(days=1)
+
+        fetched = False
+
+        # Older days than anything stored
+        if since_day < covered_since:
+            head_until = covered_since - timedelta(days=1)
+            self._replace_range(entity_id, since_day, head_until, fetch_range)
+            if final_until < covered_since:
+                final_until = min(head_until, boundary - timedelta(days=1))
+            covered_since = since_day
+            fetched = True
+
+        # Days after the final part: never fetched, or fetched while still changing
+        if until_day > final_until and (refresh_recent or until_day > covered_until):
+            self._replace_range(entity_id, final_until + timedelta(days=1), until_day, fetch_range)
+            covered_until = max(covered_until, until_day)
+            final_until = max(final_until, min(until_day, boundary - timedelta(days=1)))
+            fetched = True
+
+        if fetched:
+            self.watermarks.update_one({'_id': entity_id}, {'$set': {
+                'fields': fields,
+                'covered_since': covered_since.isoformat(),
+                'covered_until': covered_until.isoformat(),
+                'final_until': final_until.isoformat(),
+                'updated_at': datetime.utcnow()
+            }}, upsert=True)
+
+        cursor = self.facts.find(
+            {'entity_id': entity_id, 'date': {'$gte': since, '$lte': until}},
+            {'row': 1, 'date': 1}
+        ).sort('date', ASCENDING)
+        return [doc['row'] for doc in cursor], fetched
+
+    def _replace_range(self, entity_id: str, since_day: date, until_day: date, fetch_range: Callable):
+        """Fetch a range from Graph and make it the stored content for those days"""
+        since, until = since_day.isoformat(), until_day.isoformat()
+        rows = fetch_range(since, until)
+        logger.info(f"📥 Insights store fetched {len(rows)} daily rows for {entity_id} ({since} → {until})")
+
+        # Days without delivery return no row; drop anything stored for them
+        self.facts.delete_many({'entity_id': entity_id, 'date': {'$gte': since, '$lte': until}})
+        operations = [
+            UpdateOne(
+                {'_id': f"{entity_id}:{row['date_start']}"},
+                {'$set': {'entity_id': entity_id, 'date': row['date_start'], 'row': row}},
+                upsert=True
+            )
+            for row in rows if row.get('date_start')
+        ]
+        if operations:
+            self.facts.bulk_write(operations, ordered=False)
+
+
+_store: Optional[MetaInsightsStore] = None
+_store_lock = threading.Lock()
+_store_failed_at = 0.0
+STORE_RETRY_INTERVAL = 60
+
+
+def get_meta_insights_store() -> Optional[MetaInsightsStore]:
+    """
+    Process-wide insights store, or None when MongoDB is not reachable
+    (callers then fetch the full range from Graph).
+    """
+    global _store, _store_failed_at
+
+    if _store is not None:
+        return _store
+
+    with _store_lock:
+        if _store is not None:
+            return _store
+        if time.time() - _store_failed_at < STORE_RETRY_INTERVAL:
+            return None
+        try:
+            from database.mongo_manager import mongo_manager
+            db = mongo_manager.get_sync_db()
+            db.command('ping')
+            _store = MetaInsightsStore(db)
+        except Exception as e:
+            logger.warning(f"Meta insights store unavailable, fetching from Graph: {e}")
+            _store_failed_at = time.time()
+            return None
+        return _store
@@ -6,22 +6,40 @@ import logging
 import requests
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from fastapi import HTTPException
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 import json
+import os
 import time
+import heapq
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from auth.auth_manager import AuthManager
+from social.graph_fixtures import GraphFixtureRecorder, fixture_key, split_graph_url
+from social.meta_entity_store import MetaEntityStore, get_meta_entity_store
+from social.meta_insights_store import get_meta_insights_store
 
 
 logger = logging.getLogger(__name__)
 
+
+class MetaAPIError(HTTPException):
+    """Graph API error response, keeping Meta's error code"""
+
+    def __init__(self, status_code: int, detail: str, error_code: Optional[int] = None):
+        super().__init__(status_code=status_code, detail=detail)
+        self.error_code = error_code
+
+
 class MetaManager:
     """Unified manager for all Meta platforms (Facebook, Instagram, Ads)"""
     
     GRAPH_API_VERSION = "v21.0"
-    BASE_URL = f"https://graph.facebook.com/{GRAPH_API_VERSION}"
+    # META_GRAPH_BASE_URL points the manager at a stand-in server (benchmarks/graph_standin.py)
+    BASE_URL = os.getenv('META_GRAPH_BASE_URL', f"https://graph.facebook.com/{GRAPH_API_VERSION}")
 
       
     # Rate limiting configuration
@@ -29,12 +47,186 @@ class MetaManager:
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # Initial retry delay in seconds
     
-    def __init__(self, user_email: str, auth_manager):
+    # Page access tokens are long-lived, so cache them on the (pooled) manager
+    PAGE_TOKEN_CACHE_TTL = 3600
+    # Per-manager value cache (tokens, snapshots, media insights, creatives),
+    # least recently used entries dropped beyond this
+    CACHE_MAX_ENTRIES = 2000
+
+    # Conditional requests: bodies of slow-changing responses (page metadata,
+    # account and campaign lists, follower demographics) kept for
+    # If-None-Match revalidation, bounded by count and total size per manager
+    ETAG_CACHE_MAX_ENTRIES = 500
+    ETAG_CACHE_MAX_BYTES = 8 * 1024 * 1024
+    ETAG_MAX_BODY_BYTES = 512 * 1024
+
+    # Graph API multi-ID lookups (?ids=a,b,c) accept at most 50 IDs
+    GRAPH_MAX_IDS_PER_REQUEST = 50
+    # Entity IDs per account-level insights query filtered with '<level>.id IN'
+    INSIGHTS_FILTER_CHUNK_SIZE = 100
+
+    # Ad creatives and their resolved media (keyed by creative ID, image_hash, video_id)
+    CREATIVE_CACHE_TTL = 3600
+    # Campaign/ad set/ad -> ad account lookups
+    ENTITY_ACCOUNT_CACHE_TTL = 86400
+
+    # Instagram media insights metrics per media_product_type
+    IG_MEDIA_INSIGHT_METRICS = {
+        'REELS': 'plays,reach,total_interactions,saved',
+        'STORY': 'impressions,reach,exits,replies',
+        'FEED': 'impressions,reach,engagement,saved'
+    }
+    MEDIA_INSIGHTS_RECENT_TTL = 900
+    MEDIA_INSIGHTS_SETTLED_TTL = 86400
+    MEDIA_INSIGHTS_SETTLED_DAYS = 7
+
+    # Combined overview (accounts, pages, Instagram) per user
+    OVERVIEW_CACHE_TTL = 120
+
+    # Longest since/until range accepted for daily insights, per object type
+    PAGE_INSIGHTS_WINDOW_DAYS = 90
+    IG_INSIGHTS_WINDOW_DAYS = 30
+    INSIGHTS_WINDOW_WORKERS = 4
+    # Metrics rejected by an object are skipped in combined calls for this long
+    UNAVAILABLE_METRIC_TTL = 3600
+    # Graph error codes that say nothing about the metric itself: transient
+    # and unknown errors, throttling, and expired or invalid tokens
+    NON_METRIC_ERROR_CODES = {1, 2, 4, 17, 32, 190, 341, 613, 80001, 80002, 80004, 80005, 80006, 80008, 80014}
+
+    # Lifetime follower demographics change at most daily
+    FOLLOWER_DEMOGRAPHICS_TTL = 86400
+    FOLLOWER_DEMOGRAPHIC_METRICS = {
+        'page_fans_gender_age': 'age_gender',
+        'page_fans_country': 'countries',
+        'page_fans_city': 'cities'
+    }
+
+    # Shared posts + metrics snapshot behind the page breakdown endpoints
+    PAGE_SNAPSHOT_TTL = 300
+    PAGE_VIDEO_METRICS = {
+        'page_video_views': 'total_views',
+        'page_video_views_3s': 'three_second_views',
+        'page_video_views_60s': 'one_minute_views'
+    }
+    PAGE_ORGANIC_PAID_METRICS = {
+        'page_impressions_organic_v2': 'organic_impressions',
+        'page_impressions_paid_v2': 'paid_impressions',
+        'page_impressions_organic_unique_v2': 'organic_reach',
+        'page_impressions_paid_unique_v2': 'paid_reach'
+    }
+
+    # How often a user's requests trigger an incremental entity store refresh
+    ENTITY_REFRESH_INTERVAL = 300
+
+    # Daily insights kept in the insights store, and how often a user's
+    # requests refetch the days still inside the attribution window
+    DAILY_INSIGHTS_FIELDS = 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency'
+    RECENT_INSIGHTS_REFRESH_INTERVAL = 900
+
+    def __init__(self, user_email: str, auth_manager, access_token: str = None):
         self.user_email = user_email
         self.auth_manager = auth_manager
-        self.access_token = self._get_access_token()
+        self.access_token = access_token or self._get_access_token()
         self.last_request_time = 0
 
+        # Long-lived state, kept across requests when the manager is pooled
+        self.session = requests.Session()
+        self._rate_limit_lock = threading.Lock()
+
+        # META_GRAPH_RECORD_DIR captures responses as replayable fixtures
+        recorder = GraphFixtureRecorder.from_env()
+        if recorder:
+            recorder.attach(self.session)
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._etag_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._etag_bytes = 0
+        self._etag_lock = threading.Lock()
+        self._etag_stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'bytes_saved': 0,
+            'seconds_saved': 0.0
+        }
+
+    def close(self):
+        """Release the HTTP session and drop cached data"""
+        self.session.close()
+        with self._cache_lock:
+            self._cache.clear()
+        with self._etag_lock:
+            self._etag_cache.clear()
+            self._etag_bytes = 0
+
+    def _cache_get(self, key: str):
+        """Return a cached value, or None if missing or expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if not entry:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return value
+
+    def _cache_set(self, key: str, value, ttl: float):
+        """Cache a value on this manager for ttl seconds, within CACHE_MAX_ENTRIES"""
+        now = time.time()
+        with self._cache_lock:
+            self._cache[key] = (now + ttl, value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                for expired_key in [k for k, (expires_at, _) in self._cache.items() if expires_at < now]:
+                    del self._cache[expired_key]
+                while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+
+    @contextmanager
+    def _build_lock(self, key: str):
+        """
+        Hold the lock of a cached value so concurrent requests build it once
+        instead of racing. The lock is dropped once the build is done, so
+        one-off keys (e.g. custom date ranges) do not accumulate.
+        """
+        with self._cache_lock:
+            lock = self._build_locks.setdefault(key, threading.Lock())
+        with lock:
+            try:
+                yield
+            finally:
+                with self._cache_lock:
+                    if self._build_locks.get(key) is lock:
+                        del self._build_locks[key]
+
+    def etag_stats(self) -> Dict[str, Any]:
+        """Conditional request counters: 304s served from cache and what they saved"""
+        with self._etag_lock:
+            return {**self._etag_stats, 'entries': len(self._etag_cache), 'bytes': self._etag_bytes}
+
+    def _etag_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._etag_lock:
+            entry = self._etag_cache.get(key)
+            if entry:
+                self._etag_cache.move_to_end(key)
+            return entry
+
+    def _etag_store(self, key: str, etag: str, content: bytes, elapsed: float):
+        """Keep a response body for revalidation, evicting least recently used bodies over the budget"""
+        with self._etag_lock:
+            previous = self._etag_cache.pop(key, None)
+            if previous:
+                self._etag_bytes -= len(previous['content'])
+            if len(content) > self.ETAG_MAX_BODY_BYTES:
+                return
+            self._etag_cache[key] = {'etag': etag, 'content': content, 'elapsed': elapsed}
+            self._etag_bytes += len(content)
+            while len(self._etag_cache) > self.ETAG_CACHE_MAX_ENTRIES or self._etag_bytes > self.ETAG_CACHE_MAX_BYTES:
+                _, evicted = self._etag_cache.popitem(last=False)
+                self._etag_bytes -= len(evicted['content'])
+
     @staticmethod
     def _normalize_account_id(account_id: str) -> str:
         """
@@ -56,31 +248,57 @@ class MetaManager:
         # Otherwise, add the prefix
         return f"act_{account_id}"
     
-    def _rate_limited_request(self, endpoint: str, params: Dict = None, retry_count: int = 0) -> Dict:
+    def _rate_limited_request(self, endpoint: str, params: Dict = None, retry_count: int = 0, revalidate: bool = False) -> Dict:
         """
         Make a rate-limited request to Facebook Graph API with exponential backoff.
+        With revalidate set, the body is kept and later requests for the same
+        path and parameters send If-None-Match (for slow-changing responses).
         """
         if params is None:
             params = {}
         
-        # Only add access_token if not already provided
-        if 'access_token' not in params:
-            params['access_token'] = self.access_token
-        
-        # Rate limiting: ensure minimum delay between requests
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        if endpoint.startswith('http'):
+            # paging.next URLs already carry the token and every query parameter
+            url = endpoint
+        else:
+            # Only add access_token if not already provided
+            if 'access_token' not in params:
+                params['access_token'] = self.access_token
+            url = f"{self.BASE_URL}/{endpoint}"
         
-        if time_since_last_request < self.RATE_LIMIT_DELAY:
-            sleep_time = self.RATE_LIMIT_DELAY - time_since_last_request
+        # Rate limiting: ensure minimum delay between requests. The slot is
+        # reserved under the lock so concurrent callers sharing this manager
+        # are spaced out instead of firing together.
+        with self._rate_limit_lock:
+            current_time = time.time()
+            sleep_time = max(0.0, self.last_request_time + self.RATE_LIMIT_DELAY - current_time)
+            self.last_request_time = current_time + sleep_time
+
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f}s")
             time.sleep(sleep_time)
         
-        url = f"{self.BASE_URL}/{endpoint}"
+        # Conditional request: revalidate a stored body instead of downloading it again
+        url_path, url_params = split_graph_url(url)
+        etag_key = fixture_key(url_path, {**url_params, **params})
+        etag_entry = self._etag_lookup(etag_key) if revalidate else None
+        headers = {'If-None-Match': etag_entry['etag']} if etag_entry else {}
         
         try:
-            response = requests.get(url, params=params)
-            self.last_request_time = time.time()
+            request_started = time.time()
+            response = self.session.get(url, params=params, headers=headers)
+            elapsed = time.time() - request_started
+            
+            with self._etag_lock:
+                self._etag_stats['requests'] += 1
+            
+            if response.status_code == 304 and etag_entry:
+                with self._etag_lock:
+                    self._etag_stats['not_modified'] += 1
+                    self._etag_stats['bytes_saved'] += len(etag_entry['content'])
+                    self._etag_stats['seconds_saved'] += max(0.0, etag_entry['elapsed'] - elapsed)
+                logger.debug(f"304 Not Modified for {url_path}, served {len(etag_entry['content'])} cached bytes")
+                return json.loads(etag_entry['content'])
             
             # Check for rate limiting error
             if response.status_code == 429 or (response.status_code == 400 and 'rate limit' in response.text.lower()):
@@ -88,7 +306,7 @@ class MetaManager:
                     retry_delay = self.RETRY_DELAY * (2 ** retry_count)  # Exponential backoff
                     logger.warning(f"Rate limited! Retrying in {retry_delay}s (attempt {retry_count + 1}/{self.MAX_RETRIES})")
                     time.sleep(retry_delay)
-                    return self._rate_limited_request(endpoint, params, retry_count + 1)
+                    return self._rate_limited_request(endpoint, params, retry_count + 1, revalidate)
                 else:
                     raise Exception("Rate limit exceeded and max retries reached")
             
@@ -102,14 +320,19 @@ class MetaManager:
                     retry_delay = self.RETRY_DELAY * (2 ** retry_count)
                     logger.warning(f"Server error {response.status_code}. Retrying in {retry_delay}s")
                     time.sleep(retry_delay)
-                    return self._rate_limited_request(endpoint, params, retry_count + 1)
+                    return self._rate_limited_request(endpoint, params, retry_count + 1, revalidate)
                 
                 logger.error(f"Meta API error: {response.text}")
-                raise HTTPException(
+                raise MetaAPIError(
                     status_code=response.status_code,
-                    detail=f"Meta API error: {error_message}"
+                    detail=f"Meta API error: {error_message}",
+                    error_code=error_data.get('error', {}).get('code')
                 )
             
+            etag = response.headers.get('ETag')
+            if revalidate and etag:
+                self._etag_store(etag_key, etag, response.content, elapsed)
+            
             return response.json()
             
         except requests.exceptions.RequestException as e:
@@ -117,9 +340,45 @@ class MetaManager:
                 retry_delay = self.RETRY_DELAY * (2 ** retry_count)
                 logger.warning(f"Request failed: {e}. Retrying in {retry_delay}s")
                 time.sleep(retry_delay)
-                return self._rate_limited_request(endpoint, params, retry_count + 1)
+                return self._rate_limited_request(endpoint, params, retry_count + 1, revalidate)
             raise
 
+    def iter_edge(self, endpoint: str, params: Dict = None, prefetch: bool = True, revalidate: bool = False) -> Iterator[List[Dict]]:
+        """
+        Yield an edge (e.g. act_X/campaigns) one page of entities at a time.
+
+        Every page goes through _rate_limited_request, so pagination shares the
+        rate limiter and retry policy of the first request. Failures raise
+        instead of silently returning partial data. With prefetch enabled the
+        next cursor is requested in the background while the caller is still
+        processing the current page. revalidate is passed on for every page.
+        """
+        data = self._rate_limited_request(endpoint, dict(params or {}), revalidate=revalidate)
+
+        if not prefetch:
+            while True:
+                yield data.get('data', [])
+                next_url = data.get('paging', {}).get('next')
+                if not next_url:
+                    return
+                data = self._rate_limited_request(next_url, revalidate=revalidate)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                next_url = data.get('paging', {}).get('next')
+                next_page = executor.submit(self._rate_limited_request, next_url, revalidate=revalidate) if next_url else None
+                yield data.get('data', [])
+                if next_page is None:
+                    return
+                data = next_page.result()
+
+    def fetch_edge(self, endpoint: str, params: Dict = None, revalidate: bool = False) -> List[Dict]:
+        """Collect every entity of a paginated edge into one list"""
+        items = []
+        for page in self.iter_edge(endpoint, params, revalidate=revalidate):
+            items.extend(page)
+        return items
+
     def _get_access_token(self) -> str:
         """Get Facebook access token for user"""
         try:
@@ -139,9 +398,9 @@ class MetaManager:
                 detail="Facebook authentication required. Please connect your Facebook account."
             )
     
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
+    def _make_request(self, endpoint: str, params: Dict = None, revalidate: bool = False) -> Dict:
         """Legacy method - redirects to rate-limited request"""
-        return self._rate_limited_request(endpoint, params)
+        return self._rate_limited_request(endpoint, params, revalidate=revalidate)
     
     # def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
     #     """Make request to Facebook Graph API"""
@@ -242,7 +501,7 @@ class MetaManager:
         try:
             data = self._make_request("me/adaccounts", {
                 'fields': 'id,account_id,name,account_status,currency,timezone_name,amount_spent,balance'
-            })
+            }, revalidate=True)
             
             # Map Facebook status codes to strings
             status_map = {
@@ -558,14 +817,8 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         try:
-            # Get daily breakdown
-            daily_data = self._make_request(f"{account_id}/insights", {
-                'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                'fields': 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency',
-                'time_increment': '1',
-                'level': 'account',
-                'default_summary': 'true'
-            })
+            # Get daily breakdown (one row per day, from the insights store)
+            daily_rows = self._get_daily_insight_rows(account_id, since, until, {'level': 'account'})
 
             # Get summary totals (without time_increment for accurate reach)
             summary_data = self._make_request(f"{account_id}/insights", {
@@ -575,7 +828,7 @@ class MetaManager:
                 'default_summary': 'true'
             })
             
-            if not daily_data.get('data'):
+            if not daily_rows:
                 return {
                     'timeseries': [],
                     'summary': {
@@ -593,7 +846,7 @@ class MetaManager:
             
             timeseries = []
             
-            for day_data in daily_data['data']:
+            for day_data in daily_rows:
                 # Extract conversions from actions for this day
                 conversions = 0
                 actions = day_data.get('actions', [])
@@ -667,6 +920,112 @@ class MetaManager:
             'total_reach': 0
         }
 
+    # =========================================================================
+    # ENTITY STORE
+    # =========================================================================
+
+    def _synced_entity_store(self, account_id: str) -> Optional[MetaEntityStore]:
+        """
+        Entity store with the account refreshed, or None to list from Graph.
+
+        The refresh runs with this user's token at most once per
+        ENTITY_REFRESH_INTERVAL, which also confirms the user can still see
+        the account before it is served from the shared store.
+        """
+        store = get_meta_entity_store()
+        if store is None:
+            return None
+
+        cache_key = f"entity_sync:{account_id}"
+        if self._cache_get(cache_key) is not None:
+            return store
+
+        try:
+            store.sync_account(account_id, self.fetch_edge)
+        except Exception as e:
+            logger.warning(f"Entity store sync failed for {account_id}, listing from Graph: {e}")
+            return None
+
+        self._cache_set(cache_key, True, self.ENTITY_REFRESH_INTERVAL)
+        return store
+
+    def _resolve_account_ids(self, entity_ids: List[str]) -> Dict[str, str]:
+        """
+        Map campaign, ad set or ad IDs to their ad account (act_...).
+        Known entities come from the entity store; the rest are resolved with
+        one multi-ID lookup per GRAPH_MAX_IDS_PER_REQUEST IDs.
+        """
+        accounts = {}
+        store = get_meta_entity_store()
+        if store is not None:
+            try:
+                accounts = store.account_ids_for(entity_ids)
+            except Exception as e:
+                logger.debug(f"Entity store account lookup failed: {e}")
+
+        unknown = []
+        for entity_id in dict.fromkeys(entity_ids):
+            if entity_id in accounts:
+                continue
+            # An entity never moves between accounts, so lookups stay cached
+            cached = self._cache_get(f"entity_account:{entity_id}")
+            if cached:
+                accounts[entity_id] = cached
+            else:
+                unknown.append(entity_id)
+
+        for i in range(0, len(unknown), self.GRAPH_MAX_IDS_PER_REQUEST):
+            chunk = unknown[i:i + self.GRAPH_MAX_IDS_PER_REQUEST]
+            data = self._rate_limited_request('', {'ids': ','.join(chunk), 'fields': 'account_id'})
+            for entity_id, node in data.items():
+                if node.get('account_id'):
+                    accounts[entity_id] = self._normalize_account_id(node['account_id'])
+                    self._cache_set(f"entity_account:{entity_id}", accounts[entity_id], self.ENTITY_ACCOUNT_CACHE_TTL)
+
+        return accounts
+
+    def _entity_children_from_store(self, level: str, parent_ids: List[str]) -> Optional[List[Dict]]:
+        """
+        Children (ad sets of campaigns, ads of ad sets) served from the entity
+        store, or None when any parent cannot be resolved there.
+        """
+        store = get_meta_entity_store()
+        if store is None or not parent_ids:
+            return None
+
+        try:
+            accounts = self._resolve_account_ids(parent_ids)
+
+            for account_id in set(accounts.values()):
+                if self._synced_entity_store(account_id) is None:
+                    return None
+
+            if len(store.account_ids_for(parent_ids)) < len(set(parent_ids)):
+                # Parents missing from the account edges (e.g. deleted)
+                return None
+
+            return store.list_children(level, parent_ids)
+
+        except Exception as e:
+            logger.warning(f"Entity store lookup failed for {level}s, listing from Graph: {e}")
+            return None
+
+    def get_campaigns_full(self, account_id: str) -> List[Dict]:
+        """
+        All campaigns of an account with the full metadata field set
+        (used by the chat drill-down).
+        """
+        normalized_account_id = self._normalize_account_id(account_id)
+
+        store = self._synced_entity_store(normalized_account_id)
+        if store is not None:
+            return store.list_entities(normalized_account_id, 'campaign')
+
+        return self.fetch_edge(f"{normalized_account_id}/campaigns", {
+            'fields': MetaEntityStore.LEVELS['campaign']['fields'],
+            'limit': 500  # maximum allowed per request
+        })
+
     def get_campaigns_list(self, account_id: str, include_status: list = None) -> Dict:
         """
         Get list of all campaigns for an ad account without date filtering.
@@ -682,48 +1041,36 @@ class MetaManager:
         """
         try:
             campaigns = []
-            params = {
-                'fields': 'id,name,status,objective,created_time,updated_time,start_time,stop_time',
-                'limit': 500  # Increased limit for faster fetching
-            }
-            
-            # Add status filter if provided
-            if include_status:
-                params['filtering'] = json.dumps([
-                    {'field': 'status', 'operator': 'IN', 'value': include_status}
-                ])
+            list_fields = ['id', 'name', 'status', 'objective', 'created_time', 'updated_time', 'start_time', 'stop_time']
             
             # Normalize account ID
             normalized_account_id = self._normalize_account_id(account_id)
             logger.info(f"Fetching campaigns for account: {normalized_account_id} (original: {account_id})")
 
-            # Pagination
-            next_url = None
-            page_count = 0
-
-            while True:
-                page_count += 1
-                logger.info(f"Fetching page {page_count}...")
-
-                if next_url:
-                    response = requests.get(next_url)
-                    if response.status_code != 200:
-                        logger.error(f"Pagination failed: {response.status_code}")
-                        break
-                    data = response.json()
-                else:
-                    data = self._make_request(f"{normalized_account_id}/campaigns", params)
-                
-                campaign_batch = data.get('data', [])
-                logger.info(f"Retrieved {len(campaign_batch)} campaigns in page {page_count}")
-                
-                campaigns.extend(campaign_batch)
+            store = self._synced_entity_store(normalized_account_id)
+            if store is not None:
+                for campaign in store.list_entities(normalized_account_id, 'campaign'):
+                    if include_status and campaign.get('status') not in include_status:
+                        continue
+                    campaigns.append({field: campaign[field] for field in list_fields if field in campaign})
+            else:
+                params = {
+                    'fields': ','.join(list_fields),
+                    'limit': 500  # Increased limit for faster fetching
+                }
                 
-                # Check for next page
-                paging = data.get('paging', {})
-                next_url = paging.get('next')
-                if not next_url:
-                    break
+                # Add status filter if provided
+                if include_status:
+                    params['filtering'] = json.dumps([
+                        {'field': 'status', 'operator': 'IN', 'value': include_status}
+                    ])
+
+                # Pagination
+                for page_count, campaign_batch in enumerate(
+                    self.iter_edge(f"{normalized_account_id}/campaigns", params, revalidate=True), start=1
+                ):
+                    logger.info(f"Retrieved {len(campaign_batch)} campaigns in page {page_count}")
+                    campaigns.extend(campaign_batch)
             
             logger.info(f"Total campaigns retrieved: {len(campaigns)}")
             
@@ -744,6 +1091,71 @@ class MetaManager:
             logger.error(f"Error fetching campaigns list: {e}")
             raise
     
+    def _fetch_campaign_period_insights(self, campaign: Dict, since: str, until: str) -> Dict:
+        """Fetch period insights for one campaign as a flat campaign row"""
+        campaign_id = campaign.get('id')
+        
+        campaign_result = {
+            'campaign_id': campaign_id,
+            'campaign_name': campaign.get('name'),
+            'status': campaign.get('status'),
+            'spend': 0.0,
+            'impressions': 0,
+            'clicks': 0,
+            'conversions': 0,
+            'cpc': 0.0,
+            'cpm': 0.0,
+            'ctr': 0.0,
+            'reach': 0,
+            'frequency': 0.0,
+            'has_data': False
+        }
+        
+        try:
+            # ✅ INCREASED delay to avoid rate limits
+            time.sleep(self.RATE_LIMIT_DELAY * 2)  # Double the delay (was 0.2s, now 0.4s)
+            
+            insights = self._rate_limited_request(f"{campaign_id}/insights", {
+                'time_range': json.dumps({"since": since, "until": until}),
+                'fields': 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency'
+            })
+            
+            insights_data = insights.get('data', [])
+            
+            if insights_data:
+                insights_data = insights_data[0]
+                
+                conversions = sum(
+                    int(action.get('value', 0))
+                    for action in insights_data.get('actions', [])
+                    if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
+                )
+                
+                campaign_result.update({
+                    'spend': float(insights_data.get('spend', 0)),
+                    'impressions': int(insights_data.get('impressions', 0)),
+                    'clicks': int(insights_data.get('clicks', 0)),
+                    'conversions': conversions,
+                    'cpc': float(insights_data.get('cpc', 0)),
+                    'cpm': float(insights_data.get('cpm', 0)),
+                    'ctr': float(insights_data.get('ctr', 0)),
+                    'reach': int(insights_data.get('reach', 0)),
+                    'frequency': float(insights_data.get('frequency', 0)),
+                    'has_data': True
+                })
+                
+        except Exception as e:
+            # ✅ Handle rate limit errors with exponential backoff
+            error_str = str(e)
+            if 'Application request limit reached' in error_str or 'error_subcode": 1504022' in error_str:
+                logger.warning(f"⚠️ Rate limit hit for campaign {campaign_id}, waiting 5 seconds...")
+                time.sleep(5)  # Wait longer when rate limited
+                # Don't mark as error, just continue without data
+            else:
+                logger.warning(f"Error fetching insights for campaign {campaign_id}: {e}")
+
+        return campaign_result
+
     def get_campaigns_paginated(
         self,
         account_id: str,
@@ -776,29 +1188,11 @@ class MetaManager:
 
         try:
             # Step 1: Get ALL campaign IDs first (lightweight query)
-            all_campaign_ids = []
             params = {
                 'fields': 'id,name,status',
                 'limit': 500,
             }
-
-            next_url = None
-            while True:
-                if next_url:
-                    time.sleep(self.RATE_LIMIT_DELAY)
-                    response = requests.get(next_url)
-                    if response.status_code != 200:
-                        break
-                    data = response.json()
-                else:
-                    data = self._rate_limited_request(f"{normalized_account_id}/campaigns", params)
-                
-                campaigns_batch = data.get('data', [])
-                all_campaign_ids.extend(campaigns_batch)
-                
-                next_url = data.get('paging', {}).get('next')
-                if not next_url:
-                    break
+            all_campaign_ids = self.fetch_edge(f"{normalized_account_id}/campaigns", params)
             
             total_campaigns = len(all_campaign_ids)
             logger.info(f"Total campaigns available: {total_campaigns}")
@@ -818,71 +1212,10 @@ class MetaManager:
                 }
             
             # Step 3: Fetch insights for only this page
-            campaigns_data = []
-            
-            for campaign in paginated_campaigns:
-                campaign_id = campaign.get('id')
-                
-                campaign_result = {
-                    'campaign_id': campaign_id,
-                    'campaign_name': campaign.get('name'),
-                    'status': campaign.get('status'),
-                    'spend': 0.0,
-                    'impressions': 0,
-                    'clicks': 0,
-                    'conversions': 0,
-                    'cpc': 0.0,
-                    'cpm': 0.0,
-                    'ctr': 0.0,
-                    'reach': 0,
-                    'frequency': 0.0,
-                    'has_data': False
-                }
-                
-                try:
-                    # ✅ INCREASED delay to avoid rate limits
-                    time.sleep(self.RATE_LIMIT_DELAY * 2)  # Double the delay (was 0.2s, now 0.4s)
-                    
-                    insights = self._rate_limited_request(f"{campaign_id}/insights", {
-                        'time_range': json.dumps({"since": since, "until": until}),
-                        'fields': 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency'
-                    })
-                    
-                    insights_data = insights.get('data', [])
-                    
-                    if insights_data:
-                        insights_data = insights_data[0]
-                        
-                        conversions = sum(
-                            int(action.get('value', 0))
-                            for action in insights_data.get('actions', [])
-                            if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                        )
-                        
-                        campaign_result.update({
-                            'spend': float(insights_data.get('spend', 0)),
-                            'impressions': int(insights_data.get('impressions', 0)),
-                            'clicks': int(insights_data.get('clicks', 0)),
-                            'conversions': conversions,
-                            'cpc': float(insights_data.get('cpc', 0)),
-                            'cpm': float(insights_data.get('cpm', 0)),
-                            'ctr': float(insights_data.get('ctr', 0)),
-                            'reach': int(insights_data.get('reach', 0)),
-                            'frequency': float(insights_data.get('frequency', 0)),
-                            'has_data': True
-                        })
-                        
-                except Exception as e:
-                    # ✅ Handle rate limit errors with exponential backoff
-                    error_str = str(e)
-                    if 'Application request limit reached' in error_str or 'error_subcode": 1504022' in error_str:
-                        logger.warning(f"⚠️ Rate limit hit for campaign {campaign_id}, waiting 5 seconds...")
-                        time.sleep(5)  # Wait longer when rate limited
-                        # Don't mark as error, just continue without data
-                    else:
-                        logger.warning(f"Error fetching insights for campaign {campaign_id}: {e}")
-                        
-                campaigns_data.append(campaign_result)
+            campaigns_data = [
+                self._fetch_campaign_period_insights(campaign, since, until)
+                for campaign in paginated_campaigns
+            ]
             
             has_more = (offset + limit) < total_campaigns
             
@@ -911,50 +1244,34 @@ class MetaManager:
     ) -> List[Dict]:
         """
         Get all campaigns with insights (no pagination).
-        This internally uses get_campaigns_paginated but fetches all results.
+        Streams the campaigns edge page by page; the next page is prefetched
+        while insights for the current page are being fetched.
         """
+        if start_date and end_date:
+            self._validate_date_range(start_date, end_date)
+
+        since, until = self._period_to_dates(period, start_date, end_date)
+        normalized_account_id = self._normalize_account_id(account_id)
+
         try:
-            logger.info(f"🔍 Getting all campaigns for account: {account_id}")
+            logger.info(f"🔍 Getting all campaigns for account: {normalized_account_id}")
+            logger.info(f"🚦 Processing carefully to respect Facebook API rate limits...")
             
             all_campaigns = []
-            offset = 0
-            limit = 50  # Fetch in batches of 50
-            
-            # First call to get total count
-            first_result = self.get_campaigns_paginated(
-                account_id, period, start_date, end_date, limit, offset
-            )
-            
-            campaigns = first_result.get('campaigns', [])
-            all_campaigns.extend(campaigns)
-            
-            # Get total from pagination.total, not total_count
-            pagination = first_result.get('pagination', {})
-            total_count = pagination.get('total', 0)
-            
-            # ✅ ADD: Better progress message
-            estimated_time = (total_count / 50) * 30  # ~30 seconds per batch of 50
-            logger.info(f"📊 Total campaigns to fetch: {total_count}")
-            logger.info(f"⏱️ Estimated time: {estimated_time:.0f} seconds (~{estimated_time/60:.1f} minutes)")
-            logger.info(f"🚦 Processing carefully to respect Facebook API rate limits...")
+            params = {
+                'fields': 'id,name,status',
+                'limit': 50,  # Small pages so listing overlaps with insights fetching
+            }
             
-            # Fetch remaining campaigns if there are more
-            batch_number = 1
-            while offset + limit < total_count:
-                offset += limit
-                batch_number += 1
-                progress_percent = (len(all_campaigns) / total_count) * 100
-                
-                logger.info(f"📦 Fetching batch {batch_number}/{(total_count + limit - 1) // limit}: offset={offset}, limit={limit} ({progress_percent:.1f}% complete)")
+            for batch_number, campaign_batch in enumerate(
+                self.iter_edge(f"{normalized_account_id}/campaigns", params, revalidate=True), start=1
+            ):
+                logger.info(f"📦 Processing batch {batch_number}: {len(campaign_batch)} campaigns")
                 
-                result = self.get_campaigns_paginated(
-                    account_id, period, start_date, end_date, limit, offset
-                )
-                
-                campaigns = result.get('campaigns', [])
-                all_campaigns.extend(campaigns)
+                for campaign in campaign_batch:
+                    all_campaigns.append(self._fetch_campaign_period_insights(campaign, since, until))
                 
-                logger.info(f"✅ Fetched {len(campaigns)} campaigns (Total: {len(all_campaigns)}/{total_count})")
+                logger.info(f"✅ Fetched {len(campaign_batch)} campaigns (Total: {len(all_campaigns)})")
             
             logger.info(f"✨ Successfully fetched all {len(all_campaigns)} campaigns")
             return all_campaigns
@@ -1000,31 +1317,11 @@ class MetaManager:
                     'limit': 500,
                 }
 
-                next_url = None
-                page_count = 0
-
-                while True:
-                    page_count += 1
-                    if next_url:
-                        # Add rate limiting for pagination
-                        time.sleep(0.5)
-                        response = requests.get(next_url)
-                        if response.status_code != 200:
-                            logger.warning(f"Pagination failed at page {page_count}")
-                            break
-                        data = response.json()
-                    else:
-                        data = self._rate_limited_request(f"{normalized_account_id}/campaigns", params)
-                    
-                    campaign_batch = data.get('data', [])
+                for page_count, campaign_batch in enumerate(
+                    self.iter_edge(f"{normalized_account_id}/campaigns", params, revalidate=True), start=1
+                ):
                     all_campaigns.extend(campaign_batch)
-                    
                     logger.info(f"Page {page_count}: Retrieved {len(campaign_batch)} campaigns")
-                    
-                    paging = data.get('paging', {})
-                    next_url = paging.get('next')
-                    if not next_url:
-                        break
                 
                 logger.info(f"Total campaigns found: {len(all_campaigns)}")
                 
@@ -1166,6 +1463,48 @@ class MetaManager:
                 logger.error(f"Error fetching campaigns: {e}")
                 raise
 
+    def _get_daily_insight_rows(self, entity_id: str, since: str, until: str, extra_params: Dict = None) -> List[Dict]:
+        """
+        Daily insights rows (time_increment=1) for one entity.
+
+        Served from the insights store, which only asks Graph for days it has
+        not stored yet plus the recent days still inside the attribution
+        window. Falls back to fetching the whole range without MongoDB.
+        """
+        def fetch_range(range_since: str, range_until: str) -> List[Dict]:
+            return self.fetch_edge(f"{entity_id}/insights", {
+                'time_range': f'{{"since":"{range_since}","until":"{range_until}"}}',
+                'fields': self.DAILY_INSIGHTS_FIELDS,
+                'time_increment': '1',
+                'limit': 100,
+                **(extra_params or {})
+            })
+
+        store = get_meta_insights_store()
+        if store is None:
+            return fetch_range(since, until)
+
+        refresh_key = f"insights_recent:{entity_id}"
+        refresh_recent = self._cache_get(refresh_key) is None
+
+        try:
+            rows, fetched = store.get_daily_rows(
+                entity_id, since, until, self.DAILY_INSIGHTS_FIELDS, fetch_range, refresh_recent
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.warning(f"Insights store failed for {entity_id}, fetching from Graph: {e}")
+            return fetch_range(since, until)
+
+        if refresh_recent:
+            if not fetched:
+                # Stored rows are shared between users - confirm this user can read the entity
+                self._rate_limited_request(entity_id, {'fields': 'id'})
+            self._cache_set(refresh_key, True, self.RECENT_INSIGHTS_REFRESH_INTERVAL)
+
+        return rows
+
     def get_campaigns_timeseries(self, campaign_ids: List[str], period: str = None, start_date: str = None, end_date: str = None) -> List[Dict]:
         """Get time-series data for multiple campaigns"""
         if start_date and end_date:
@@ -1176,14 +1515,10 @@ class MetaManager:
         results = []
         for campaign_id in campaign_ids:
             try:
-                data = self._make_request(f"{campaign_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency',
-                    'time_increment': '1',
-                })
+                rows = self._get_daily_insight_rows(campaign_id, since, until)
                 
                 timeseries = []
-                for day_data in data.get('data', []):
+                for day_data in rows:
                     conversions = sum(
                         int(action.get('value', 0))
                         for action in day_data.get('actions', [])
@@ -1212,6 +1547,103 @@ class MetaManager:
         
         return results
 
+    def _fetch_breakdown_insights(self, level: str, entity_ids: List[str], since: str, until: str, breakdowns: str) -> Dict[str, List[Dict]]:
+        """
+        Breakdown insights for many campaigns, ad sets or ads at once.
+
+        Entities are grouped by ad account and queried through
+        act_X/insights?level=<level>&filtering=[{field: '<level>.id', operator: 'IN', ...}],
+        up to INSIGHTS_FILTER_CHUNK_SIZE entities per (paged) query, and the
+        rows are split back out per entity. Entities whose account cannot be
+        resolved are queried one by one.
+
+        Returns:
+            Dict mapping each successfully queried entity ID to its rows
+        """
+        id_field = f"{level}_id"
+        params = {
+            'time_range': f'{{"since":"{since}","until":"{until}"}}',
+            'fields': f'{id_field},spend,impressions,reach,actions',
+            'breakdowns': breakdowns,
+            'level': level,
+            'limit': 500
+        }
+
+        try:
+            accounts = self._resolve_account_ids(entity_ids)
+        except Exception as e:
+            logger.warning(f"Could not resolve ad accounts for {level}s: {e}")
+            accounts = {}
+
+        by_account: Dict[str, List[str]] = {}
+        for entity_id in dict.fromkeys(entity_ids):
+            if entity_id in accounts:
+                by_account.setdefault(accounts[entity_id], []).append(entity_id)
+
+        rows_by_entity: Dict[str, List[Dict]] = {}
+        for account_id, account_entity_ids in by_account.items():
+            for i in range(0, len(account_entity_ids), self.INSIGHTS_FILTER_CHUNK_SIZE):
+                chunk = account_entity_ids[i:i + self.INSIGHTS_FILTER_CHUNK_SIZE]
+                try:
+                    rows = self.fetch_edge(f"{account_id}/insights", {
+                        **params,
+                        'filtering': json.dumps([{'field': f'{level}.id', 'operator': 'IN', 'value': chunk}])
+                    })
+                except Exception as e:
+                    logger.error(f"Error fetching {breakdowns} breakdown for {len(chunk)} {level}s in {account_id}: {e}")
+                    continue
+
+                for entity_id in chunk:
+                    rows_by_entity[entity_id] = []
+                for row in rows:
+                    if row.get(id_field) in rows_by_entity:
+                        rows_by_entity[row[id_field]].append(row)
+
+        for entity_id in dict.fromkeys(entity_ids):
+            if entity_id in accounts:
+                continue
+            try:
+                rows_by_entity[entity_id] = self.fetch_edge(f"{entity_id}/insights", {
+                    'time_range': params['time_range'],
+                    'fields': 'spend,impressions,reach,actions',
+                    'breakdowns': breakdowns,
+                })
+            except Exception as e:
+                logger.error(f"Error fetching {breakdowns} breakdown for {level} {entity_id}: {e}")
+
+        return rows_by_entity
+
+    def _format_demographic_row(self, item: Dict) -> Dict:
+        conversions = sum(
+            int(action.get('value', 0))
+            for action in item.get('actions', [])
+            if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
+        )
+        
+        return {
+            'age': item.get('age'),
+            'gender': item.get('gender'),
+            'spend': float(item.get('spend', 0)),
+            'impressions': int(item.get('impressions', 0)),
+            'reach': int(item.get('reach', 0)),
+            'results': conversions
+        }
+
+    def _format_placement_row(self, item: Dict) -> Dict:
+        conversions = sum(
+            int(action.get('value', 0))
+            for action in item.get('actions', [])
+            if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
+        )
+        
+        return {
+            'platform': item.get('publisher_platform'),
+            'spend': float(item.get('spend', 0)),
+            'impressions': int(item.get('impressions', 0)),
+            'reach': int(item.get('reach', 0)),
+            'results': conversions
+        }
+
     def get_campaigns_demographics(self, campaign_ids: List[str], period: str = None, start_date: str = None, end_date: str = None) -> List[Dict]:
         """Get age/gender demographics for multiple campaigns"""
         if start_date and end_date:
@@ -1220,37 +1652,15 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         results = []
+        rows_by_entity = self._fetch_breakdown_insights('campaign', campaign_ids, since, until, 'age,gender')
+        
         for campaign_id in campaign_ids:
-            try:
-                data = self._make_request(f"{campaign_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,reach,actions',
-                    'breakdowns': 'age,gender',
-                })
-                
-                demographics = []
-                for item in data.get('data', []):
-                    conversions = sum(
-                        int(action.get('value', 0))
-                        for action in item.get('actions', [])
-                        if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                    )
-                    
-                    demographics.append({
-                        'age': item.get('age'),
-                        'gender': item.get('gender'),
-                        'spend': float(item.get('spend', 0)),
-                        'impressions': int(item.get('impressions', 0)),
-                        'reach': int(item.get('reach', 0)),
-                        'results': conversions
-                    })
-                
-                results.append({
-                    'campaign_id': campaign_id,
-                    'demographics': demographics
-                })
-            except Exception as e:
-                logger.error(f"Error fetching demographics for campaign {campaign_id}: {e}")
+            if campaign_id not in rows_by_entity:
+                continue
+            results.append({
+                'campaign_id': campaign_id,
+                'demographics': [self._format_demographic_row(item) for item in rows_by_entity[campaign_id]]
+            })
         
         return results
 
@@ -1262,127 +1672,128 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         results = []
+        rows_by_entity = self._fetch_breakdown_insights('campaign', campaign_ids, since, until, 'publisher_platform')
+        
         for campaign_id in campaign_ids:
-            try:
-                data = self._make_request(f"{campaign_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,reach,actions',
-                    'breakdowns': 'publisher_platform',
-                })
-                
-                placements = []
-                for item in data.get('data', []):
-                    conversions = sum(
-                        int(action.get('value', 0))
-                        for action in item.get('actions', [])
-                        if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                    )
-                    
-                    placements.append({
-                        'platform': item.get('publisher_platform'),
-                        'spend': float(item.get('spend', 0)),
-                        'impressions': int(item.get('impressions', 0)),
-                        'reach': int(item.get('reach', 0)),
-                        'results': conversions
-                    })
-                
-                results.append({
-                    'campaign_id': campaign_id,
-                    'placements': placements
-                })
-            except Exception as e:
-                logger.error(f"Error fetching placements for campaign {campaign_id}: {e}")
+            if campaign_id not in rows_by_entity:
+                continue
+            results.append({
+                'campaign_id': campaign_id,
+                'placements': [self._format_placement_row(item) for item in rows_by_entity[campaign_id]]
+            })
         
         return results
     
+    def _format_adset(self, adset: Dict, campaign_id: str) -> Dict:
+        """Shape a raw ad set for the ad sets response"""
+        targeting = adset.get('targeting', {})
+        geo_locations = targeting.get('geo_locations', {})
+        
+        locations = []
+        if geo_locations.get('countries'):
+            locations.extend(geo_locations.get('countries', []))
+        if geo_locations.get('regions'):
+            locations.extend([r.get('name', r.get('key', '')) for r in geo_locations.get('regions', [])])
+        if geo_locations.get('cities'):
+            locations.extend([c.get('name', c.get('key', '')) for c in geo_locations.get('cities', [])])
+        
+        if not locations:
+            locations = ['Not specified']
+        
+        daily_budget = adset.get('daily_budget')
+        lifetime_budget = adset.get('lifetime_budget')
+        budget_remaining = adset.get('budget_remaining')
+        
+        return {
+            'id': adset.get('id'),
+            'name': adset.get('name'),
+            'campaign_id': campaign_id,
+            'status': adset.get('status'),
+            'optimization_goal': adset.get('optimization_goal', 'N/A'),
+            'billing_event': adset.get('billing_event', 'N/A'),
+            'daily_budget': float(daily_budget) / 100 if daily_budget else 0,
+            'lifetime_budget': float(lifetime_budget) / 100 if lifetime_budget else 0,
+            'budget_remaining': float(budget_remaining) / 100 if budget_remaining else 0,
+            'locations': locations,
+            'created_time': adset.get('created_time'),
+            'updated_time': adset.get('updated_time')
+        }
+
+    def _fetch_children_by_parents(self, edge: str, parent_level: str, parent_ids: List[str], fields: str, limit: int = 200) -> List[Dict]:
+        """
+        Children (ad sets or ads) of many parents with one query per account.
+
+        Parents are grouped by ad account and each group is listed through the
+        account's edge filtered with '<parent_level>.id IN [...]'. Parents whose
+        account cannot be resolved are listed one by one. Children come back
+        grouped in parent_ids order.
+        """
+        parent_field = f"{parent_level}_id"
+        fields = f"{fields},{parent_field}"
+
+        try:
+            accounts = self._resolve_account_ids(parent_ids)
+        except Exception as e:
+            logger.warning(f"Could not resolve ad accounts for {parent_level}s: {e}")
+            accounts = {}
+
+        by_account: Dict[str, List[str]] = {}
+        for parent_id in dict.fromkeys(parent_ids):
+            if parent_id in accounts:
+                by_account.setdefault(accounts[parent_id], []).append(parent_id)
+
+        children = []
+        for account_id, account_parent_ids in by_account.items():
+            for i in range(0, len(account_parent_ids), self.INSIGHTS_FILTER_CHUNK_SIZE):
+                chunk = account_parent_ids[i:i + self.INSIGHTS_FILTER_CHUNK_SIZE]
+                try:
+                    batch = self.fetch_edge(f"{account_id}/{edge}", {
+                        'fields': fields,
+                        'filtering': json.dumps([{'field': f'{parent_level}.id', 'operator': 'IN', 'value': chunk}]),
+                        'limit': limit
+                    })
+                    logger.info(f"{account_id}: Found {len(batch)} {edge} for {len(chunk)} {parent_level}s")
+                    children.extend(batch)
+                except Exception as e:
+                    logger.error(f"Error fetching {edge} for {len(chunk)} {parent_level}s in {account_id}: {e}")
+
+        for parent_id in dict.fromkeys(parent_ids):
+            if parent_id in accounts:
+                continue
+            try:
+                batch = self.fetch_edge(f"{parent_id}/{edge}", {'fields': fields, 'limit': limit})
+                for child in batch:
+                    child.setdefault(parent_field, parent_id)
+                children.extend(batch)
+            except Exception as e:
+                logger.error(f"Error fetching {edge} for {parent_level} {parent_id}: {e}")
+
+        order = {parent_id: index for index, parent_id in enumerate(parent_ids)}
+        children.sort(key=lambda child: order.get(child.get(parent_field), len(order)))
+        return children
+
     def get_adsets_by_campaigns(self, campaign_ids: List[str], period: str = None, start_date: str = None, end_date: str = None) -> List[Dict]:
             """
             Get ad sets for multiple campaigns with proper rate limiting.
+            Served from the entity store when the campaigns' accounts are synced,
+            otherwise with one filtered account-level query per account.
             """
             logger.info(f"Fetching ad sets for {len(campaign_ids)} campaigns")
             
             all_adsets = []
             
-            for campaign_id in campaign_ids:
+            adsets = self._entity_children_from_store('adset', campaign_ids)
+            if adsets is None:
+                adsets = self._fetch_children_by_parents(
+                    'adsets', 'campaign', campaign_ids,
+                    'id,name,status,optimization_goal,billing_event,daily_budget,lifetime_budget,budget_remaining,targeting,created_time,updated_time'
+                )
+            
+            for adset in adsets:
                 try:
-                    logger.info(f"Fetching ad sets for campaign: {campaign_id}")
-                    
-                    # Use rate-limited request
-                    data = self._rate_limited_request(f"{campaign_id}/adsets", {
-                        'fields': 'id,name,status,optimization_goal,billing_event,daily_budget,lifetime_budget,budget_remaining,targeting,created_time,updated_time',
-                        'limit': 100
-                    })
-                    
-                    adsets_batch = data.get('data', [])
-                    logger.info(f"Campaign {campaign_id}: Found {len(adsets_batch)} ad sets")
-                    
-                    # Handle pagination with rate limiting
-                    next_url = data.get('paging', {}).get('next')
-                    page_count = 1
-                    
-                    while next_url:
-                        logger.info(f"Fetching page {page_count + 1} for campaign {campaign_id}")
-                        
-                        # Rate limit for pagination
-                        time.sleep(self.RATE_LIMIT_DELAY)
-                        
-                        response = requests.get(next_url)
-                        if response.status_code != 200:
-                            logger.warning(f"Pagination failed at page {page_count + 1}")
-                            break
-                        
-                        page_data = response.json()
-                        page_batch = page_data.get('data', [])
-                        adsets_batch.extend(page_batch)
-                        
-                        next_url = page_data.get('paging', {}).get('next')
-                        page_count += 1
-                    
-                    # Process ad sets
-                    for adset in adsets_batch:
-                        try:
-                            targeting = adset.get('targeting', {})
-                            geo_locations = targeting.get('geo_locations', {})
-                            
-                            locations = []
-                            if geo_locations.get('countries'):
-                                locations.extend(geo_locations.get('countries', []))
-                            if geo_locations.get('regions'):
-                                locations.extend([r.get('name', r.get('key', '')) for r in geo_locations.get('regions', [])])
-                            if geo_locations.get('cities'):
-                                locations.extend([c.get('name', c.get('key', '')) for c in geo_locations.get('cities', [])])
-                            
-                            if not locations:
-                                locations = ['Not specified']
-                            
-                            daily_budget = adset.get('daily_budget')
-                            lifetime_budget = adset.get('lifetime_budget')
-                            budget_remaining = adset.get('budget_remaining')
-                            
-                            adset_data = {
-                                'id': adset.get('id'),
-                                'name': adset.get('name'),
-                                'campaign_id': campaign_id,
-                                'status': adset.get('status'),
-                                'optimization_goal': adset.get('optimization_goal', 'N/A'),
-                                'billing_event': adset.get('billing_event', 'N/A'),
-                                'daily_budget': float(daily_budget) / 100 if daily_budget else 0,
-                                'lifetime_budget': float(lifetime_budget) / 100 if lifetime_budget else 0,
-                                'budget_remaining': float(budget_remaining) / 100 if budget_remaining else 0,
-                                'locations': locations,
-                                'created_time': adset.get('created_time'),
-                                'updated_time': adset.get('updated_time')
-                            }
-                            
-                            all_adsets.append(adset_data)
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing ad set {adset.get('id')}: {e}")
-                            continue
-                    
+                    all_adsets.append(self._format_adset(adset, adset.get('campaign_id')))
                 except Exception as e:
-                    logger.error(f"Error fetching ad sets for campaign {campaign_id}: {e}")
-                    continue
+                    logger.error(f"Error processing ad set {adset.get('id')}: {e}")
             
             logger.info(f"Total ad sets retrieved: {len(all_adsets)}")
             return all_adsets
@@ -1397,14 +1808,10 @@ class MetaManager:
         results = []
         for adset_id in adset_ids:
             try:
-                data = self._make_request(f"{adset_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency',
-                    'time_increment': '1',
-                })
+                rows = self._get_daily_insight_rows(adset_id, since, until)
                 
                 timeseries = []
-                for day_data in data.get('data', []):
+                for day_data in rows:
                     conversions = sum(
                         int(action.get('value', 0))
                         for action in day_data.get('actions', [])
@@ -1441,37 +1848,15 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         results = []
+        rows_by_entity = self._fetch_breakdown_insights('adset', adset_ids, since, until, 'age,gender')
+        
         for adset_id in adset_ids:
-            try:
-                data = self._make_request(f"{adset_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,reach,actions',
-                    'breakdowns': 'age,gender',
-                })
-                
-                demographics = []
-                for item in data.get('data', []):
-                    conversions = sum(
-                        int(action.get('value', 0))
-                        for action in item.get('actions', [])
-                        if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                    )
-                    
-                    demographics.append({
-                        'age': item.get('age'),
-                        'gender': item.get('gender'),
-                        'spend': float(item.get('spend', 0)),
-                        'impressions': int(item.get('impressions', 0)),
-                        'reach': int(item.get('reach', 0)),
-                        'results': conversions
-                    })
-                
-                results.append({
-                    'adset_id': adset_id,
-                    'demographics': demographics
-                })
-            except Exception as e:
-                logger.error(f"Error fetching demographics for adset {adset_id}: {e}")
+            if adset_id not in rows_by_entity:
+                continue
+            results.append({
+                'adset_id': adset_id,
+                'demographics': [self._format_demographic_row(item) for item in rows_by_entity[adset_id]]
+            })
         
         return results
 
@@ -1483,96 +1868,176 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         results = []
+        rows_by_entity = self._fetch_breakdown_insights('adset', adset_ids, since, until, 'publisher_platform')
+        
         for adset_id in adset_ids:
+            if adset_id not in rows_by_entity:
+                continue
+            results.append({
+                'adset_id': adset_id,
+                'placements': [self._format_placement_row(item) for item in rows_by_entity[adset_id]]
+            })
+        
+        return results
+
+    def _format_ad(self, ad: Dict, adset_id: str) -> Dict:
+        """Shape a raw ad for the ads response, with preview and direct links"""
+        creative = ad.get('creative', {})
+        
+        # Build preview URL and direct link
+        ad_id = ad.get('id')
+        preview_link = ad.get('preview_shareable_link')
+        
+        # Construct Facebook Ads Manager link
+        ads_manager_link = f"https://www.facebook.com/adsmanager/manage/ads?act={adset_id.split('_')[0]}&selected_ad_ids={ad_id}"
+        
+        # Get image URL from creative
+        image_url = creative.get('image_url')
+        
+        # If no direct image_url, try to construct from image_hash
+        if not image_url and creative.get('image_hash'):
+            image_hash = creative.get('image_hash')
+            image_url = f"https://scontent.xx.fbcdn.net/v/t45.1600-4/{image_hash}"
+        
+        # Get video thumbnail or image
+        media_url = image_url or creative.get('thumbnail_url')
+        
+        # Try to get the post permalink if available
+        post_link = None
+        effective_story_id = ad.get('effective_object_story_id')
+        if effective_story_id:
+            post_link = f"https://www.facebook.com/{effective_story_id.replace('_', '/posts/')}"
+        
+        return {
+            'id': ad_id,
+            'name': ad.get('name'),
+            'ad_set_id': adset_id,
+            'status': ad.get('status'),
+            'creative': {
+                'title': creative.get('title'),
+                'body': creative.get('body'),
+                'image_url': image_url,
+                'video_id': creative.get('video_id'),
+                'thumbnail_url': creative.get('thumbnail_url'),
+                'media_url': media_url  # Primary media URL (image or video thumbnail)
+            },
+            'preview_link': preview_link,  # Shareable preview link
+            'ads_manager_link': ads_manager_link,  # Direct link to Ads Manager
+            'post_link': post_link,  # Direct link to Facebook post (if published)
+            'created_time': ad.get('created_time'),
+            'updated_time': ad.get('updated_time')
+        }
+
+    def _attach_creatives(self, ads: List[Dict]) -> List[Dict]:
+        """
+        Fill in creative details for ads listed with only creative{id}.
+
+        Each distinct creative is fetched once (multi-ID lookups of up to
+        GRAPH_MAX_IDS_PER_REQUEST) and cached on the manager; ads sharing a
+        creative share the result. Media referenced only by image_hash or
+        video_id is then resolved through _resolve_creative_media.
+        """
+        missing = []
+        for ad in ads:
+            creative = ad.get('creative') or {}
+            creative_id = creative.get('id')
+            if not creative_id or set(creative) - {'id'}:
+                continue  # No creative, or details already expanded
+            if self._cache_get(f"creative:{creative_id}") is None:
+                missing.append(creative_id)
+
+        missing = list(dict.fromkeys(missing))
+        for i in range(0, len(missing), self.GRAPH_MAX_IDS_PER_REQUEST):
+            chunk = missing[i:i + self.GRAPH_MAX_IDS_PER_REQUEST]
             try:
-                data = self._make_request(f"{adset_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,reach,actions',
-                    'breakdowns': 'publisher_platform',
+                data = self._rate_limited_request('', {
+                    'ids': ','.join(chunk),
+                    'fields': 'title,body,image_url,video_id,thumbnail_url,image_hash,object_story_spec'
                 })
-                
-                placements = []
-                for item in data.get('data', []):
-                    conversions = sum(
-                        int(action.get('value', 0))
-                        for action in item.get('actions', [])
-                        if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                    )
-                    
-                    placements.append({
-                        'platform': item.get('publisher_platform'),
-                        'spend': float(item.get('spend', 0)),
-                        'impressions': int(item.get('impressions', 0)),
-                        'reach': int(item.get('reach', 0)),
-                        'results': conversions
-                    })
-                
-                results.append({
-                    'adset_id': adset_id,
-                    'placements': placements
+            except Exception as e:
+                logger.error(f"Error fetching {len(chunk)} ad creatives: {e}")
+                continue
+            for creative_id, creative in data.items():
+                self._cache_set(f"creative:{creative_id}", creative, self.CREATIVE_CACHE_TTL)
+
+        for ad in ads:
+            creative = ad.get('creative') or {}
+            if creative.get('id') and not set(creative) - {'id'}:
+                ad['creative'] = self._cache_get(f"creative:{creative['id']}") or creative
+
+        self._resolve_creative_media(ads)
+        return ads
+
+    def _resolve_creative_media(self, ads: List[Dict]):
+        """
+        Resolve image URLs for creatives that only carry an image_hash, and
+        thumbnails for videos without one. Results are cached by image_hash
+        and video_id, so media reused across creatives is looked up once.
+        """
+        hashes_by_account: Dict[str, set] = {}
+        video_ids = set()
+        for ad in ads:
+            creative = ad.get('creative') or {}
+            image_hash = creative.get('image_hash')
+            if image_hash and not creative.get('image_url') and ad.get('account_id'):
+                if self._cache_get(f"creative_media:{image_hash}") is None:
+                    hashes_by_account.setdefault(self._normalize_account_id(ad['account_id']), set()).add(image_hash)
+            video_id = creative.get('video_id')
+            if video_id and not creative.get('thumbnail_url'):
+                if self._cache_get(f"creative_media:{video_id}") is None:
+                    video_ids.add(video_id)
+
+        for account_id, hashes in hashes_by_account.items():
+            try:
+                images = self.fetch_edge(f"{account_id}/adimages", {
+                    'hashes': json.dumps(sorted(hashes)),
+                    'fields': 'hash,url'
                 })
+                for image in images:
+                    if image.get('hash') and image.get('url'):
+                        self._cache_set(f"creative_media:{image['hash']}", image['url'], self.CREATIVE_CACHE_TTL)
             except Exception as e:
-                logger.error(f"Error fetching placements for adset {adset_id}: {e}")
-        
-        return results
+                logger.debug(f"Could not resolve {len(hashes)} image hashes for {account_id}: {e}")
+
+        video_ids = sorted(video_ids)
+        for i in range(0, len(video_ids), self.GRAPH_MAX_IDS_PER_REQUEST):
+            chunk = video_ids[i:i + self.GRAPH_MAX_IDS_PER_REQUEST]
+            try:
+                data = self._rate_limited_request('', {'ids': ','.join(chunk), 'fields': 'picture'})
+                for video_id, video in data.items():
+                    if video.get('picture'):
+                        self._cache_set(f"creative_media:{video_id}", video['picture'], self.CREATIVE_CACHE_TTL)
+            except Exception as e:
+                logger.debug(f"Could not resolve {len(chunk)} video thumbnails: {e}")
+
+        for ad in ads:
+            creative = ad.get('creative')
+            if not creative:
+                continue
+            if creative.get('image_hash') and not creative.get('image_url'):
+                image_url = self._cache_get(f"creative_media:{creative['image_hash']}")
+                if image_url:
+                    ad['creative'] = creative = {**creative, 'image_url': image_url}
+            if creative.get('video_id') and not creative.get('thumbnail_url'):
+                thumbnail_url = self._cache_get(f"creative_media:{creative['video_id']}")
+                if thumbnail_url:
+                    ad['creative'] = {**creative, 'thumbnail_url': thumbnail_url}
 
     def get_ads_by_adsets(self, adset_ids: List[str]) -> List[Dict]:
         """Get ads for multiple ad sets with preview and direct links"""
+        ads = self._entity_children_from_store('ad', adset_ids)
+        if ads is None:
+            ads = self._fetch_children_by_parents(
+                'ads', 'adset', adset_ids,
+                'id,name,status,account_id,creative{id},preview_shareable_link,effective_object_story_id,created_time,updated_time'
+            )
+        
         all_ads = []
-        for adset_id in adset_ids:
+        for ad in self._attach_creatives(ads):
             try:
-                data = self._make_request(f"{adset_id}/ads", {
-                    'fields': 'id,name,status,creative{title,body,image_url,video_id,thumbnail_url,image_hash,object_story_spec},preview_shareable_link,effective_object_story_id,created_time,updated_time'
-                })
-                
-                for ad in data.get('data', []):
-                    creative = ad.get('creative', {})
-                    
-                    # Build preview URL and direct link
-                    ad_id = ad.get('id')
-                    preview_link = ad.get('preview_shareable_link')
-                    
-                    # Construct Facebook Ads Manager link
-                    ads_manager_link = f"https://www.facebook.com/adsmanager/manage/ads?act={adset_id.split('_')[0]}&selected_ad_ids={ad_id}"
-                    
-                    # Get image URL from creative
-                    image_url = creative.get('image_url')
-                    
-                    # If no direct image_url, try to construct from image_hash
-                    if not image_url and creative.get('image_hash'):
-                        image_hash = creative.get('image_hash')
-                        image_url = f"https://scontent.xx.fbcdn.net/v/t45.1600-4/{image_hash}"
-                    
-                    # Get video thumbnail or image
-                    media_url = image_url or creative.get('thumbnail_url')
-                    
-                    # Try to get the post permalink if available
-                    post_link = None
-                    effective_story_id = ad.get('effective_object_story_id')
-                    if effective_story_id:
-                        post_link = f"https://www.facebook.com/{effective_story_id.replace('_', '/posts/')}"
-                    
-                    all_ads.append({
-                        'id': ad_id,
-                        'name': ad.get('name'),
-                        'ad_set_id': adset_id,
-                        'status': ad.get('status'),
-                        'creative': {
-                            'title': creative.get('title'),
-                            'body': creative.get('body'),
-                            'image_url': image_url,
-                            'video_id': creative.get('video_id'),
-                            'thumbnail_url': creative.get('thumbnail_url'),
-                            'media_url': media_url  # Primary media URL (image or video thumbnail)
-                        },
-                        'preview_link': preview_link,  # Shareable preview link
-                        'ads_manager_link': ads_manager_link,  # Direct link to Ads Manager
-                        'post_link': post_link,  # Direct link to Facebook post (if published)
-                        'created_time': ad.get('created_time'),
-                        'updated_time': ad.get('updated_time')
-                    })
+                all_ads.append(self._format_ad(ad, ad.get('adset_id')))
             except Exception as e:
-                logger.error(f"Error fetching ads for adset {adset_id}: {e}")
+                logger.error(f"Error processing ad {ad.get('id')}: {e}")
         
         return all_ads
 
@@ -1586,14 +2051,10 @@ class MetaManager:
         results = []
         for ad_id in ad_ids:
             try:
-                data = self._make_request(f"{ad_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,clicks,actions,cpc,cpm,ctr,reach,frequency',
-                    'time_increment': '1',
-                })
+                rows = self._get_daily_insight_rows(ad_id, since, until)
                 
                 timeseries = []
-                for day_data in data.get('data', []):
+                for day_data in rows:
                     conversions = sum(
                         int(action.get('value', 0))
                         for action in day_data.get('actions', [])
@@ -1630,37 +2091,15 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         results = []
+        rows_by_entity = self._fetch_breakdown_insights('ad', ad_ids, since, until, 'age,gender')
+        
         for ad_id in ad_ids:
-            try:
-                data = self._make_request(f"{ad_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,reach,actions',
-                    'breakdowns': 'age,gender',
-                })
-                
-                demographics = []
-                for item in data.get('data', []):
-                    conversions = sum(
-                        int(action.get('value', 0))
-                        for action in item.get('actions', [])
-                        if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                    )
-                    
-                    demographics.append({
-                        'age': item.get('age'),
-                        'gender': item.get('gender'),
-                        'spend': float(item.get('spend', 0)),
-                        'impressions': int(item.get('impressions', 0)),
-                        'reach': int(item.get('reach', 0)),
-                        'results': conversions
-                    })
-                
-                results.append({
-                    'ad_id': ad_id,
-                    'demographics': demographics
-                })
-            except Exception as e:
-                logger.error(f"Error fetching demographics for ad {ad_id}: {e}")
+            if ad_id not in rows_by_entity:
+                continue
+            results.append({
+                'ad_id': ad_id,
+                'demographics': [self._format_demographic_row(item) for item in rows_by_entity[ad_id]]
+            })
         
         return results
 
@@ -1672,36 +2111,15 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         results = []
+        rows_by_entity = self._fetch_breakdown_insights('ad', ad_ids, since, until, 'publisher_platform')
+        
         for ad_id in ad_ids:
-            try:
-                data = self._make_request(f"{ad_id}/insights", {
-                    'time_range': f'{{"since":"{since}","until":"{until}"}}',
-                    'fields': 'spend,impressions,reach,actions',
-                    'breakdowns': 'publisher_platform',
-                })
-                
-                placements = []
-                for item in data.get('data', []):
-                    conversions = sum(
-                        int(action.get('value', 0))
-                        for action in item.get('actions', [])
-                        if action.get('action_type') in ['purchase', 'lead', 'complete_registration', 'omni_purchase']
-                    )
-                    
-                    placements.append({
-                        'platform': item.get('publisher_platform'),
-                        'spend': float(item.get('spend', 0)),
-                        'impressions': int(item.get('impressions', 0)),
-                        'reach': int(item.get('reach', 0)),
-                        'results': conversions
-                    })
-                
-                results.append({
-                    'ad_id': ad_id,
-                    'placements': placements
-                })
-            except Exception as e:
-                logger.error(f"Error fetching placements for ad {ad_id}: {e}")
+            if ad_id not in rows_by_entity:
+                continue
+            results.append({
+                'ad_id': ad_id,
+                'placements': [self._format_placement_row(item) for item in rows_by_entity[ad_id]]
+            })
         
         return results
 
@@ -1709,53 +2127,145 @@ class MetaManager:
     # FACEBOOK PAGES
     # =========================================================================
         
+    def _fetch_pages_data(self) -> List[Dict]:
+        """
+        Raw me/accounts entries, with the linked Instagram Business account
+        expanded inline so no per-page Instagram lookups are needed.
+        """
+        return self.fetch_edge("me/accounts", {
+            'fields': 'id,name,category,fan_count,followers_count,link,about,description,phone,emails,website,single_line_address,location,instagram_business_account{id,username,name,profile_picture_url,followers_count,follows_count,media_count}'
+        }, revalidate=True)
+
+    def _format_page(self, page: Dict) -> Dict:
+        """Shape a raw me/accounts entry for the pages response"""
+        instagram_account = page.get('instagram_business_account')
+        
+        # Get location details
+        location = page.get('location', {})
+        
+        return {
+            'id': page.get('id'),
+            'name': page.get('name'),
+            'category': page.get('category'),
+            'fan_count': page.get('fan_count', 0),
+            'followers_count': page.get('followers_count', 0),
+            'link': page.get('link'),
+            'about': page.get('about'),
+            'description': page.get('description'),
+            'phone': page.get('phone'),
+            'emails': page.get('emails', []),
+            'website': page.get('website'),
+            'address': page.get('single_line_address'),
+            'location': {
+                'street': location.get('street'),
+                'city': location.get('city'),
+                'state': location.get('state'),
+                'country': location.get('country'),
+                'zip': location.get('zip')
+            } if location else None,
+            'has_instagram': instagram_account is not None,
+            'instagram_account': {
+                'id': instagram_account.get('id'),
+                'username': instagram_account.get('username'),
+                'profile_picture_url': instagram_account.get('profile_picture_url')
+            } if instagram_account else None
+        }
+
     def get_pages(self) -> List[Dict]:
         """Get all Facebook pages with detailed information"""
         try:
-            data = self._make_request("me/accounts", {
-                'fields': 'id,name,category,fan_count,followers_count,link,about,description,phone,emails,website,single_line_address,location,instagram_business_account{id,username,profile_picture_url}'
-            })
-            
-            pages = []
-            for page in data.get('data', []):
-                instagram_account = page.get('instagram_business_account')
-                
-                # Get location details
-                location = page.get('location', {})
-                
-                pages.append({
-                    'id': page.get('id'),
-                    'name': page.get('name'),
-                    'category': page.get('category'),
-                    'fan_count': page.get('fan_count', 0),
-                    'followers_count': page.get('followers_count', 0),
-                    'link': page.get('link'),
-                    'about': page.get('about'),
-                    'description': page.get('description'),
-                    'phone': page.get('phone'),
-                    'emails': page.get('emails', []),
-                    'website': page.get('website'),
-                    'address': page.get('single_line_address'),
-                    'location': {
-                        'street': location.get('street'),
-                        'city': location.get('city'),
-                        'state': location.get('state'),
-                        'country': location.get('country'),
-                        'zip': location.get('zip')
-                    } if location else None,
-                    'has_instagram': instagram_account is not None,
-                    'instagram_account': {
-                        'id': instagram_account.get('id'),
-                        'username': instagram_account.get('username'),
-                        'profile_picture_url': instagram_account.get('profile_picture_url')
-                    } if instagram_account else None
-                })
-            
-            return pages
+            return [self._format_page(page) for page in self._fetch_pages_data()]
         except Exception as e:
             logger.error(f"Error fetching pages: {e}")
             return []
     
+    def _plan_insight_windows(self, since: str, until: str, max_days: int) -> List[tuple]:
+        """Split since..until into consecutive windows of at most max_days"""
+        start = datetime.strptime(since, '%Y-%m-%d')
+        end = datetime.strptime(until, '%Y-%m-%d')
+        windows = []
+        while start < end:
+            window_end = min(start + timedelta(days=max_days), end)
+            windows.append((start.strftime('%Y-%m-%d'), window_end.strftime('%Y-%m-%d')))
+            start = window_end
+        return windows or [(since, until)]
+
+    def _fetch_windowed_insights(self, endpoint: str, metrics: List[str], since: str, until: str,
+                                 max_days: int, extra_params: Dict = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Daily values of several insights metrics over an arbitrary range.
+
+        The range is split into API-legal windows; each window asks for all
+        metrics in one comma-separated metric= call, and windows run
+        concurrently (every request still goes through the rate limiter).
+        If a combined call fails, that window falls back to concurrent calls
+        per metric so a single unavailable metric does not drop the others.
+        Metrics the Graph API rejects as invalid are left out of later
+        combined calls; other failures only skip the metric for that window.
+
+        Returns:
+            Dict mapping metric name to {date: value}
+        """
+        available = [
+            metric for metric in metrics
+            if self._cache_get(f"insights_unavailable:{endpoint}:{metric}") is None
+        ]
+
+        def fetch_window(window: tuple) -> List[Dict]:
+            window_since, window_until = window
+            params = {
+                **(extra_params or {}),
+                'period': 'day',
+                'since': window_since,
+                'until': window_until
+            }
+            try:
+                return self._make_request(endpoint, {**params, 'metric': ','.join(available)}).get('data', [])
+            except Exception as e:
+                logger.warning(f"Combined insights call failed for {endpoint} ({window_since} → {window_until}), retrying per metric: {e}")
+
+            def fetch_metric(metric: str) -> List[Dict]:
+                try:
+                    return self._make_request(endpoint, {**params, 'metric': metric}).get('data', [])
+                except Exception as metric_error:
+                    if self._is_unavailable_metric_error(metric_error):
+                        logger.warning(f"Metric {metric} not available: {metric_error}")
+                        self._cache_set(f"insights_unavailable:{endpoint}:{metric}", True, self.UNAVAILABLE_METRIC_TTL)
+                    else:
+                        logger.warning(f"Metric {metric} failed for {window_since} → {window_until}, skipping this window: {metric_error}")
+                    return []
+
+            with ThreadPoolExecutor(max_workers=min(self.INSIGHTS_WINDOW_WORKERS, len(available))) as executor:
+                return [entry for metric_data in executor.map(fetch_metric, available) for entry in metric_data]
+
+        if not available:
+            return {metric: {} for metric in metrics}
+
+        windows = self._plan_insight_windows(since, until, max_days)
+        if len(windows) == 1:
+            window_results = [fetch_window(windows[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.INSIGHTS_WINDOW_WORKERS, len(windows))) as executor:
+                window_results = list(executor.map(fetch_window, windows))
+
+        series: Dict[str, Dict[str, Any]] = {metric: {} for metric in metrics}
+        for metric_data in window_results:
+            for entry in metric_data:
+                values = series.setdefault(entry.get('name'), {})
+                for value_entry in entry.get('values', []):
+                    end_time = value_entry.get('end_time', '')
+                    if end_time:
+                        values[end_time.split('T')[0]] = value_entry.get('value')
+        return series
+
+    def _is_unavailable_metric_error(self, error: Exception) -> bool:
+        """Whether an insights error means the object does not offer the metric (Graph 400, not throttling)"""
+        return (
+            isinstance(error, MetaAPIError)
+            and error.status_code == 400
+            and error.error_code not in self.NON_METRIC_ERROR_CODES
+        )
+
     def get_page_insights_timeseries(self, page_id: str, period: str = None, start_date: str = None, end_date: str = None) -> Dict:
         """Get time-series insights for specific Facebook page"""
         
@@ -1784,7 +2294,7 @@ class MetaManager:
                 page_info = self._make_request(page_id, {
                     'access_token': page_access_token,
                     'fields': 'followers_count,fan_count,talking_about_count,checkins'
-                })
+                }, revalidate=True)
             except Exception as e:
                 logger.error(f"Error fetching basic page info: {e}")
                 page_info = {
@@ -1816,56 +2326,43 @@ class MetaManager:
             # Collect all daily data
             daily_data = {}
             
-            # Fetch each metric group separately with error handling
-            all_metric_groups = [
-                ('basic', basic_metrics),
-                ('engagement', engagement_metrics),
-                ('view', view_metrics),
-                ('fan', fan_metrics)
-            ]
+            metrics_config = {
+                **basic_metrics,
+                **engagement_metrics,
+                **view_metrics,
+                **fan_metrics
+            }
             
-            for group_name, metrics_config in all_metric_groups:
-                for metric_key, metric_name in metrics_config.items():
-                    try:
-                        logger.info(f"Fetching metric: {metric_key}")
-                        
-                        data = self._make_request(f"{page_id}/insights/{metric_key}", {
-                            'access_token': page_access_token,
-                            'since': since,
-                            'until': until,
-                            'period': 'day'
-                        })
-                        
-                        if data.get('data') and len(data['data']) > 0:
-                            values = data['data'][0].get('values', [])
-                            
-                            for value_entry in values:
-                                date = value_entry.get('end_time', '').split('T')[0]
-                                value = value_entry.get('value')
-                                
-                                if date:
-                                    if date not in daily_data:
-                                        daily_data[date] = {
-                                            'date': date,
-                                            'impressions': 0,
-                                            'unique_impressions': 0,
-                                            'post_engagements': 0,
-                                            'engaged_users': 0,
-                                            'page_views': 0,
-                                            'new_likes': 0,
-                                            'fans': 0
-                                        }
-                                    
-                                    # Handle different value types
-                                    if value is not None:
-                                        if isinstance(value, dict):
-                                            # For metrics that return objects, sum the values
-                                            value = sum(v for v in value.values() if isinstance(v, (int, float)))
-                                        daily_data[date][metric_name] = value if isinstance(value, (int, float)) else 0
-                                        
-                    except Exception as metric_error:
-                        logger.warning(f"Metric {metric_key} not available: {metric_error}")
-                        continue
+            # All metrics in one call per window (windows of up to 90 days)
+            series = self._fetch_windowed_insights(
+                f"{page_id}/insights",
+                list(metrics_config),
+                since,
+                until,
+                self.PAGE_INSIGHTS_WINDOW_DAYS,
+                {'access_token': page_access_token}
+            )
+            
+            for metric_key, metric_name in metrics_config.items():
+                for date, value in series.get(metric_key, {}).items():
+                    if date not in daily_data:
+                        daily_data[date] = {
+                            'date': date,
+                            'impressions': 0,
+                            'unique_impressions': 0,
+                            'post_engagements': 0,
+                            'engaged_users': 0,
+                            'page_views': 0,
+                            'new_likes': 0,
+                            'fans': 0
+                        }
+                    
+                    # Handle different value types
+                    if value is not None:
+                        if isinstance(value, dict):
+                            # For metrics that return objects, sum the values
+                            value = sum(v for v in value.values() if isinstance(v, (int, float)))
+                        daily_data[date][metric_name] = value if isinstance(value, (int, float)) else 0
             
             # Convert to sorted list
             timeseries = sorted(daily_data.values(), key=lambda x: x['date'])
@@ -1958,7 +2455,7 @@ class MetaManager:
                 page_info = self._make_request(page_id, {
                     'access_token': page_access_token,
                     'fields': 'followers_count,fan_count,new_like_count,talking_about_count,were_here_count,checkins'
-                })
+                }, revalidate=True)
             except Exception as e:
                 logger.warning(f"Error fetching detailed page info: {e}")
                 try:
@@ -2053,6 +2550,11 @@ class MetaManager:
     
     def _get_page_access_token(self, page_id: str) -> str:
         """Get page access token for a specific page with better error handling"""
+        cache_key = f"page_token:{page_id}"
+        cached_token = self._cache_get(cache_key)
+        if cached_token:
+            return cached_token
+
         try:
             # Get page access token using the user's access token
             data = self._make_request(f"{page_id}", {
@@ -2065,6 +2567,7 @@ class MetaManager:
                 return self.access_token  # Fallback to user token
             
             logger.info(f"Successfully retrieved page access token for page {page_id}")
+            self._cache_set(cache_key, page_access_token, self.PAGE_TOKEN_CACHE_TTL)
             return page_access_token
         except Exception as e:
             logger.warning(f"Could not get page access token: {e}, using user token as fallback")
@@ -2093,7 +2596,7 @@ class MetaManager:
                 'limit': limit
             }
             
-            response = requests.get(posts_url, params=params)
+            response = self.session.get(posts_url, params=params)
             
             if response.status_code != 200:
                 logger.error(f"Error getting posts: {response.text}")
@@ -2131,7 +2634,7 @@ class MetaManager:
                 # Get detailed reactions breakdown
                 reactions_breakdown = {}
                 try:
-                    reactions_response = requests.get(
+                    reactions_response = self.session.get(
                         f"{self.BASE_URL}/{post_id}/reactions",
                         params={
                             'access_token': page_access_token,
@@ -2181,7 +2684,7 @@ class MetaManager:
                         'post_reactions_by_type_total'
                     ]
                     
-                    insights_response = requests.get(
+                    insights_response = self.session.get(
                         f"{self.BASE_URL}/{post_id}/insights",
                         params={
                             'access_token': page_access_token,
@@ -2229,7 +2732,7 @@ class MetaManager:
                             'post_video_complete_views_30s'
                         ]
                         
-                        video_insights_response = requests.get(
+                        video_insights_response = self.session.get(
                             f"{self.BASE_URL}/{post_id}/insights",
                             params={
                                 'access_token': page_access_token,
@@ -2335,7 +2838,7 @@ class MetaManager:
                 'limit': limit
             }
             
-            response = requests.get(posts_url, params=params)
+            response = self.session.get(posts_url, params=params)
             
             if response.status_code != 200:
                 logger.error(f"Error getting posts: {response.text}")
@@ -2373,7 +2876,7 @@ class MetaManager:
                 # Get detailed reactions breakdown
                 reactions_breakdown = {}
                 try:
-                    reactions_response = requests.get(
+                    reactions_response = self.session.get(
                         f"{self.BASE_URL}/{post_id}/reactions",
                         params={
                             'access_token': page_access_token,
@@ -2419,7 +2922,7 @@ class MetaManager:
                         'post_negative_feedback'
                     ]
                     
-                    insights_response = requests.get(
+                    insights_response = self.session.get(
                         f"{self.BASE_URL}/{post_id}/insights",
                         params={
                             'access_token': page_access_token,
@@ -2500,7 +3003,7 @@ class MetaManager:
                             'post_video_complete_views_30s'
                         ]
                         
-                        video_insights_response = requests.get(
+                        video_insights_response = self.session.get(
                             f"{self.BASE_URL}/{post_id}/insights",
                             params={
                                 'access_token': page_access_token,
@@ -2605,6 +3108,73 @@ class MetaManager:
     # Add these methods to your MetaManager class
 
 
+    def _get_page_snapshot(self, page_id: str, since: str, until: str) -> Dict:
+        """
+        Posts, tag count and period metrics of a page, fetched once per
+        (page, period) and shared by the breakdown endpoints.
+
+        A dashboard load asks for several breakdowns of the same page and
+        period at once; the first builds the snapshot (the others wait for
+        it) and every later breakdown is derived from memory.
+        """
+        cache_key = f"page_snapshot:{page_id}:{since}:{until}"
+        snapshot = self._cache_get(cache_key)
+        if snapshot is not None:
+            return snapshot
+
+        with self._build_lock(cache_key):
+            snapshot = self._cache_get(cache_key)
+            if snapshot is not None:
+                return snapshot
+
+            page_access_token = self._get_page_access_token(page_id)
+            post_params = {
+                'access_token': page_access_token,
+                'limit': 100,
+                'since': since,
+                'until': until
+            }
+            post_fields = 'id,created_time,attachments{type},comments.summary(true).limit(0),reactions.summary(true).limit(0),shares'
+
+            posts = None
+            try:
+                posts = self._make_request(f"{page_id}/posts", {
+                    **post_params,
+                    'fields': f"{post_fields},insights.metric(post_video_views,post_impressions)"
+                }).get('data', [])
+            except Exception as e:
+                logger.warning(f"Posts with insights failed for {page_id}, retrying without insights: {e}")
+                try:
+                    posts = self._make_request(f"{page_id}/posts", {
+                        **post_params,
+                        'fields': post_fields
+                    }).get('data', [])
+                except Exception as posts_error:
+                    logger.error(f"Error getting posts: {posts_error}")
+
+            tags_count = 0
+            try:
+                tags_count = len(self._make_request(f"{page_id}/tagged", dict(post_params)).get('data', []))
+            except Exception as e:
+                logger.warning(f"Could not fetch tags: {e}")
+
+            series = self._fetch_windowed_insights(
+                f"{page_id}/insights",
+                list(self.PAGE_VIDEO_METRICS) + list(self.PAGE_ORGANIC_PAID_METRICS),
+                since,
+                until,
+                self.PAGE_INSIGHTS_WINDOW_DAYS,
+                {'access_token': page_access_token}
+            )
+            metric_totals = {
+                metric: sum(value for value in values.values() if isinstance(value, (int, float)))
+                for metric, values in series.items()
+            }
+
+            snapshot = {'posts': posts, 'tags_count': tags_count, 'metric_totals': metric_totals}
+            self._cache_set(cache_key, snapshot, self.PAGE_SNAPSHOT_TTL)
+            return snapshot
+
     def get_page_video_views_breakdown(self, page_id: str, period: str = None, start_date: str = None, end_date: str = None) -> Dict:
         """Get video views breakdown - 3-second views, 1-minute views"""
         if start_date and end_date:
@@ -2613,45 +3183,13 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         try:
-            page_access_token = self._get_page_access_token(page_id)
+            metric_totals = self._get_page_snapshot(page_id, since, until)['metric_totals']
             
-            # Define video view metrics
-            video_metrics = {
-                'page_video_views': 'total_views',
-                'page_video_views_3s': 'three_second_views',
-                'page_video_views_60s': 'one_minute_views'
+            views_data = {
+                metric_name: metric_totals.get(metric_key, 0)
+                for metric_key, metric_name in self.PAGE_VIDEO_METRICS.items()
             }
             
-            views_data = {}
-            
-            for metric_key, metric_name in video_metrics.items():
-                try:
-                    logger.info(f"Fetching video metric: {metric_key}")
-                    
-                    response = requests.get(
-                        f"{self.BASE_URL}/{page_id}/insights/{metric_key}",
-                        params={
-                            'access_token': page_access_token,
-                            'since': since,
-                            'until': until,
-                            'period': 'day'
-                        }
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('data') and len(data['data']) > 0:
-                            values = data['data'][0].get('values', [])
-                            total = sum(v.get('value', 0) for v in values if v.get('value') is not None)
-                            views_data[metric_name] = total
-                    else:
-                        logger.warning(f"Metric {metric_key} failed: {response.text}")
-                        views_data[metric_name] = 0
-                        
-                except Exception as metric_error:
-                    logger.warning(f"Metric {metric_key} not available: {metric_error}")
-                    views_data[metric_name] = 0
-            
             return {
                 'total_views': views_data.get('total_views', 0),
                 'three_second_views': views_data.get('three_second_views', 0),
@@ -2677,29 +3215,15 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         try:
-            page_access_token = self._get_page_access_token(page_id)
+            posts = self._get_page_snapshot(page_id, since, until)['posts']
             
-            # Get posts and aggregate by type
-            response = requests.get(
-                f"{self.BASE_URL}/{page_id}/posts",
-                params={
-                    'access_token': page_access_token,
-                    'fields': 'id,created_time,attachments{type},insights.metric(post_video_views,post_impressions)',
-                    'limit': 100,
-                    'since': since,
-                    'until': until
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Error getting posts: {response.text}")
+            if posts is None:
                 return {
                     'breakdown': [],
                     'total_views': 0,
                     'period': period or f"{start_date} to {end_date}"
                 }
             
-            data = response.json()
             content_stats = {
                 'Reel': {'views': 0, 'count': 0},
                 'Photo': {'views': 0, 'count': 0},
@@ -2708,7 +3232,7 @@ class MetaManager:
                 'Other': {'views': 0, 'count': 0}
             }
             
-            for post in data.get('data', []):
+            for post in posts:
                 attachments = post.get('attachments', {}).get('data', [])
                 content_type = 'Other'
                 
@@ -2776,105 +3300,54 @@ class MetaManager:
 
     def get_page_follower_demographics(self, page_id: str) -> Dict:
         """Get page audience demographics - age, gender, location"""
+        cache_key = f"follower_demographics:{page_id}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             page_access_token = self._get_page_access_token(page_id)
+            metrics = list(self.FOLLOWER_DEMOGRAPHIC_METRICS)
             
-            demographics = {
-                'age_gender': [],
-                'countries': [],
-                'cities': []
-            }
-            
-            # Get age and gender breakdown
+            logger.info(f"Fetching follower demographics for page {page_id}")
+            params = {'access_token': page_access_token, 'period': 'lifetime'}
             try:
-                logger.info(f"Fetching age/gender demographics for page {page_id}")
-                
-                response = requests.get(
-                    f"{self.BASE_URL}/{page_id}/insights",  # Changed endpoint
-                    params={
-                        'access_token': page_access_token,
-                        'metric': 'page_fans_gender_age',  # Use metric parameter
-                        'period': 'lifetime'
-                    }
-                )
-                
-                logger.info(f"Age/Gender API Response Status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data.get('data') and len(data['data']) > 0:
-                        values = data['data'][0].get('values', [])
-                        if values:
-                            age_gender_data = values[-1].get('value', {})
-                            demographics['age_gender'] = self._parse_age_gender(age_gender_data)
-                            logger.info(f"Processed {len(demographics['age_gender'])} age/gender groups")
-                else:
-                    logger.error(f"Failed to fetch age/gender: {response.text}")
-                    
+                rows = self._make_request(f"{page_id}/insights", {
+                    **params,
+                    'metric': ','.join(metrics)
+                }, revalidate=True).get('data', [])
             except Exception as e:
-                logger.error(f"Could not fetch age/gender data: {e}", exc_info=True)
+                # One rejected metric fails the combined call; ask for each separately
+                logger.warning(f"Combined demographics call failed for {page_id}, fetching per metric: {e}")
+                rows = []
+                for metric in metrics:
+                    try:
+                        rows.extend(self._make_request(f"{page_id}/insights", {
+                            **params,
+                            'metric': metric
+                        }, revalidate=True).get('data', []))
+                    except Exception as metric_error:
+                        logger.error(f"Could not fetch {metric}: {metric_error}")
             
-            # Get country breakdown
-            try:
-                logger.info(f"Fetching country demographics for page {page_id}")
-                
-                response = requests.get(
-                    f"{self.BASE_URL}/{page_id}/insights",  # Changed endpoint
-                    params={
-                        'access_token': page_access_token,
-                        'metric': 'page_fans_country',  # Use metric parameter
-                        'period': 'lifetime'
-                    }
-                )
-                
-                logger.info(f"Country API Response Status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data.get('data') and len(data['data']) > 0:
-                        values = data['data'][0].get('values', [])
-                        if values:
-                            country_data = values[-1].get('value', {})
-                            demographics['countries'] = self._parse_countries(country_data)
-                            logger.info(f"Processed {len(demographics['countries'])} countries")
-                else:
-                    logger.error(f"Failed to fetch countries: {response.text}")
-                    
-            except Exception as e:
-                logger.error(f"Could not fetch country data: {e}", exc_info=True)
+            latest = {}
+            for row in rows:
+                values = row.get('values', [])
+                if row.get('name') in self.FOLLOWER_DEMOGRAPHIC_METRICS and values:
+                    latest[row['name']] = values[-1].get('value', {}) or {}
             
-            # Get city breakdown
-            try:
-                logger.info(f"Fetching city demographics for page {page_id}")
-                
-                response = requests.get(
-                    f"{self.BASE_URL}/{page_id}/insights",  # Changed endpoint
-                    params={
-                        'access_token': page_access_token,
-                        'metric': 'page_fans_city',  # Use metric parameter
-                        'period': 'lifetime'
-                    }
-                )
-                
-                logger.info(f"City API Response Status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data.get('data') and len(data['data']) > 0:
-                        values = data['data'][0].get('values', [])
-                        if values:
-                            city_data = values[-1].get('value', {})
-                            demographics['cities'] = self._parse_cities(city_data)
-                            logger.info(f"Processed {len(demographics['cities'])} cities")
-                else:
-                    logger.error(f"Failed to fetch cities: {response.text}")
-                    
-            except Exception as e:
-                logger.error(f"Could not fetch city data: {e}", exc_info=True)
+            demographics = {
+                'age_gender': self._parse_age_gender(latest.get('page_fans_gender_age', {})),
+                'countries': self._parse_countries(latest.get('page_fans_country', {})),
+                'cities': self._parse_cities(latest.get('page_fans_city', {}))
+            }
+            logger.info(
+                f"Processed {len(demographics['age_gender'])} age/gender groups, "
+                f"{len(demographics['countries'])} countries, {len(demographics['cities'])} cities"
+            )
             
+            # Only cache complete answers, so a failed metric is retried on the next view
+            if len(latest) == len(metrics):
+                self._cache_set(cache_key, demographics, self.FOLLOWER_DEMOGRAPHICS_TTL)
             return demographics
             
         except Exception as e:
@@ -2886,70 +3359,64 @@ class MetaManager:
             }
 
 
+    @staticmethod
+    def _shares(counts: list) -> list:
+        """Percentage of the total for each count, rounded to one decimal"""
+        total = sum(counts)
+        if total <= 0:
+            return [0] * len(counts)
+        return [round(count / total * 100, 1) for count in counts]
+
+
     def _parse_age_gender(self, age_gender_data: dict) -> list:
         """Parse age and gender data"""
         age_groups = {}
         
         for key, count in age_gender_data.items():
-            if '.' in key:
-                gender, age_range = key.split('.')
-                
-                if age_range not in age_groups:
-                    age_groups[age_range] = {
-                        'age_range': age_range,
-                        'women': 0,
-                        'men': 0,
-                        'total': 0
-                    }
-                
-                if gender == 'F':
-                    age_groups[age_range]['women'] = count
-                elif gender == 'M':
-                    age_groups[age_range]['men'] = count
-                elif gender == 'U':  # Unknown gender
-                    pass  # Optionally add 'unknown' field
-                
-                age_groups[age_range]['total'] += count
-        
-        # Calculate percentages
-        total_audience = sum(group['total'] for group in age_groups.values())
+            gender, _, age_range = key.partition('.')
+            if not age_range:
+                continue
+            group = age_groups.get(age_range)
+            if group is None:
+                group = age_groups[age_range] = {'age_range': age_range, 'women': 0, 'men': 0, 'total': 0}
+            
+            if gender == 'F':
+                group['women'] = count
+            elif gender == 'M':
+                group['men'] = count
+            # 'U' (unknown gender) only counts towards the total
+            
+            group['total'] += count
         
-        for group in age_groups.values():
-            group['percentage'] = round((group['total'] / total_audience * 100), 1) if total_audience > 0 else 0
+        groups = list(age_groups.values())
+        for group, percentage in zip(groups, self._shares([group['total'] for group in groups])):
+            group['percentage'] = percentage
         
-        return sorted(age_groups.values(), key=lambda x: x['percentage'], reverse=True)
+        return sorted(groups, key=lambda x: x['percentage'], reverse=True)
 
 
     def _parse_countries(self, country_data: dict) -> list:
         """Parse country data"""
-        total = sum(country_data.values())
-        
-        countries = []
-        for country_code, count in country_data.items():
-            percentage = (count / total * 100) if total > 0 else 0
-            countries.append({
-                'country': country_code,
-                'count': count,
-                'percentage': round(percentage, 1)
-            })
+        codes, counts = list(country_data.keys()), list(country_data.values())
+        
+        countries = [
+            {'country': code, 'count': count, 'percentage': percentage}
+            for code, count, percentage in zip(codes, counts, self._shares(counts))
+        ]
         
         return sorted(countries, key=lambda x: x['count'], reverse=True)
 
 
     def _parse_cities(self, city_data: dict) -> list:
         """Parse city data"""
-        total = sum(city_data.values())
-        
-        cities = []
-        for city_name, count in city_data.items():
-            percentage = (count / total * 100) if total > 0 else 0
-            cities.append({
-                'city': city_name,
-                'count': count,
-                'percentage': round(percentage, 1)
-            })
+        names, counts = list(city_data.keys()), list(city_data.values())
+        
+        cities = [
+            {'city': name, 'count': count, 'percentage': percentage}
+            for name, count, percentage in zip(names, counts, self._shares(counts))
+        ]
         
-        return sorted(cities, key=lambda x: x['count'], reverse=True)[:10]  # Top 10 cities
+        return heapq.nlargest(10, cities, key=lambda x: x['count'])  # Top 10 cities
 
 
     def get_page_follows_unfollows(self, page_id: str, period: str = None, start_date: str = None, end_date: str = None) -> Dict:
@@ -2962,54 +3429,18 @@ class MetaManager:
         try:
             page_access_token = self._get_page_access_token(page_id)
             
-            # Get page fan adds (new follows)
-            fan_adds = 0
-            fan_removes = 0
-            
-            try:
-                response = requests.get(
-                    f"{self.BASE_URL}/{page_id}/insights/page_fan_adds",
-                    params={
-                        'access_token': page_access_token,
-                        'since': since,
-                        'until': until,
-                        'period': 'day'
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('data'):
-                        values = data['data'][0].get('values', [])
-                        fan_adds = sum(v.get('value', 0) for v in values if v.get('value') is not None)
-                else:
-                    logger.warning(f"Could not fetch fan_adds: {response.text}")
-                    
-            except Exception as e:
-                logger.warning(f"Could not fetch fan_adds: {e}")
+            # Fan adds (new follows) and removes (unfollows) in one call per window
+            series = self._fetch_windowed_insights(
+                f"{page_id}/insights",
+                ['page_fan_adds', 'page_fan_removes'],
+                since,
+                until,
+                self.PAGE_INSIGHTS_WINDOW_DAYS,
+                {'access_token': page_access_token}
+            )
             
-            # Get page fan removes (unfollows)
-            try:
-                response = requests.get(
-                    f"{self.BASE_URL}/{page_id}/insights/page_fan_removes",
-                    params={
-                        'access_token': page_access_token,
-                        'since': since,
-                        'until': until,
-                        'period': 'day'
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('data'):
-                        values = data['data'][0].get('values', [])
-                        fan_removes = sum(v.get('value', 0) for v in values if v.get('value') is not None)
-                else:
-                    logger.warning(f"Could not fetch fan_removes: {response.text}")
-                    
-            except Exception as e:
-                logger.warning(f"Could not fetch fan_removes: {e}")
+            fan_adds = sum(v for v in series.get('page_fan_adds', {}).values() if v is not None)
+            fan_removes = sum(v for v in series.get('page_fan_removes', {}).values() if v is not None)
             
             net_follows = fan_adds - fan_removes
             
@@ -3038,22 +3469,9 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         try:
-            page_access_token = self._get_page_access_token(page_id)
+            snapshot = self._get_page_snapshot(page_id, since, until)
             
-            # Get recent posts to aggregate engagement
-            response = requests.get(
-                f"{self.BASE_URL}/{page_id}/posts",
-                params={
-                    'access_token': page_access_token,
-                    'fields': 'id,created_time,comments.summary(true).limit(0),reactions.summary(true).limit(0),shares',
-                    'limit': 100,
-                    'since': since,
-                    'until': until
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Error getting posts for engagement: {response.text}")
+            if snapshot['posts'] is None:
                 return {
                     'total_engagement': 0,
                     'total_comments': 0,
@@ -3064,8 +3482,6 @@ class MetaManager:
                     'period': period or f"{start_date} to {end_date}"
                 }
             
-            data = response.json()
-            
             total_comments = 0
             total_reactions = 0
             total_shares = 0
@@ -3074,7 +3490,7 @@ class MetaManager:
             from datetime import datetime, timedelta, timezone
             seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
             
-            for post in data.get('data', []):
+            for post in snapshot['posts']:
                 comments = post.get('comments', {}).get('summary', {}).get('total_count', 0)
                 reactions = post.get('reactions', {}).get('summary', {}).get('total_count', 0)
                 shares = post.get('shares', {}).get('count', 0)
@@ -3093,24 +3509,8 @@ class MetaManager:
                     except:
                         pass
             
-            # Get tags (mentions)
-            tags_count = 0
-            try:
-                tags_response = requests.get(
-                    f"{self.BASE_URL}/{page_id}/tagged",
-                    params={
-                        'access_token': page_access_token,
-                        'limit': 100,
-                        'since': since,
-                        'until': until
-                    }
-                )
-                
-                if tags_response.status_code == 200:
-                    tags_data = tags_response.json()
-                    tags_count = len(tags_data.get('data', []))
-            except Exception as e:
-                logger.warning(f"Could not fetch tags: {e}")
+            # Tags (mentions)
+            tags_count = snapshot['tags_count']
             
             return {
                 'total_engagement': total_comments + total_reactions + total_shares,
@@ -3143,46 +3543,13 @@ class MetaManager:
         since, until = self._period_to_dates(period, start_date, end_date)
         
         try:
-            page_access_token = self._get_page_access_token(page_id)
+            metric_totals = self._get_page_snapshot(page_id, since, until)['metric_totals']
             
             metrics = {
-                'organic_impressions': 0,
-                'paid_impressions': 0,
-                'organic_reach': 0,
-                'paid_reach': 0
+                result_key: metric_totals.get(api_metric, 0)
+                for api_metric, result_key in self.PAGE_ORGANIC_PAID_METRICS.items()
             }
             
-            metric_mapping = {
-                'page_impressions_organic_v2': 'organic_impressions',  # Changed to v2
-                'page_impressions_paid_v2': 'paid_impressions',  # Changed to v2
-                'page_impressions_organic_unique_v2': 'organic_reach',  # Changed to v2
-                'page_impressions_paid_unique_v2': 'paid_reach'  # Changed to v2
-            }
-            
-            for api_metric, result_key in metric_mapping.items():
-                try:
-                    response = requests.get(
-                        f"{self.BASE_URL}/{page_id}/insights/{api_metric}",
-                        params={
-                            'access_token': page_access_token,
-                            'since': since,
-                            'until': until,
-                            'period': 'day'
-                        }
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('data'):
-                            values = data['data'][0].get('values', [])
-                            total = sum(v.get('value', 0) for v in values if v.get('value') is not None)
-                            metrics[result_key] = total
-                    else:
-                        logger.warning(f"Metric {api_metric} failed: {response.text}")
-                        
-                except Exception as e:
-                    logger.warning(f"Metric {api_metric} not available: {e}")
-            
             # Calculate percentages
             total_impressions = metrics['organic_impressions'] + metrics['paid_impressions']
             total_reach = metrics['organic_reach'] + metrics['paid_reach']
@@ -3220,37 +3587,35 @@ class MetaManager:
     # INSTAGRAM
     # =========================================================================
     
+    def _format_instagram_accounts(self, pages_data: List[Dict]) -> List[Dict]:
+        """Build the Instagram accounts list from raw me/accounts entries"""
+        instagram_accounts = []
+        
+        for page in pages_data:
+            ig_data = page.get('instagram_business_account')
+            if not ig_data:
+                continue
+            
+            instagram_accounts.append({
+                'id': ig_data.get('id'),
+                'username': ig_data.get('username'),
+                'name': ig_data.get('name'),
+                'profile_picture_url': ig_data.get('profile_picture_url'),
+                'followers_count': ig_data.get('followers_count', 0),
+                'follows_count': ig_data.get('follows_count', 0),
+                'media_count': ig_data.get('media_count', 0),
+                'connected_facebook_page': {
+                    'id': page.get('id'),
+                    'name': page.get('name')
+                }
+            })
+        
+        return instagram_accounts
+
     def get_instagram_accounts(self) -> List[Dict]:
         """Get Instagram Business accounts connected to Facebook pages"""
         try:
-            pages = self.get_pages()
-            instagram_accounts = []
-            
-            for page in pages:
-                if page.get('has_instagram') and page.get('instagram_account'):
-                    ig_account = page['instagram_account']
-                    ig_id = ig_account['id']
-                    
-                    # Get Instagram account details
-                    ig_data = self._make_request(ig_id, {
-                        'fields': 'id,username,name,profile_picture_url,followers_count,follows_count,media_count'
-                    })
-                    
-                    instagram_accounts.append({
-                        'id': ig_data.get('id'),
-                        'username': ig_data.get('username'),
-                        'name': ig_data.get('name'),
-                        'profile_picture_url': ig_data.get('profile_picture_url'),
-                        'followers_count': ig_data.get('followers_count', 0),
-                        'follows_count': ig_data.get('follows_count', 0),
-                        'media_count': ig_data.get('media_count', 0),
-                        'connected_facebook_page': {
-                            'id': page['id'],
-                            'name': page['name']
-                        }
-                    })
-            
-            return instagram_accounts
+            return self._format_instagram_accounts(self._fetch_pages_data())
         except Exception as e:
             logger.error(f"Error fetching Instagram accounts: {e}")
             return []
@@ -3350,74 +3715,40 @@ class MetaManager:
             # Collect all daily data
             daily_data = {}
             
-            # Fetch metrics with total_value type
-            try:
-                data = self._make_request(f"{account_id}/insights", {
-                    'metric': ','.join(total_value_metrics),
-                    'period': 'day',
-                    'metric_type': 'total_value',
-                    'since': since,
-                    'until': until
-                })
-                
-                for metric_data in data.get('data', []):
-                    metric_name = metric_data.get('name')
-                    values = metric_data.get('values', [])
-                    
-                    for value_entry in values:
-                        end_time = value_entry.get('end_time', '')
-                        date = end_time.split('T')[0] if end_time else None
-                        value = value_entry.get('value', 0)
-                        
-                        if date:
-                            if date not in daily_data:
-                                daily_data[date] = {
-                                    'date': date,
-                                    'reach': 0,
-                                    'profile_views': 0,
-                                    'website_clicks': 0,
-                                    'accounts_engaged': 0,
-                                    'total_interactions': 0
-                                }
-                            
-                            daily_data[date][metric_name] = value if value is not None else 0
-                            
-            except Exception as e:
-                logger.warning(f"Could not fetch total_value metrics: {e}")
+            # total_value metrics and reach need different parameters, so they
+            # are two metric groups; each is one call per window of up to 30 days
+            metric_groups = [
+                (total_value_metrics, {'metric_type': 'total_value'}),
+                (['reach'], {})
+            ]
             
-            # Fetch reach separately (doesn't need metric_type)
-            try:
-                reach_data = self._make_request(f"{account_id}/insights", {
-                    'metric': 'reach',
-                    'period': 'day',
-                    'since': since,
-                    'until': until
-                })
+            for metrics, extra_params in metric_groups:
+                try:
+                    series = self._fetch_windowed_insights(
+                        f"{account_id}/insights",
+                        metrics,
+                        since,
+                        until,
+                        self.IG_INSIGHTS_WINDOW_DAYS,
+                        extra_params
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not fetch {','.join(metrics)}: {e}")
+                    continue
                 
-                for metric_data in reach_data.get('data', []):
-                    if metric_data.get('name') == 'reach':
-                        values = metric_data.get('values', [])
+                for metric_name, values in series.items():
+                    for date, value in values.items():
+                        if date not in daily_data:
+                            daily_data[date] = {
+                                'date': date,
+                                'reach': 0,
+                                'profile_views': 0,
+                                'website_clicks': 0,
+                                'accounts_engaged': 0,
+                                'total_interactions': 0
+                            }
                         
-                        for value_entry in values:
-                            end_time = value_entry.get('end_time', '')
-                            date = end_time.split('T')[0] if end_time else None
-                            value = value_entry.get('value', 0)
-                            
-                            if date:
-                                if date not in daily_data:
-                                    daily_data[date] = {
-                                        'date': date,
-                                        'reach': 0,
-                                        'profile_views': 0,
-                                        'website_clicks': 0,
-                                        'accounts_engaged': 0,
-                                        'total_interactions': 0
-                                    }
-                                
-                                daily_data[date]['reach'] = value if value is not None else 0
-                                
-            except Exception as e:
-                logger.warning(f"Could not fetch reach: {e}")
+                        daily_data[date][metric_name] = value if value is not None else 0
             
             # Convert to sorted list
             timeseries = sorted(daily_data.values(), key=lambda x: x['date'])
@@ -3467,46 +3798,164 @@ class MetaManager:
                 }
             }
         
-    def get_instagram_media(self, account_id: str, limit: int = 10, period: str = None, start_date: str = None, end_date: str = None) -> List[Dict]:
-        """Get recent media from Instagram account with comprehensive insights"""
+    def _parse_media_timestamp(self, timestamp_str: str) -> datetime:
+        """Parse an Instagram media timestamp (e.g. 2024-01-01T10:00:00+0000)"""
+        if '+0000' in timestamp_str:
+            timestamp_str = timestamp_str.replace('+0000', '+00:00')
+        elif 'Z' in timestamp_str:
+            timestamp_str = timestamp_str.replace('Z', '+00:00')
+        return datetime.fromisoformat(timestamp_str)
+
+    def _list_instagram_media(self, account_id: str, since_timestamp: int, limit: int) -> List[Dict]:
+        """
+        List up to `limit` media items published since `since_timestamp`.
+
+        The lower bound is sent to the API as `since`, and because the media
+        edge is newest-first, paging stops at the first item older than the
+        window instead of fetching and discarding it on the client.
+        """
+        media_list = []
+        pages = self.iter_edge(f"{account_id}/media", {
+            'fields': 'id,caption,media_type,media_url,thumbnail_url,permalink,timestamp,like_count,comments_count,media_product_type',
+            'since': since_timestamp,
+            'limit': min(limit, 100)
+        }, prefetch=False)
+
+        for page in pages:
+            for media in page:
+                try:
+                    if self._parse_media_timestamp(media.get('timestamp', '')).timestamp() < since_timestamp:
+                        pages.close()
+                        return media_list
+                except Exception as ts_error:
+                    logger.warning(f"Could not parse timestamp {media.get('timestamp')}: {ts_error}")
+
+                media_list.append(media)
+                if len(media_list) >= limit:
+                    pages.close()
+                    return media_list
+
+        return media_list
+
+    def _fetch_media_insights(self, media_list: List[Dict], period: str = None) -> Dict[str, List[Dict]]:
+        """
+        Fetch insights for many media items with as few requests as possible.
+
+        Media are grouped by media_product_type (each type supports different
+        metrics) and each group is requested through the multi-ID endpoint
+        (?ids=a,b,c&fields=insights.metric(...)), up to 50 IDs per call.
+        Results are cached per media ID; insights of media older than
+        MEDIA_INSIGHTS_SETTLED_DAYS barely change, so they are kept longer.
+
+        Returns:
+            Dict mapping media ID to its list of insight metric entries
+        """
+        results = {}
+        groups: Dict[str, List[Dict]] = {}
+
+        for media in media_list:
+            media_id = media['id']
+            cached = self._cache_get(f"ig_media_insights:{media_id}:{period}")
+            if cached is not None:
+                results[media_id] = cached
+                continue
+            product_type = media.get('media_product_type', 'FEED')
+            if product_type not in self.IG_MEDIA_INSIGHT_METRICS:
+                product_type = 'FEED'
+            groups.setdefault(product_type, []).append(media)
+
+        for product_type, group in groups.items():
+            metrics = self.IG_MEDIA_INSIGHT_METRICS[product_type]
+            # Stories only expose their default period
+            group_period = period if product_type != 'STORY' else None
+            insights_field = f"insights.metric({metrics})"
+            if group_period:
+                insights_field += f".period({group_period})"
+
+            for i in range(0, len(group), self.GRAPH_MAX_IDS_PER_REQUEST):
+                chunk = group[i:i + self.GRAPH_MAX_IDS_PER_REQUEST]
+                try:
+                    data = self._rate_limited_request('', {
+                        'ids': ','.join(media['id'] for media in chunk),
+                        'fields': insights_field
+                    })
+                    chunk_insights = {
+                        media_id: node.get('insights', {}).get('data', [])
+                        for media_id, node in data.items()
+                    }
+                except Exception as e:
+                    # One unsupported media fails the whole multi-ID call; fall back per item
+                    logger.debug(f"Batched {product_type} insights failed, retrying per media: {e}")
+                    chunk_insights = {}
+                    for media in chunk:
+                        params = {'metric': metrics}
+                        if group_period:
+                            params['period'] = group_period
+                        try:
+                            chunk_insights[media['id']] = self._make_request(
+                                f"{media['id']}/insights", params
+                            ).get('data', [])
+                        except Exception as media_error:
+                            logger.debug(f"Could not fetch {product_type} insights for {media['id']}: {media_error}")
+
+                for media in chunk:
+                    media_id = media['id']
+                    if media_id not in chunk_insights:
+                        continue
+                    results[media_id] = chunk_insights[media_id]
+                    self._cache_set(
+                        f"ig_media_insights:{media_id}:{period}",
+                        chunk_insights[media_id],
+                        self._media_insights_ttl(media)
+                    )
+
+        return results
+
+    def _media_insights_ttl(self, media: Dict) -> float:
+        """Cache lifetime for a media item's insights, based on its age"""
+        try:
+            media_datetime = self._parse_media_timestamp(media.get('timestamp', ''))
+            age_days = (datetime.now() - media_datetime.replace(tzinfo=None)).days
+        except Exception:
+            return self.MEDIA_INSIGHTS_RECENT_TTL
+        if age_days >= self.MEDIA_INSIGHTS_SETTLED_DAYS:
+            return self.MEDIA_INSIGHTS_SETTLED_TTL
+        return self.MEDIA_INSIGHTS_RECENT_TTL
+
+    def _instagram_media_window(self, period: str = None, start_date: str = None, end_date: str = None) -> int:
+        """Unix timestamp of the start of the requested media window"""
         if start_date and end_date:
             self._validate_date_range(start_date, end_date)
-            since_timestamp = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
-        else:
-            days = int(period[:-1]) if period else 30
-            since_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
+            return int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
+        days = int(period[:-1]) if period else 30
+        return int((datetime.now() - timedelta(days=days)).timestamp())
+
+    def _is_media_old_enough(self, media: Dict, now: datetime) -> bool:
+        """Media insights are only available once the media is 24 hours old"""
+        try:
+            media_datetime = self._parse_media_timestamp(media.get('timestamp', ''))
+            hours_old = (now - media_datetime.replace(tzinfo=None)).total_seconds() / 3600
+            return hours_old >= 24
+        except Exception:
+            return True  # Assume it's old enough if we can't parse
+
+    def get_instagram_media(self, account_id: str, limit: int = 10, period: str = None, start_date: str = None, end_date: str = None) -> List[Dict]:
+        """Get recent media from Instagram account with comprehensive insights"""
+        since_timestamp = self._instagram_media_window(period, start_date, end_date)
         
         try:
-            data = self._make_request(f"{account_id}/media", {
-                'fields': 'id,caption,media_type,media_url,thumbnail_url,permalink,timestamp,like_count,comments_count,media_product_type',
-                'limit': limit
-            })
-            
-            media_items = []
+            media_list = self._list_instagram_media(account_id, since_timestamp, limit)
             now = datetime.now()
             
-            for media in data.get('data', []):
-                # Parse timestamp
-                timestamp_str = media.get('timestamp', '')
-                try:
-                    if '+0000' in timestamp_str:
-                        timestamp_str = timestamp_str.replace('+0000', '+00:00')
-                    elif 'Z' in timestamp_str:
-                        timestamp_str = timestamp_str.replace('Z', '+00:00')
-                    
-                    media_datetime = datetime.fromisoformat(timestamp_str)
-                    media_timestamp = media_datetime.timestamp()
-                    
-                    if media_timestamp < since_timestamp:
-                        continue
-                    
-                    # Check if media is at least 24 hours old
-                    hours_old = (now - media_datetime.replace(tzinfo=None)).total_seconds() / 3600
-                    is_old_enough = hours_old >= 24
-                    
-                except Exception as ts_error:
-                    logger.warning(f"Could not parse timestamp {media.get('timestamp')}: {ts_error}")
-                    is_old_enough = True  # Assume it's old enough if we can't parse
+            old_enough = {media['id']: self._is_media_old_enough(media, now) for media in media_list}
+            media_insights = self._fetch_media_insights(
+                [media for media in media_list if old_enough[media['id']]]
+            )
+            
+            media_items = []
+            for media in media_list:
+                media_id = media['id']
+                is_old_enough = old_enough[media_id]
                 
                 # Get media insights (only if media is old enough)
                 insights_dict = {
@@ -3517,57 +3966,29 @@ class MetaManager:
                 }
                 
                 if is_old_enough:
-                    media_id = media['id']
-                    media_type = media.get('media_type')
                     media_product_type = media.get('media_product_type', 'FEED')
                     
-                    # Different metrics for different media types
-                    if media_product_type == 'STORY' or media_product_type == 'REELS':
-                        # Reels and Stories have different metrics
-                        try:
-                            if media_product_type == 'REELS':
-                                insights = self._make_request(f"{media_id}/insights", {
-                                    'metric': 'plays,reach,total_interactions,saved'
-                                })
-                            else:  # STORY
-                                insights = self._make_request(f"{media_id}/insights", {
-                                    'metric': 'impressions,reach,exits,replies'
-                                })
-                            
-                            for insight in insights.get('data', []):
-                                metric_name = insight.get('name')
-                                values = insight.get('values', [])
-                                if values:
-                                    value = values[0].get('value', 0)
-                                    
-                                    if metric_name in ['impressions', 'plays']:
-                                        insights_dict['impressions'] = value
-                                    elif metric_name == 'reach':
-                                        insights_dict['reach'] = value
-                                    elif metric_name in ['total_interactions', 'replies']:
-                                        insights_dict['engagement'] = value
-                                    elif metric_name == 'saved':
-                                        insights_dict['saved'] = value
-                                        
-                        except Exception as e:
-                            logger.debug(f"Could not fetch {media_product_type} insights for {media_id}: {e}")
-                    
-                    else:  # Regular FEED posts
-                        try:
-                            insights = self._make_request(f"{media_id}/insights", {
-                                'metric': 'impressions,reach,engagement,saved'
-                            })
-                            
-                            for insight in insights.get('data', []):
-                                metric_name = insight.get('name')
-                                values = insight.get('values', [])
-                                if values:
-                                    insights_dict[metric_name] = values[0].get('value', 0)
-                                    
-                        except Exception as e:
-                            logger.debug(f"Could not fetch feed insights for {media_id}: {e}")
+                    for insight in media_insights.get(media_id, []):
+                        metric_name = insight.get('name')
+                        values = insight.get('values', [])
+                        if not values:
+                            continue
+                        value = values[0].get('value', 0)
+                        
+                        if media_product_type in ('STORY', 'REELS'):
+                            # Reels and Stories have different metrics
+                            if metric_name in ['impressions', 'plays']:
+                                insights_dict['impressions'] = value
+                            elif metric_name == 'reach':
+                                insights_dict['reach'] = value
+                            elif metric_name in ['total_interactions', 'replies']:
+                                insights_dict['engagement'] = value
+                            elif metric_name == 'saved':
+                                insights_dict['saved'] = value
+                        elif metric_name in insights_dict:
+                            insights_dict[metric_name] = value
                 else:
-                    logger.debug(f"Media {media['id']} is less than 24 hours old, insights not yet available")
+                    logger.debug(f"Media {media_id} is less than 24 hours old, insights not yet available")
                 
                 media_items.append({
                     'id': media.get('id'),
@@ -3596,48 +4017,24 @@ class MetaManager:
     
     def get_instagram_media_timeseries(self, account_id: str, limit: int = 10, period: str = None, start_date: str = None, end_date: str = None) -> List[Dict]:
         """Get recent media from Instagram account with time-series insights"""
-        if start_date and end_date:
-            self._validate_date_range(start_date, end_date)
-            since_timestamp = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
-        else:
-            days = int(period[:-1]) if period else 30
-            since_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
+        since_timestamp = self._instagram_media_window(period, start_date, end_date)
         
         try:
-            data = self._make_request(f"{account_id}/media", {
-                'fields': 'id,caption,media_type,media_url,thumbnail_url,permalink,timestamp,like_count,comments_count,media_product_type',
-                'limit': limit
-            })
-            
-            media_items = []
+            media_list = self._list_instagram_media(account_id, since_timestamp, limit)
             now = datetime.now()
             
-            for media in data.get('data', []):
-                # Parse timestamp
-                timestamp_str = media.get('timestamp', '')
-                try:
-                    if '+0000' in timestamp_str:
-                        timestamp_str = timestamp_str.replace('+0000', '+00:00')
-                    elif 'Z' in timestamp_str:
-                        timestamp_str = timestamp_str.replace('Z', '+00:00')
-                    
-                    media_datetime = datetime.fromisoformat(timestamp_str)
-                    media_timestamp = media_datetime.timestamp()
-                    
-                    if media_timestamp < since_timestamp:
-                        continue
-                    
-                    # Check if media is at least 24 hours old
-                    hours_old = (now - media_datetime.replace(tzinfo=None)).total_seconds() / 3600
-                    is_old_enough = hours_old >= 24
-                    
-                except Exception as ts_error:
-                    logger.warning(f"Could not parse timestamp {media.get('timestamp')}: {ts_error}")
-                    is_old_enough = True
-                
+            old_enough = {media['id']: self._is_media_old_enough(media, now) for media in media_list}
+            media_insights = self._fetch_media_insights(
+                [media for media in media_list if old_enough[media['id']]],
+                period='lifetime'
+            )
+            
+            media_items = []
+            for media in media_list:
                 media_id = media['id']
-                media_type = media.get('media_type')
+                is_old_enough = old_enough[media_id]
                 media_product_type = media.get('media_product_type', 'FEED')
+                media_date = media.get('timestamp', '').split('T')[0]
                 
                 # Get time-series insights (only if media is old enough)
                 timeseries = []
@@ -3649,122 +4046,63 @@ class MetaManager:
                 }
                 
                 if is_old_enough:
-                    try:
-                        # Different metrics for different media types
-                        if media_product_type == 'REELS':
-                            # For Reels, get lifetime metrics (Instagram doesn't provide daily breakdown for reels)
-                            insights = self._make_request(f"{media_id}/insights", {
-                                'metric': 'plays,reach,total_interactions,saved',
-                                'period': 'lifetime'
-                            })
-                            
-                            # Reels typically only have lifetime data, not daily breakdown
-                            for insight in insights.get('data', []):
-                                metric_name = insight.get('name')
-                                values = insight.get('values', [])
+                    insights = media_insights.get(media_id, [])
+                    
+                    if media_product_type in ('REELS', 'STORY'):
+                        # Reels and Stories only have lifetime data, not a daily breakdown
+                        for insight in insights:
+                            metric_name = insight.get('name')
+                            for value_entry in insight.get('values', []):
+                                value = value_entry.get('value', 0)
                                 
-                                if values:
-                                    for value_entry in values:
-                                        value = value_entry.get('value', 0)
-                                        
-                                        if metric_name in ['plays']:
-                                            summary['impressions'] = value
-                                        elif metric_name == 'reach':
-                                            summary['reach'] = value
-                                        elif metric_name == 'total_interactions':
-                                            summary['engagement'] = value
-                                        elif metric_name == 'saved':
-                                            summary['saved'] = value
-                            
-                            # For reels, create a single data point since daily breakdown isn't available
-                            if summary['impressions'] > 0 or summary['reach'] > 0:
-                                timeseries.append({
-                                    'date': media.get('timestamp', '').split('T')[0],
-                                    'impressions': summary['impressions'],
-                                    'reach': summary['reach'],
-                                    'engagement': summary['engagement'],
-                                    'saved': summary['saved']
-                                })
+                                if metric_name in ['plays', 'impressions']:
+                                    summary['impressions'] = value
+                                elif metric_name == 'reach':
+                                    summary['reach'] = value
+                                elif metric_name in ['total_interactions', 'replies']:
+                                    summary['engagement'] = value
+                                elif metric_name == 'saved':
+                                    summary['saved'] = value
                         
-                        elif media_product_type == 'STORY':
-                            # Stories also typically only have lifetime data
-                            insights = self._make_request(f"{media_id}/insights", {
-                                'metric': 'impressions,reach,exits,replies'
-                            })
-                            
-                            for insight in insights.get('data', []):
-                                metric_name = insight.get('name')
-                                values = insight.get('values', [])
-                                
-                                if values:
-                                    value = values[0].get('value', 0)
-                                    
-                                    if metric_name == 'impressions':
-                                        summary['impressions'] = value
-                                    elif metric_name == 'reach':
-                                        summary['reach'] = value
-                                    elif metric_name == 'replies':
-                                        summary['engagement'] = value
-                            
-                            # Single data point for stories
-                            if summary['impressions'] > 0 or summary['reach'] > 0:
-                                timeseries.append({
-                                    'date': media.get('timestamp', '').split('T')[0],
-                                    'impressions': summary['impressions'],
-                                    'reach': summary['reach'],
-                                    'engagement': summary['engagement'],
-                                    'saved': summary['saved']
-                                })
+                        # Single data point since daily breakdown isn't available
+                        if summary['impressions'] > 0 or summary['reach'] > 0:
+                            timeseries.append({'date': media_date, **summary})
+                    
+                    else:  # Regular FEED posts - lifetime data with breakdown
+                        daily_data = {}
                         
-                        else:  # Regular FEED posts - try to get lifetime data with breakdown
-                            insights = self._make_request(f"{media_id}/insights", {
-                                'metric': 'impressions,reach,engagement,saved',
-                                'period': 'lifetime'
-                            })
+                        for insight in insights:
+                            metric_name = insight.get('name')
+                            if metric_name not in summary:
+                                continue
                             
-                            # Organize data by date
-                            daily_data = {}
-                            
-                            for insight in insights.get('data', []):
-                                metric_name = insight.get('name')
-                                values = insight.get('values', [])
+                            for value_entry in insight.get('values', []):
+                                # Try to get end_time for daily breakdown
+                                end_time = value_entry.get('end_time', '')
+                                date = end_time.split('T')[0] if end_time else media_date
+                                value = value_entry.get('value', 0)
                                 
-                                for value_entry in values:
-                                    # Try to get end_time for daily breakdown
-                                    end_time = value_entry.get('end_time', '')
-                                    date = end_time.split('T')[0] if end_time else media.get('timestamp', '').split('T')[0]
-                                    value = value_entry.get('value', 0)
+                                if date:
+                                    if date not in daily_data:
+                                        daily_data[date] = {
+                                            'date': date,
+                                            'impressions': 0,
+                                            'reach': 0,
+                                            'engagement': 0,
+                                            'saved': 0
+                                        }
                                     
-                                    if date:
-                                        if date not in daily_data:
-                                            daily_data[date] = {
-                                                'date': date,
-                                                'impressions': 0,
-                                                'reach': 0,
-                                                'engagement': 0,
-                                                'saved': 0
-                                            }
-                                        
-                                        daily_data[date][metric_name] = value if value is not None else 0
-                                        
-                                        # Update summary with max values (lifetime cumulative)
-                                        summary[metric_name] = max(summary[metric_name], value)
-                            
-                            # Convert to sorted list
-                            timeseries = sorted(daily_data.values(), key=lambda x: x['date'])
-                            
-                            # If no daily breakdown available, create single summary point
-                            if not timeseries and (summary['impressions'] > 0 or summary['reach'] > 0):
-                                timeseries.append({
-                                    'date': media.get('timestamp', '').split('T')[0],
-                                    'impressions': summary['impressions'],
-                                    'reach': summary['reach'],
-                                    'engagement': summary['engagement'],
-                                    'saved': summary['saved']
-                                })
-                    
-                    except Exception as e:
-                        logger.debug(f"Could not fetch insights for {media_id}: {e}")
+                                    daily_data[date][metric_name] = value if value is not None else 0
+                                    
+                                    # Update summary with max values (lifetime cumulative)
+                                    summary[metric_name] = max(summary[metric_name], value or 0)
+                        
+                        # Convert to sorted list
+                        timeseries = sorted(daily_data.values(), key=lambda x: x['date'])
+                        
+                        # If no daily breakdown available, create single summary point
+                        if not timeseries and (summary['impressions'] > 0 or summary['reach'] > 0):
+                            timeseries.append({'date': media_date, **summary})
                 else:
                     logger.debug(f"Media {media_id} is less than 24 hours old, insights not yet available")
                 
@@ -3799,17 +4137,33 @@ class MetaManager:
         """Get combined overview of all Meta assets"""
         if start_date and end_date:
             self._validate_date_range(start_date, end_date)
+        cached = self._cache_get('meta_overview')
+        if cached is not None:
+            return cached
+        
         try:
-            ad_accounts = self.get_ad_accounts()
-            pages = self.get_pages()
-            instagram_accounts = self.get_instagram_accounts()
+            # Ad accounts and pages are independent - fetch them concurrently.
+            # Instagram accounts come expanded on the pages response.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                ad_accounts_future = executor.submit(self.get_ad_accounts)
+                pages_future = executor.submit(self._fetch_pages_data)
+                
+                ad_accounts = ad_accounts_future.result()
+                try:
+                    pages_data = pages_future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching pages: {e}")
+                    pages_data = []
+            
+            pages = [self._format_page(page) for page in pages_data]
+            instagram_accounts = self._format_instagram_accounts(pages_data)
             
             # Calculate totals
             total_ad_spend = sum(acc.get('amount_spent', 0) for acc in ad_accounts)
             total_page_followers = sum(page.get('followers_count', 0) for page in pages)
             total_instagram_followers = sum(acc.get('followers_count', 0) for acc in instagram_accounts)
             
-            return {
+            overview = {
                 'ad_accounts_count': len(ad_accounts),
                 'pages_count': len(pages),
                 'instagram_accounts_count': len(instagram_accounts),
@@ -3821,6 +4175,8 @@ class MetaManager:
                 'pages': pages,
                 'instagram_accounts': instagram_accounts
             }
+            self._cache_set('meta_overview', overview, self.OVERVIEW_CACHE_TTL)
+            return overview
         except Exception as e:
             logger.error(f"Error fetching Meta overview: {e}")
             raise
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Meta Manager Pool - per-user registry of long-lived MetaManager instances
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any
+
+from fastapi import HTTPException
+
+from social.meta_manager import MetaManager
+
+logger = logging.getLogger(__name__)
+
+
+class MetaManagerPool:
+    """
+    Bounded, per-user pool of MetaManager instances.
+
+    Building a MetaManager scans the Facebook sessions for the user's token and
+    starts with a fresh HTTP session, rate limiter and cache. Keeping one
+    manager per user lets consecutive requests reuse all of that. Entries are
+    evicted when idle for too long, when the pool is full (least recently used
+    first) or when the user's access token changes.
+    """
+
+    def __init__(
+        self,
+        auth_manager,
+        max_size: int = 200,
+        idle_timeout: float = 1800,
+        token_check_interval: float = 60
+    ):
+        """
+        Args:
+            auth_manager: AuthManager used to look up Facebook access tokens
+            max_size: Maximum number of users kept in the pool
+            idle_timeout: Seconds after which an unused manager is evicted
+            token_check_interval: Seconds between access token revalidations
+        """
+        self.auth_manager = auth_manager
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.token_check_interval = token_check_interval
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'builds': 0,
+            'idle_evictions': 0,
+            'capacity_evictions': 0,
+            'token_evictions': 0
+        }
+
+    def get(self, user_email: str) -> MetaManager:
+        """Return the pooled MetaManager for a user, building it if needed"""
+        now = time.time()
+
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(user_email)
+            if entry:
+                self._entries.move_to_end(user_email)
+                entry['last_used'] = now
+                needs_token_check = now - entry['token_checked_at'] >= self.token_check_interval
+                if not needs_token_check:
+                    self._stats['hits'] += 1
+                    return entry['manager']
+
+        if entry:
+            # Revalidate outside the lock - the token lookup scans all sessions
+            access_token = self._lookup_token(user_email)
+            if access_token == entry['manager'].access_token:
+                with self._lock:
+                    entry['token_checked_at'] = time.time()
+                    self._stats['hits'] += 1
+                return entry['manager']
+
+            logger.info(f"Facebook token changed for {user_email}, rebuilding Meta client")
+            with self._lock:
+                self._stats['token_evictions'] += 1
+                self._remove(user_email)
+        else:
+            access_token = self._lookup_token(user_email)
+
+        manager = MetaManager(user_email, self.auth_manager, access_token=access_token)
+
+        with self._lock:
+            self._stats['misses'] += 1
+            self._stats['builds'] += 1
+            existing = self._entries.get(user_email)
+            if existing and existing['manager'].access_token == access_token:
+                # Another request built one concurrently - keep the pooled instance
+                manager.close()
+                return existing['manager']
+            if existing:
+                self._remove(user_email)
+
+            now = time.time()
+            self._entries[user_email] = {
+                'manager': manager,
+                'last_used': now,
+                'token_checked_at': now
+            }
+            while len(self._entries) > self.max_size:
+                oldest_email = next(iter(self._entries))
+                self._remove(oldest_email)
+                self._stats['capacity_evictions'] += 1
+
+        return manager
+
+    def evict(self, user_email: str):
+        """Drop a user's manager, e.g. after logout or token revocation"""
+        with self._lock:
+            self._remove(user_email)
+
+    def clear(self):
+        """Drop every pooled manager"""
+        with self._lock:
+            for user_email in list(self._entries):
+                self._remove(user_email)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counters for monitoring and benchmarks"""
+        with self._lock:
+            return {**self._stats, 'size': len(self._entries), 'max_size': self.max_size}
+
+    def _lookup_token(self, user_email: str) -> str:
+        """Resolve the user's current token; evict the entry if it is gone"""
+        try:
+            access_token = self.auth_manager.get_facebook_access_token(user_email)
+        except HTTPException:
+            self.evict(user_email)
+            raise
+        if not access_token:
+            self.evict(user_email)
+            raise HTTPException(
+                status_code=401,
+                detail="Facebook not connected. Please authenticate with Facebook first."
+            )
+        return access_token
+
+    def _evict_idle(self, now: float):
+        """Evict managers unused for longer than idle_timeout (caller holds the lock)"""
+        while self._entries:
+            oldest_email, oldest_entry = next(iter(self._entries.items()))
+            if now - oldest_entry['last_used'] < self.idle_timeout:
+                break
+            self._remove(oldest_email)
+            self._stats['idle_evictions'] += 1
+
+    def _remove(self, user_email: str):
+        """Remove and close a pooled manager (caller holds the lock)"""
+        entry = self._entries.pop(user_email, None)
+        if entry:
+            try:
+                entry['manager'].close()
+            except Exception as e:
+                logger.warning(f"Error closing Meta client for {user_email}: {e}")